@@ -2,24 +2,60 @@
 """Main access point for command-line execution of core functions."""
 
 # Standard library imports:
+import json
+from pathlib import Path
 import sys
+from typing import TYPE_CHECKING, Any
 
-# Local application imports:
-from aoc2021.common import AdventBuilder, AdventCalendar, AdventSolver
+# Local application imports (other tools are imported by the flags using them, so
+# that they don't slow down the start of every command):
+from aoc2021.cache import ParseCache, ResultCache
+from aoc2021.common import BUDGETS_FILE, DAILY_NAMES, DEFAULT_ENGINE, AdventBuilder, \
+    AdventCalendar, AdventSolver, get_engines
+
+# Type-checking imports:
+if TYPE_CHECKING:
+    from aoc2021.history import AdventHistory
+
+# Set constants:
+FLAGS = ("-h", "--help", "-b", "--build", "-s", "--solve", "-r", "--register",
+         "--bench", "--profile", "--import-time", "--generate", "--scale", "--serve",
+         "--client", "--history", "--engines", "--differential")
+SWITCHES = {"-p": "parallel", "--parallel": "parallel", "--save": "save",
+            "--collapsed": "collapsed", "--no-cache": "no_cache", "--refresh": "refresh",
+            "--no-history": "no_history"}
+OUTPUT_FORMATS = ("text", "json", "jsonl")
+OPTIONS = {"-w": ("workers", int), "--workers": ("workers", int),
+           "--runs": ("runs", lambda value: _check_count(value=value, minimum=1)),
+           "--warmup": ("warmup", lambda value: _check_count(value=value, minimum=0)),
+           "--threshold": ("threshold", float), "--baseline": ("baseline_file", Path),
+           "--top": ("top", int), "--output": ("output_path", Path),
+           "--size": ("size", lambda value: _check_count(value=value, minimum=1)),
+           "--seed": ("seed", int),
+           "--sizes": ("sizes", lambda value: [_check_count(value=v, minimum=1)
+                                                for v in value.split(",")]),
+           "--max-exponent": ("max_exponent", float),
+           "--time-limit": ("time_limit", float),
+           "--memory-limit": ("memory_limit", float),
+           "--budgets": ("budgets_file", Path), "--inputs": ("inputs_path", Path),
+           "--format": ("output_format", lambda value: _check_format(value=value)),
+           "--socket": ("socket_path", Path), "--input": ("input_path", Path),
+           "--request": ("action", lambda value: _check_action(value=value)),
+           "--engine": ("engine", str)}
 
 
 def main():
     """Main function managing execution requests of core functions from command line."""
     try:
         _, flag, *args = sys.argv
-        assert flag in [
-            "-h", "--help", "-b", "--build", "-s", "--solve", "-r", "--register"]
-        day = -1 if not args else int(args[0])
+        assert flag in FLAGS
+        day, options = _parse_arguments(args=args)
     except (ValueError, AssertionError):
         print("Value Error: Provided command line arguments are not valid.")
         _print_help()
         sys.exit(2)
     else:
+        workers = _get_workers(options=options)
         if flag in ("-h", "--help"):
             _print_help()
             sys.exit(0)
@@ -29,43 +65,417 @@ def main():
                 builder.build_all_templates()
             else:
                 builder.build_templates(day=day)
+        elif flag in ("-s", "--solve") and "inputs_path" in options:
+            if day == -1:
+                print("Value Error: Solving a folder of inputs requires a day.")
+                _print_help()
+                sys.exit(2)
+            if not _check_engine(day=day, options=options):
+                sys.exit(2)
+            from aoc2021.batch import AdventBatch
+            batch = AdventBatch(workers=options.get("workers", None),
+                                output_format=options.get("output_format", "text"),
+                                engine=options.get("engine", DEFAULT_ENGINE))
+            try:
+                solved = batch.run(day=day, input_path=options["inputs_path"])
+            except ValueError as error:
+                print(f"Value Error: {error}")
+                sys.exit(2)
+            if not solved:
+                sys.exit(1)
         elif flag in ("-s", "--solve"):
-            solver = AdventSolver()
+            if day != -1 and not _check_engine(day=day, options=options):
+                sys.exit(2)
+            solver = _build_solver(options=options)
+            output_format = options.get("output_format", "text")
             if day == -1:
-                solver.print_all_days()
+                solver.print_all_days(workers=workers, output_format=output_format)
             else:
-                solver.print_day(day=day)
+                solver.print_day(day=day, output_format=output_format)
         elif flag in ("-r", "--register"):
-            calendar = AdventCalendar()
+            incremental = not (options.get("no_cache", False) or
+                               options.get("refresh", False))
+            # The calendar always shows the reference engine of each day:
+            solver = _build_solver(options={**options, "engine": DEFAULT_ENGINE})
+            calendar = AdventCalendar(solver=solver, incremental=incremental)
             if day == -1:
-                calendar.register_all_days()
+                calendar.register_all_days(workers=workers)
             else:
                 calendar.register_day(day=day)
+        elif flag == "--bench":
+            if day != -1 and not _check_engine(day=day, options=options):
+                sys.exit(2)
+            from aoc2021.benchmark import BASELINE_FILE, AdventBenchmark
+            engine = options.get("engine", DEFAULT_ENGINE)
+            if engine != DEFAULT_ENGINE:  # Each engine keeps its own baseline.
+                stem = f"{BASELINE_FILE.stem}_{engine}"
+                options.setdefault("baseline_file", BASELINE_FILE.with_stem(stem))
+            benchmark = AdventBenchmark(history=_build_history(options=options),
+                                        **_select(options, "runs", "warmup", "threshold",
+                                                  "baseline_file", "engine"))
+            days = range(1, len(DAILY_NAMES) + 1) if day == -1 else [day]
+            regressions = benchmark.run(days=days, save=options.get("save", False))
+            if regressions:
+                print(f"Timing regressions found for days: {regressions}.")
+                sys.exit(1)
+        elif flag == "--profile":
+            from aoc2021.profiling import AdventProfiler
+            profiler = AdventProfiler(**_select(options, "top", "output_path",
+                                                "collapsed"))
+            days = range(1, len(DAILY_NAMES) + 1) if day == -1 else [day]
+            for profiled_day in days:
+                profiler.print_day(day=profiled_day)
+        elif flag == "--history":
+            from aoc2021.history import AdventHistory
+            history = AdventHistory(**_select(options, "threshold", "engine"))
+            history.print_report(day=None if day == -1 else day)
+        elif flag == "--engines":
+            solver = AdventSolver()
+            days = range(1, len(DAILY_NAMES) + 1) if day == -1 else [day]
+            for compared_day in days:
+                if day != -1 or len(get_engines(day=compared_day)) > 1:
+                    solver.print_engines(day=compared_day,
+                                         **_select(options, "runs", "warmup"))
+        elif flag == "--differential":
+            from aoc2021.differential import AdventDifferential
+            differential = AdventDifferential(**_select(options, "runs", "seed"))
+            days = range(1, len(DAILY_NAMES) + 1) if day == -1 else [day]
+            compared, different = 0, []
+            for compared_day in days:
+                engines = get_engines(day=compared_day)
+                for name in [options["engine"]] if "engine" in options else engines:
+                    if name == DEFAULT_ENGINE or name not in engines:
+                        continue
+                    compared += 1
+                    if not differential.run(
+                            day=compared_day, reference=engines[DEFAULT_ENGINE],
+                            candidate=engines[name], sizes=options.get("sizes", None),
+                            names=(DEFAULT_ENGINE, name)):
+                        different.append(compared_day)
+            if not compared:
+                print("No engine to compare with the reference engine.")
+            elif different:
+                print(f"Engines giving different answers for days: {different}.")
+                sys.exit(1)
+        elif flag == "--import-time":
+            from aoc2021.profiling import AdventImportTimer
+            AdventImportTimer(**_select(options, "top")).print_report(day=day)
+        elif flag == "--generate":
+            if day == -1 or "size" not in options:
+                print("Value Error: Generating an input requires a day and a size.")
+                _print_help()
+                sys.exit(2)
+            from aoc2021.generators import generate_input, write_input
+            kwargs = dict(day=day, size=options["size"], seed=options.get("seed", 0))
+            if "output_path" in options:
+                file_path = write_input(file_path=options["output_path"], **kwargs)
+                print(f"Written {file_path}")
+            else:
+                print("\n".join(generate_input(**kwargs)))
+        elif flag == "--scale":
+            if len(set(options.get("sizes", [0, 1]))) < 2:
+                print("Value Error: Scaling curves require two distinct sizes or more.")
+                _print_help()
+                sys.exit(2)
+            from aoc2021.benchmark import AdventScaling
+            from aoc2021.generators import GENERATED_DAYS
+            scaling = AdventScaling(**_select(options, "runs", "seed", "max_exponent"))
+            days = GENERATED_DAYS if day == -1 else [day]
+            too_steep = []
+            for scaled_day in days:
+                path = options.get("output_path", None)
+                if path is not None and len(days) > 1:
+                    path = path.with_stem(f"{path.stem}_{scaled_day}")
+                if not scaling.run(day=scaled_day, sizes=options.get("sizes", None),
+                                   output_path=path):
+                    too_steep.append(scaled_day)
+            if too_steep:
+                print(f"Scaling exponents above the maximum for days: {too_steep}.")
+                sys.exit(1)
+        elif flag == "--serve":
+            from aoc2021.server import SOCKET_PATH, AdventServer
+            AdventServer(socket_path=options.get("socket_path", SOCKET_PATH),
+                         engine=options.get("engine", DEFAULT_ENGINE)).serve()
+        elif flag == "--client":
+            from aoc2021.server import SOCKET_PATH, AdventClient
+            client = AdventClient(socket_path=options.get("socket_path", SOCKET_PATH))
+            action = options.get("action", "solve")
+            fields = _select(options, "runs", "warmup")
+            if day != -1:
+                fields["day"] = day
+            if "input_path" in options:
+                fields["input"] = str(options["input_path"].resolve())
+            if options.get("output_format", "text") != "text":
+                print(json.dumps(client.request(action=action, **fields)))
+            elif not client.print_request(action=action, **fields):
+                sys.exit(1)
         else:
             print(f"Value Error: Unrecognised '{flag}' flag.")
             _print_help()
             sys.exit(2)
 
 
+def _parse_arguments(args: list[str]) -> tuple[int, dict[str, Any]]:
+    """Split the arguments following the main flag into a day number and options."""
+    day, options, args = -1, {}, iter(args)
+    for arg in args:
+        if arg in SWITCHES:
+            options[SWITCHES[arg]] = True
+        elif arg in OPTIONS:
+            name, converter = OPTIONS[arg]
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"Missing value for the '{arg}' option.")
+            options[name] = converter(value)
+        else:
+            day = int(arg)
+    return day, options
+
+
+def _check_engine(day: int, options: dict[str, Any]) -> bool:
+    """Ensure that the target day offers the requested engine, printing it if not."""
+    engine = options.get("engine", DEFAULT_ENGINE)
+    engines = get_engines(day=day)
+    if not engines or engine in engines:
+        return True
+    print(f"Value Error: Day {day} has no '{engine}' engine (but {list(engines)}).")
+    return False
+
+
+def _check_count(value: str, minimum: int) -> int:
+    """Ensure that a number of runs or an input size is not below its minimum."""
+    if (count := int(value)) < minimum:
+        raise ValueError(f"'{value}' is below the minimum of {minimum}.")
+    return count
+
+
+def _check_format(value: str) -> str:
+    """Ensure that the requested output format is a supported one."""
+    if value not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown '{value}' output format.")
+    return value
+
+
+def _check_action(value: str) -> str:
+    """Ensure that the requested server action is a supported one."""
+    from aoc2021.server import ACTIONS
+    if value not in ACTIONS:
+        raise ValueError(f"Unknown '{value}' request.")
+    return value
+
+
+def _get_workers(options: dict[str, Any]) -> int | None:
+    """Decide how many worker processes to use (None means one per CPU)."""
+    if not options.get("parallel", False):
+        return 1
+    return options.get("workers", None)
+
+
+def _build_solver(options: dict[str, Any]) -> AdventSolver:
+    """Create an AdventSolver using (or not) the caches and time budgets."""
+    no_cache = options.get("no_cache", False)
+    cache, parse_cache = (None, None) if no_cache else (ResultCache(), ParseCache())
+    budgets_file = options.get("budgets_file", BUDGETS_FILE)
+    limits = {}
+    if "budgets_file" in options or budgets_file.exists():
+        try:
+            limits = AdventSolver.read_budgets(file_path=budgets_file)
+        except ValueError as error:  # Like unknown limits, or a malformed JSON file.
+            print(f"Value Error: {error}")
+            sys.exit(2)
+    if "time_limit" in options:
+        limits["time_limit"] = options["time_limit"]
+    if "memory_limit" in options:
+        limits["memory_limit"] = int(options["memory_limit"] * 1024 ** 2)
+    return AdventSolver(cache=cache, refresh=options.get("refresh", False),
+                        parse_cache=parse_cache, history=_build_history(options=options),
+                        engine=options.get("engine", DEFAULT_ENGINE), **limits)
+
+
+def _build_history(options: dict[str, Any]) -> "AdventHistory | None":
+    """Create the database recording the timings of every run, unless disabled."""
+    from aoc2021.history import AdventHistory
+    return None if options.get("no_history", False) else AdventHistory()
+
+
+def _select(options: dict[str, Any], *names: str) -> dict[str, Any]:
+    """Extract the provided options (if present) as keyword arguments."""
+    return {name: options[name] for name in names if name in options}
+
+
 def _print_help():
     """Print usage information about the main function and its parameters."""
     usage = f"""\nUsage:
-        -m aoc2021 [OPTION] [day]
+        -m aoc2021 [OPTION] [day] [EXTRA OPTIONS]
     Arguments:
         -h, --help:
             Display this usage message and exit.
         -b, --build:
             Generate template files for solving and testing the provided day.
         -s, --solve:
-            Compute and print the solutions to the puzzle of the provided day.
+            Compute and print the solutions to the puzzle of the provided day,
+            and the time spent parsing its input and solving each part.
         - r, --register:
             Compute the solutions to the puzzle of the provided day and write 
-            them to the table calendar in the README.md file.
+            them (with their times by phase) to the table calendar in the
+            README.md file. Days registered before are only solved again if
+            their input or source files changed since then (as tracked in
+            the calendar_fingerprints.json file next to README.md).
         day:
             Puzzle number to build/solve. If -1 or not provided and building, 
             all not yet built puzzles will be built. If -1 or not provided 
             and solving or registering, all built puzzles will be solved or 
             registered.
+        --bench:
+            Time the solution of the provided day (or of all days) several
+            times, print min/median/p95/stddev statistics (and the median
+            time of each phase) and compare them with the stored baseline.
+            Exit with code 1 if any day's median is slower than the
+            baseline beyond the allowed threshold.
+        --profile:
+            Run the solution of the provided day (or of all days) under
+            cProfile, writing a .pstats file and a text summary of the top
+            functions by cumulative and by total time for each day.
+        --import-time:
+            Import the command line interface (and the solution of the
+            provided day, if any) in a fresh interpreter, and print the
+            modules that are slowest to import.
+        --generate:
+            Print (or write to --output) a synthetic, valid input of the
+            requested --size for the provided day, for stress tests.
+        --scale:
+            Solve generated inputs of increasing size for the provided day
+            (or for all days), print the time and peak memory for each size
+            and the complexity model that best fits the times. Exit with
+            code 1 if the empirical exponent exceeds --max-exponent.
+        --serve:
+            Import all solutions once and keep answering solve and bench
+            requests sent over a Unix socket (see --socket), printing the
+            latency of each one, until a stop request is received.
+        --client:
+            Send a --request for the provided day to a --serve process,
+            and print its answer, its latency in the server and the round
+            trip time. Exit with code 1 if the request fails.
+        --history:
+            Print the timings recorded for the provided day (or for every
+            day with records) by earlier solve, register and bench runs:
+            their trend, the best and worst runs, the median time of each
+            phase, and the commits after which the time changed by more
+            than the --threshold (0.25 by default).
+        --engines:
+            Time every engine (implementation) of the provided day side by
+            side, or of every day offering several engines, printing their
+            median times, speed-ups against the reference engine and
+            whether their answers match.
+        --differential:
+            Solve generated inputs of several --sizes with the reference
+            engine and with the --engine (or every other engine) of the
+            provided day (or of every day), printing the speed-up on each
+            input. Exit with code 1 if any answers differ.
+    Extra options:
+        -p, --parallel:
+            When solving or registering all days, send each day to a pool of
+            worker processes instead of solving them one after another.
+        -w, --workers [number]:
+            Number of worker processes used by --parallel. Defaults to the
+            number of CPUs in the machine.
+        --runs [number]:
+            Number of timed runs per day used by --bench. Defaults to 10.
+            Number of timed runs per size used by --scale. Defaults to 1.
+            Number of timed runs per engine used by --engines (defaults to
+            10) and per input used by --differential (defaults to 1).
+        --warmup [number]:
+            Number of untimed runs per day before benchmarking. Defaults to 1.
+        --threshold [fraction]:
+            Allowed median slowdown against the baseline before flagging a
+            regression (e.g. 0.1 for 10 %). Defaults to 0.1.
+            Smallest change between commits reported by --history as a
+            step change. Defaults to 0.25.
+        --baseline [path]:
+            JSON file storing the benchmark baseline. Defaults to the
+            benchmark_baseline.json file next to the README.md file.
+        --save:
+            Store the new benchmark results as the baseline (done anyway
+            if no baseline file exists yet).
+        --top [number]:
+            Number of functions listed in --profile summaries, or modules
+            listed by --import-time. Defaults to 20.
+        --output [path]:
+            Folder for --profile reports. Defaults to a 'profiles' folder
+            next to the README.md file. File for --generate inputs. CSV or
+            JSON file (by extension) for --scale curves.
+        --size [number]:
+            Size of the input made by --generate (like the number of lines
+            or the side of a grid, depending on the day).
+        --seed [number]:
+            Seed of the random inputs made by --generate, --scale and
+            --differential. Defaults to 0.
+        --sizes [number,number,...]:
+            Input sizes swept by --scale and --differential. Defaults to a
+            range of sizes suited to each day.
+        --max-exponent [number]:
+            Largest empirical scaling exponent (the slope of the time curve
+            in log-log scale) allowed by --scale, like 1.2 for near-linear.
+        --format [text|json|jsonl]:
+            Output of --solve: text (the default), a JSON document or one
+            JSON line per day (or per file of --inputs), with answers,
+            durations in nanoseconds (in total and by phase), peak memory
+            in bytes, host details and the git revision of the sources.
+        --inputs [path]:
+            Folder of input files to solve with --solve for the provided
+            day, instead of its puzzle input. Files are sent to a pool of
+            --workers processes (one per CPU by default), printing one
+            result per file and the inputs solved per second. Exit with
+            code 1 if any input fails.
+        --socket [path]:
+            Unix socket used by --serve and --client. Defaults to an
+            aoc2021.sock file in the temporary folder.
+        --request [solve|bench|ping|stop]:
+            Request sent by --client to the server (solve by default). The
+            bench request takes --runs and --warmup.
+        --input [path]:
+            Input file solved by a --client solve request for the provided
+            day, instead of its puzzle input.
+        --time-limit [seconds]:
+            When solving or registering, solve each day in a watched
+            process, stopping it (and reporting a timeout) if it takes
+            longer than this. Other days are solved anyway.
+        --memory-limit [MiB]:
+            When solving or registering, solve each day in a watched
+            process, stopping it (and reporting it out of memory) if its
+            resident memory peak, the memory shown for solved days, grows
+            beyond this size. Other days are solved anyway.
+        --budgets [path]:
+            JSON file with the default time and memory limits, and those
+            of specific days, like {{"time_limit": 60, "days": {{"12":
+            {{"time_limit": 5, "memory_limit": 512}}}}}}. Defaults to the
+            budgets.json file next to the README.md file, if any. The
+            --time-limit and --memory-limit options override its defaults.
+        --engine [name]:
+            Engine (implementation) used by --solve (also with --inputs),
+            --bench and --serve for the days offering it, like 'numpy' or
+            'jit', instead of the default 'reference' one. Benchmarks of
+            other engines keep their own baseline file. Also filters
+            --history, and picks the engine compared by --differential.
+            Registering always uses the reference engine.
+        --collapsed:
+            Also write a collapsed-stack file per day for --profile, ready
+            to be rendered as a flame graph.
+        --no-cache:
+            When solving or registering, ignore the cache of results of
+            days whose input and source files did not change since the
+            last time they were solved, and compute everything again.
+            Also parse every input from its text, instead of reusing the
+            arrays parsed from the same input lines in earlier runs, and
+            register again the days whose files did not change either.
+        --refresh:
+            When solving or registering, compute everything again (even
+            days whose files did not change) but update the cache with the
+            new results.
+        --no-history:
+            Do not record the timings of this solve, register or bench run
+            in the history database (a history.sqlite3 file in the .cache
+            folder next to the README.md file).
     """.replace("\n    ", "\n")
     print(usage)
 
@@ -0,0 +1,122 @@
+# coding=utf-8
+"""Tools for solving many different puzzle inputs of the same day."""
+
+# Standard library imports:
+from functools import partial
+import json
+import multiprocessing
+import os
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Iterable, Iterator
+
+# Local application imports:
+from aoc2021.common import DAILY_NAMES, DEFAULT_ENGINE, AdventSolver, get_engine, \
+    get_engines, get_git_revision, get_host_info, import_solution, pop_phase_timings, \
+    timed_phase, use_engine
+
+
+class AdventBatch:
+    """Manage the solving of a folder of puzzle inputs for the same day."""
+    def __init__(self, workers: int | None = None, output_format: str = "text",
+                 engine: str = DEFAULT_ENGINE):
+        self.workers = workers or os.cpu_count() or 1
+        self.output_format = output_format
+        self.engine = engine  # Engine solving the inputs, where the day offers it.
+
+    def solve_inputs(self, day: int, file_paths: Iterable[Path]) -> Iterator[dict]:
+        """Solve each input file in a pool of warm workers, yielding results in order.
+
+        Each result has the input file, the engine used, a "solved" or "error" status,
+        the answers, and the durations (in nanoseconds) of the whole solving and of
+        each of its phases.
+        """
+        engine = self.engine if self.engine in get_engines(day=day) else DEFAULT_ENGINE
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=self.workers) as pool:
+            yield from pool.imap(partial(_solve_input_file, day, engine), file_paths)
+
+    def run(self, day: int, input_path: Path) -> bool:
+        """Solve and print each input file in a folder, and the throughput achieved.
+
+        Return False if the day is not solved yet, or if any input failed.
+        """
+        input_path = Path(input_path)
+        if not input_path.is_dir():
+            raise ValueError(f"The inputs path {input_path} is not a folder.")
+        module = import_solution(day=day)
+        if module is None or not hasattr(module, "solve_lines"):
+            print(DAILY_NAMES[day - 1])
+            print("    The puzzle remains unsolved!")
+            return False
+        file_paths = sorted(path for path in input_path.iterdir() if path.is_file())
+        run_info = dict(host=get_host_info(), git_revision=get_git_revision())
+        start = perf_counter_ns()
+        results = []
+        if self.output_format == "text":
+            print(DAILY_NAMES[day - 1])
+        for result in self.solve_inputs(day=day, file_paths=file_paths):
+            results.append(result)
+            if self.output_format == "text":
+                self._print_result(result=result)
+            elif self.output_format == "jsonl":
+                print(json.dumps(dict(day=day, **result)), flush=True)
+        summary = self.summarise(results=results, wall_ns=perf_counter_ns() - start)
+        if self.output_format == "text":
+            self._print_summary(summary=summary)
+        elif self.output_format == "jsonl":
+            print(json.dumps(dict(day=day, summary=summary, **run_info)))
+        else:
+            print(json.dumps(dict(day=day, name=DAILY_NAMES[day - 1], **run_info,
+                                  inputs=results, summary=summary), indent=4))
+        return bool(results) and not summary["errors"]
+
+    def summarise(self, results: list[dict], wall_ns: int) -> dict:
+        """Count the solved and failed inputs, and the inputs solved per second."""
+        errors = sum(result["status"] != "solved" for result in results)
+        return dict(inputs=len(results), errors=errors, workers=self.workers,
+                    wall_time_ns=wall_ns,
+                    solve_time_ns=sum(result["time_ns"] for result in results),
+                    throughput=len(results) / (wall_ns / 1e9) if wall_ns else 0.0)
+
+    @staticmethod
+    def _print_result(result: dict):
+        """Print the answers (or error) and solving time of an input file."""
+        name = Path(result["input"]).name
+        timing = AdventSolver.format_timing(value=result["time_ns"] / 1e9)
+        if result["status"] == "solved":
+            print(f"    {name}: {result['solution_1']} | {result['solution_2']} "
+                  f"({timing})")
+        else:
+            print(f"    {name}: error after {timing} ({result['error']})")
+
+    @staticmethod
+    def _print_summary(summary: dict):
+        """Print the number of inputs solved, and the throughput achieved."""
+        wall_time = AdventSolver.format_timing(value=summary["wall_time_ns"] / 1e9)
+        errors = f", {summary['errors']} failed" if summary["errors"] else ""
+        print(f"    Solved {summary['inputs']} inputs in {wall_time} with "
+              f"{summary['workers']} workers: {summary['throughput']:.2f} inputs/s"
+              f"{errors}.")
+
+
+def _solve_input_file(day: int, engine: str, file_path: Path) -> dict:
+    """Solve another input file of the target day, timing it and each of its phases."""
+    pop_phase_timings()  # Discard phases left by earlier inputs.
+    result = dict(input=str(file_path), engine=engine, status="solved",
+                  solution_1=None, solution_2=None)
+    start = perf_counter_ns()
+    try:
+        with timed_phase("parse"):
+            with open(file_path, mode="r", encoding="utf-8") as file:
+                lines = [line.removesuffix("\n") for line in file]
+        with use_engine(day=day, name=engine):
+            solutions = get_engine(day=day)(lines=lines)
+    except Exception as error:
+        result.update(status="error", error=repr(error))
+    else:
+        result.update(zip(("solution_1", "solution_2"),
+                          [value.item() if hasattr(value, "item") else value
+                           for value in solutions]))  # No numpy scalars.
+    result.update(time_ns=perf_counter_ns() - start, phases_ns=pop_phase_timings())
+    return result
@@ -0,0 +1,263 @@
+# coding=utf-8
+"""Tools for benchmarking the execution time of the daily puzzle solutions."""
+
+# Standard library imports:
+import csv
+import json
+import math
+import multiprocessing
+from pathlib import Path
+from statistics import linear_regression, median, pstdev, quantiles
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterable
+
+# Local application imports:
+from aoc2021.common import BASE_PATH, DAILY_NAMES, DEFAULT_ENGINE, AdventSolver, \
+    get_engines, import_solution, pop_phase_timings, use_engine, use_input_file
+from aoc2021.generators import describe_size, get_default_sizes, write_input
+
+# Type-checking imports:
+if TYPE_CHECKING:
+    from aoc2021.history import AdventHistory
+
+# Set constants:
+BASELINE_FILE = BASE_PATH.parents[1] / "benchmark_baseline.json"
+COMPLEXITY_MODELS = {
+    "O(1)": lambda n: 1.0, "O(log n)": math.log, "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n), "O(n²)": lambda n: n ** 2,
+    "O(n³)": lambda n: n ** 3}
+
+
+class AdventBenchmark:
+    """Manage repeated, statistically summarised timing of puzzle solving tasks."""
+    def __init__(self, runs: int = 10, warmup: int = 1, threshold: float = 0.1,
+                 baseline_file: Path = BASELINE_FILE, history: "AdventHistory" = None,
+                 engine: str = DEFAULT_ENGINE):
+        if runs <= 0 or warmup < 0 or threshold < 0:
+            raise ValueError("Invalid benchmark setup!")
+        self.runs = runs
+        self.warmup = warmup
+        self.threshold = threshold
+        self.baseline_file = Path(baseline_file)
+        self.engine = engine  # Engine timed, skipping the days not offering it.
+        self.history = history  # Database recording the timings of every run, if used.
+
+    def measure_day(self, day: int) -> dict | None:
+        """Time the target day's solution several times, or None if not built yet.
+
+        Besides the statistics of the total times, the median time of each phase marked
+        by the solution (like "parse", "part1" or "part2") is provided under "phases".
+        """
+        module = import_solution(day=day)
+        if module is None or self.engine not in get_engines(day=day):
+            return None
+        with use_engine(day=day, name=self.engine):
+            return self._measure(module=module)
+
+    def _measure(self, module: ModuleType) -> dict:
+        """Time a solution several times, after some untimed warm-up runs."""
+        for _ in range(self.warmup):
+            module.compute_solution()
+        samples, phase_samples = [], {}
+        for _ in range(self.runs):
+            pop_phase_timings()
+            start = perf_counter_ns()
+            module.compute_solution()
+            samples.append(perf_counter_ns() - start)
+            for name, elapsed in pop_phase_timings().items():
+                phase_samples.setdefault(name, []).append(elapsed)
+        phases = {name: round(median(values)) for name, values in phase_samples.items()}
+        return {**self.summarise(samples=samples), "phases": phases}
+
+    @staticmethod
+    def summarise(samples: list[int]) -> dict[str, int]:
+        """Compute the min, median, 95th percentile and std deviation of ns samples."""
+        p95 = samples[0] if len(samples) == 1 else \
+            quantiles(samples, n=20, method="inclusive")[-1]
+        return dict(
+            runs=len(samples), min_ns=min(samples), median_ns=round(median(samples)),
+            p95_ns=round(p95), stddev_ns=round(pstdev(samples)))
+
+    def run(self, days: list[int], save: bool = False) -> list[int]:
+        """Benchmark and print the target days, returning the days that regressed."""
+        baseline = self.load_baseline()
+        results, regressions = {}, []
+        for day in days:
+            stats = self.measure_day(day=day)
+            if stats is None:  # Unsolved, or not offering the engine (then skipped).
+                if not get_engines(day=day):
+                    print(DAILY_NAMES[day - 1])
+                    print("    The puzzle remains unsolved!")
+                continue
+            results[day] = stats
+            if self.history is not None:
+                self.history.record(day=day, kind="bench", time_ns=stats["median_ns"],
+                                    phases_ns=stats["phases"], engine=self.engine)
+            reference = baseline.get(day, None)
+            self.print_day(day=day, stats=stats, reference=reference)
+            if reference is not None and self.is_regression(stats, reference):
+                regressions.append(day)
+        if results and (save or not self.baseline_file.exists()):
+            self.save_baseline(results={**baseline, **results})
+            print(f"Baseline written to {self.baseline_file}.")
+        return regressions
+
+    def is_regression(self, stats: dict[str, int], reference: dict[str, int]) -> bool:
+        """Check if the median time is slower than the reference beyond the threshold."""
+        return stats["median_ns"] > reference["median_ns"] * (1 + self.threshold)
+
+    def print_day(self, day: int, stats: dict, reference: dict = None):
+        """Print the timing statistics of the target day, compared with a reference."""
+        names = "min", "median", "p95", "stddev"
+        values = [self._format_ns(value=stats[f"{name}_ns"]) for name in names]
+        print(DAILY_NAMES[day - 1])
+        print("    " + " | ".join(f"{n} {v}" for n, v in zip(names, values)) +
+              f" ({stats['runs']} runs)")
+        if phases := stats.get("phases", None):
+            print("    Median by phase: " + " | ".join(
+                self._format_phase(name=name, value=value, reference=reference)
+                for name, value in phases.items()))
+        if reference is None:
+            return
+        delta = stats["median_ns"] / reference["median_ns"] - 1
+        verdict = "REGRESSION" if self.is_regression(stats, reference) else "OK"
+        print(f"    {verdict}: median is {delta:+.1%} against the baseline "
+              f"({self._format_ns(value=reference['median_ns'])}).")
+
+    def _format_phase(self, name: str, value: int, reference: dict = None) -> str:
+        """Format the median time of a phase, with its change against a reference."""
+        text = f"{name} {self._format_ns(value=value)}"
+        reference_value = (reference or {}).get("phases", {}).get(name, None)
+        if reference_value:
+            text += f" ({value / reference_value - 1:+.1%})"
+        return text
+
+    @staticmethod
+    def _format_ns(value: int) -> str:
+        """Format a time value in nanoseconds into a time string with sensitive units."""
+        return AdventSolver.format_timing(value=value / 1e9)
+
+    def load_baseline(self) -> dict[int, dict]:
+        """Read the stored timing statistics for each day, if any."""
+        if not self.baseline_file.exists():
+            return {}
+        with open(self.baseline_file, mode="r", encoding="utf-8") as file:
+            data = json.load(file)
+        return {int(day): stats for day, stats in data.items()}
+
+    def save_baseline(self, results: dict[int, dict]):
+        """Write the provided timing statistics for each day as the new baseline."""
+        data = {str(day): results[day] for day in sorted(results)}
+        with open(self.baseline_file, mode="w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.write("\n")
+
+
+class AdventScaling:
+    """Manage the measurement of how solving time and memory grow with input size."""
+    def __init__(self, runs: int = 1, seed: int = 0, max_exponent: float = None):
+        if runs <= 0:
+            raise ValueError("Invalid scaling setup!")
+        self.runs = runs
+        self.seed = seed
+        self.max_exponent = max_exponent
+
+    def measure_day(self, day: int, sizes: Iterable[int] = None) -> list[dict]:
+        """Time and measure the target day's solution on generated inputs of each size.
+
+        Each measured point contains the requested size, the input size in bytes, the
+        fastest time in nanoseconds and the peak memory in bytes (None if unknown).
+        """
+        sizes = get_default_sizes(day=day) if sizes is None else sorted(sizes)
+        with TemporaryDirectory() as temp_dir:
+            file_paths = [write_input(day=day, size=size, seed=self.seed,
+                                      file_path=Path(temp_dir) / f"size_{size}.txt")
+                          for size in sizes]
+            # A fresh process per size keeps earlier memory peaks out of its reading:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(processes=1, maxtasksperchild=1) as pool:
+                points = pool.starmap(
+                    _measure_input, [(day, path, self.runs) for path in file_paths])
+        return [dict(size=size, **point) for size, point in zip(sizes, points)]
+
+    def run(self, day: int, sizes: Iterable[int] = None, output_path: Path = None) \
+            -> bool:
+        """Measure, fit and print the scaling of the target day, checking its exponent.
+
+        Return False if the empirical exponent exceeds the allowed maximum.
+        """
+        points = self.measure_day(day=day, sizes=sizes)
+        fit = fit_complexity(points=points)
+        self.print_day(day=day, points=points, fit=fit)
+        if output_path is not None:
+            self.export(points=points, fit=fit, file_path=output_path)
+            print(f"    Curve written to {output_path}.")
+        return self.max_exponent is None or fit["exponent"] <= self.max_exponent
+
+    @staticmethod
+    def print_day(day: int, points: list[dict], fit: dict):
+        """Print the measured curve of the target day and its best complexity fit."""
+        print(DAILY_NAMES[day - 1])
+        print(f"    Sweeping the {describe_size(day=day)}:")
+        print(f"    {'size':>8} | {'bytes':>11} | {'time':>10} | {'memory':>10}")
+        for point in points:
+            memory = point["memory_bytes"]
+            memory = "n/a" if memory is None else AdventSolver.format_memory(value=memory)
+            time = AdventBenchmark._format_ns(value=point["time_ns"])
+            print(f"    {point['size']:>8} | {point['bytes']:>11,} | {time:>10} | "
+                  f"{memory:>10}")
+        print(f"    Best fit: {fit['model']}, with n as the {describe_size(day=day)} "
+              f"(empirical exponent {fit['exponent']:.2f}).")
+
+    @staticmethod
+    def export(points: list[dict], fit: dict, file_path: Path):
+        """Write the measured curve to a CSV file, or (with its fit) to a JSON file."""
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, mode="w", encoding="utf-8", newline="") as file:
+            if file_path.suffix == ".csv":
+                writer = csv.DictWriter(file, fieldnames=list(points[0]))
+                writer.writeheader()
+                writer.writerows(points)
+            else:
+                json.dump(dict(points=points, fit=fit), file, indent=4)
+                file.write("\n")
+
+
+def fit_complexity(points: list[dict]) -> dict:
+    """Find the complexity model that best explains the measured times by input size.
+
+    Each model is scaled to minimise relative errors (so small sizes weigh as much as
+    big ones), and the log-log slope of the curve is provided as empirical exponent.
+    """
+    ns, times = [p["size"] for p in points], [max(p["time_ns"], 1) for p in points]
+    if len(set(ns)) < 2:
+        raise ValueError("Fitting a complexity requires at least two distinct sizes.")
+    errors = {}
+    for model, function in COMPLEXITY_MODELS.items():
+        ratios = [function(n) / t for n, t in zip(ns, times)]
+        if not any(ratios):  # Like O(log n) when every size is 1: it can't be scaled.
+            continue
+        scale = sum(ratios) / sum(r ** 2 for r in ratios)
+        errors[model] = math.sqrt(sum((scale * r - 1) ** 2 for r in ratios) / len(ns))
+    exponent = linear_regression(list(map(math.log, ns)),
+                                 list(map(math.log, times))).slope
+    return dict(model=min(errors, key=errors.get), exponent=exponent,
+                errors=errors)
+
+
+def _measure_input(day: int, file_path: Path, runs: int) -> dict[str, int | None]:
+    """Time the target day's solution on another input file, and its peak memory."""
+    with use_input_file(day=day, file_path=file_path):
+        module = import_solution(day=day)
+        measured = AdventSolver.reset_peak_rss()
+        samples = []
+        for _ in range(runs):
+            start = perf_counter_ns()
+            module.compute_solution()
+            samples.append(perf_counter_ns() - start)
+    memory = AdventSolver.get_peak_rss() if measured else None
+    return dict(bytes=Path(file_path).stat().st_size, time_ns=min(samples),
+                memory_bytes=memory)
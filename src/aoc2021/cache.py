@@ -0,0 +1,98 @@
+# coding=utf-8
+"""On-disk, content-addressed storage of previously computed results and arrays."""
+
+# Standard library imports:
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Set constants:
+CACHE_PATH = Path(__file__).parents[2] / ".cache" / "results"
+PARSED_PATH = Path(__file__).parents[2] / ".cache" / "parsed"
+
+
+class ResultCache:
+    """Store JSON-serialisable values by key, evicting least recently used entries."""
+    suffix = ".json"
+
+    def __init__(self, path: Path = CACHE_PATH, max_size: int = 1024 ** 2):
+        self.path = Path(path)
+        self.max_size = max_size
+
+    def get(self, key: str) -> Any | None:
+        """Provide the value stored under the provided key, or None if missing."""
+        file_path = self.path / f"{key}{self.suffix}"
+        try:
+            with open(file_path, mode="r", encoding="utf-8") as file:
+                value = json.load(file)
+            os.utime(file_path)  # Mark the entry as recently used.
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return value
+
+    def put(self, key: str, value: Any):
+        """Store a value under the provided key, and evict old entries if too big."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        file_path = self.path / f"{key}{self.suffix}"
+        temp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, mode="w", encoding="utf-8") as file:
+            json.dump(value, file, default=_to_builtin)
+        os.replace(temp_path, file_path)  # Atomic, even with concurrent writers.
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the total size fits the limit."""
+        entries = []
+        for file_path in self.path.glob(f"*{self.suffix}"):
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:  # Removed by a concurrent writer.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file_path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            file_path.unlink(missing_ok=True)
+            total_size -= size
+
+
+class ParseCache(ResultCache):
+    """Store parsed numpy arrays by key as .npy files, memory-mapped when provided.
+
+    Provided arrays are copy-on-write maps: changing them never changes the files.
+    """
+    suffix = ".npy"
+
+    def __init__(self, path: Path = PARSED_PATH, max_size: int = 256 * 1024 ** 2):
+        super().__init__(path=path, max_size=max_size)
+
+    def get(self, key: str) -> Any | None:
+        """Provide the array stored under the provided key, or None if missing."""
+        import numpy  # Only needed by (slow to import) solutions using numpy.
+        file_path = self.path / f"{key}{self.suffix}"
+        try:
+            array = numpy.load(file_path, mmap_mode="c", allow_pickle=False)
+            os.utime(file_path)  # Mark the entry as recently used.
+        except (FileNotFoundError, ValueError):  # ValueError: empty or damaged files.
+            return None
+        return array
+
+    def put(self, key: str, value: Any):
+        """Store an array under the provided key, and evict old entries if too big."""
+        import numpy
+        self.path.mkdir(parents=True, exist_ok=True)
+        file_path = self.path / f"{key}{self.suffix}"
+        temp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, mode="wb") as file:
+            numpy.save(file, value, allow_pickle=False)
+        os.replace(temp_path, file_path)
+        self._evict()
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert non-JSON-serialisable values (like numpy scalars) into built-in ones."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} can't be cached.")
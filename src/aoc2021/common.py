@@ -2,13 +2,37 @@
 """Shared tools used across different daily puzzles."""
 
 # Standard library imports:
+from contextlib import contextmanager
+from functools import wraps
+import hashlib
 from importlib import import_module
+import inspect
+import json
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+import os
 from pathlib import Path
+import platform
+import re
 from string import Template
-from time import time
+import subprocess
+from time import monotonic, perf_counter_ns
+import traceback
+from types import CodeType, ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
-# Third party imports:
-import pandas
+# Local application imports:
+from aoc2021.cache import ParseCache, ResultCache
+
+# Type-checking imports (the history module builds on this one):
+if TYPE_CHECKING:
+    from aoc2021.history import AdventHistory
+
+# Platform-dependent imports:
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
 
 # Set constants:
 YEAR = 2021
@@ -24,14 +48,200 @@ DAILY_NAMES = tuple([
     "Day 17: Trick Shot", "Day 18: Snailfish", "Day 19: Beacon Scanner",
     "Day 20: Trench Map", "Day 21: Dirac Dice", "Day 22: Reactor Reboot",
     "Day 23: Amphipod", "Day 24: Arithmetic Logic Unit", "Day 25: Sea Cucumber"])
+PHASES = ("parse", "part1", "part2")
+RESULTS_VERSION = 2  # Increase when the layout of cached solving results changes.
+BUDGETS_FILE = BASE_PATH.parents[1] / "budgets.json"
+MEMORY_POLL_INTERVAL = 0.01  # Seconds between checks of the memory of watched days.
+DEFAULT_ENGINE = "reference"
+_input_overrides: dict[int, Path] = {}  # Alternative input files, by day.
+_engine_choices: dict[int, str] = {}  # Engines used instead of the reference, by day.
+_phase_timings: dict[str, int] = {}  # Nanoseconds spent in each solution phase.
+_parse_caches: list[ParseCache] = []  # Caches of parsed arrays in use, latest last.
+# Solutions, durations in ns (total and by phase) and peak memory in bytes of a day:
+DayResults = tuple[int | None, int | None, int | None, int | None, dict[str, int]]
+Engine = Callable[[list[str]], tuple]  # Answers of both parts from input lines.
 
 
-def read_puzzle_input(day: int) -> list[str]:
+def read_puzzle_input(day: int, encoding: str = "utf-8") -> list[str]:
     """Read, process and return each line in the input file for the target day."""
-    file_path = BASE_PATH / f"day_{day}" / "puzzle_input.txt"
-    with open(file_path, mode="r") as file:
-        lines = [line.removesuffix("\n") for line in file]
-    return lines
+    return list(iter_puzzle_input(day=day, encoding=encoding))
+
+
+def iter_puzzle_input(day: int, encoding: str = "utf-8") -> Iterator[str]:
+    """Lazily read, process and yield each line in the input file for the target day."""
+    with open(get_input_path(day=day), mode="r", encoding=encoding) as file:
+        for line in file:
+            yield line.removesuffix("\n")
+
+
+def get_input_path(day: int) -> Path:
+    """Provide the path to the puzzle input file of the target day."""
+    if day in _input_overrides:
+        return _input_overrides[day]
+    return BASE_PATH / f"day_{day}" / "puzzle_input.txt"
+
+
+@contextmanager
+def use_input_file(day: int, file_path: Path) -> Iterator[Path]:
+    """Make the target day's solution read its puzzle input from another file."""
+    previous = _input_overrides.get(day, None)
+    _input_overrides[day] = Path(file_path)
+    try:
+        yield _input_overrides[day]
+    finally:
+        if previous is None:
+            del _input_overrides[day]
+        else:
+            _input_overrides[day] = previous
+
+
+def get_engines(day: int) -> dict[str, Engine]:
+    """Provide the implementations ("engines") of the target day's solution, by name.
+
+    Solutions may offer several engines (like "reference", "numpy" or "jit") in an
+    ENGINES dictionary, leaving out those whose optional dependencies are missing.
+    Otherwise, their solve_lines function is their only (reference) engine.
+    """
+    module = import_solution(day=day)
+    if module is None:
+        return {}
+    return getattr(module, "ENGINES", {DEFAULT_ENGINE: module.solve_lines})
+
+
+def get_engine(day: int) -> Engine:
+    """Provide the engine chosen for the target day's solution (the reference one)."""
+    return get_engines(day=day)[_engine_choices.get(day, DEFAULT_ENGINE)]
+
+
+@contextmanager
+def use_engine(day: int, name: str) -> Iterator[str]:
+    """Make the target day's solution use another of its engines."""
+    if name not in get_engines(day=day):
+        raise ValueError(f"Day {day} has no '{name}' engine.")
+    previous = _engine_choices.get(day, None)
+    _engine_choices[day] = name
+    try:
+        yield name
+    finally:
+        if previous is None:
+            del _engine_choices[day]
+        else:
+            _engine_choices[day] = previous
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Add the time spent in a solution phase (like "parse" or "part1") to its total."""
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter_ns() - start
+        _phase_timings[name] = _phase_timings.get(name, 0) + elapsed
+
+
+def pop_phase_timings() -> dict[str, int]:
+    """Provide the nanoseconds spent in each phase since the last call, in phase order."""
+    order = {name: n for n, name in enumerate(PHASES)}
+    timings = {name: _phase_timings[name]
+               for name in sorted(_phase_timings, key=lambda k: order.get(k, len(order)))}
+    _phase_timings.clear()
+    return timings
+
+
+@contextmanager
+def use_parse_cache(cache: ParseCache | None) -> Iterator[ParseCache | None]:
+    """Make parsers decorated with cached_parse reuse the arrays kept in a cache."""
+    if cache is None:
+        yield None
+        return
+    _parse_caches.append(cache)
+    try:
+        yield cache
+    finally:
+        _parse_caches.pop()
+
+
+def cached_parse(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a function parsing input lines into an array, to reuse its arrays.
+
+    While a parse cache is in use, arrays are stored under a hash of the arguments
+    (like the input lines) and of the function code, and memory-mapped when reused.
+    """
+    signature = inspect.signature(function)
+    source_key = f"{function.__module__}.{function.__qualname__}:" \
+                 f"{_describe_code(code=function.__code__)}"
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _parse_caches:
+            return function(*args, **kwargs)
+        digest = hashlib.sha256(source_key.encode("utf-8"))
+        for name, value in signature.bind(*args, **kwargs).arguments.items():
+            if name in ("self", "cls"):
+                continue
+            if isinstance(value, (list, tuple)):  # Lines, one per row.
+                value = "\n".join(map(str, value)) + f"\n{len(value)} rows"
+            digest.update(f"\0{name}={value}".encode("utf-8"))
+        key = digest.hexdigest()
+        array = _parse_caches[-1].get(key=key)
+        if array is None:
+            array = function(*args, **kwargs)
+            _parse_caches[-1].put(key=key, value=array)
+        return array
+    return wrapper
+
+
+def _describe_code(code: CodeType) -> str:
+    """Describe the bytecode and constants of a function, the same in every process."""
+    # Nested code objects (like comprehensions) have reprs with memory addresses:
+    constants = [_describe_code(code=value) if isinstance(value, CodeType)
+                 else repr(value) for value in code.co_consts]
+    return f"{code.co_code.hex()}({','.join(constants)})"
+
+
+def get_host_info() -> dict[str, str | int | None]:
+    """Describe the machine and Python interpreter running the solutions."""
+    return dict(node=platform.node(), platform=platform.platform(),
+                machine=platform.machine(), processor=platform.processor() or None,
+                cpus=os.cpu_count(), python=platform.python_version(),
+                implementation=platform.python_implementation())
+
+
+def get_git_revision() -> str | None:
+    """Provide the current git commit of the sources (flagged if dirty), if known."""
+    try:
+        revision = _run_git("rev-parse", "HEAD")
+        dirty = _run_git("status", "--porcelain", "--untracked-files=no")
+    except (OSError, subprocess.CalledProcessError):  # No git, or not a checkout.
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def _run_git(*args: str) -> str:
+    """Run a git command on the sources' repository, providing its output."""
+    return subprocess.run(["git", *args], cwd=BASE_PATH, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def import_solution(day: int) -> ModuleType | None:
+    """Import the puzzle-solving script of the target day, or None if not built yet."""
+    try:
+        return import_module(f"aoc{YEAR}.day_{day}.solution")
+    except ModuleNotFoundError:
+        return None
+
+
+def fingerprint_day(day: int, engine: str = DEFAULT_ENGINE) -> str:
+    """Hash the input file and the source files of the target day into a hex key."""
+    digest = hashlib.sha256(f"day_{day}:v{RESULTS_VERSION}".encode())
+    if engine != DEFAULT_ENGINE:
+        digest.update(f"engine:{engine}".encode())
+    for file_name in ("puzzle_input.txt", "solution.py", "tools.py"):
+        file_path = BASE_PATH / f"day_{day}" / file_name
+        digest.update(file_name.encode())
+        digest.update(file_path.read_bytes() if file_path.exists() else b"\0missing")
+    return digest.hexdigest()
 
 
 class AdventBuilder:
@@ -70,13 +280,25 @@ class AdventBuilder:
             f'"""Compute the solution of the {DAILY_NAMES[day - 1]} puzzle."""\n',
             '\n',
             '# Local application imports:\n',
-            f'from aoc{YEAR}.common import read_puzzle_input\n',
+            f'from aoc{YEAR}.common import get_engine, read_puzzle_input, '
+            'timed_phase\n',
             f'from aoc{YEAR}.day_{day}.tools import ...\n',
             '\n', '\n',
             'def compute_solution() -> tuple[int, int]:\n',
             '    """Compute the answers for the two parts of this day."""\n',
-            f'    lines = read_puzzle_input(day={day})\n',
-            '    ...\n',
+            '    with timed_phase("parse"):\n',
+            f'        lines = read_puzzle_input(day={day})\n',
+            f'    return get_engine(day={day})(lines=lines)\n',
+            '\n', '\n',
+            'def solve_lines(lines: list[str]) -> tuple[int, int]:\n',
+            '    """Compute the answers for the two parts of this day from its input '
+            'lines."""\n',
+            '    with timed_phase("parse"):\n',
+            '        ...\n',
+            '    with timed_phase("part1"):\n',
+            '        ...\n',
+            '    with timed_phase("part2"):\n',
+            '        ...\n',
             '    return None, None\n']
         return file_path, lines
 
@@ -113,10 +335,156 @@ class AdventBuilder:
 
 class AdventSolver:
     """Manage puzzle solving tasks."""
-    def print_day(self, day: int):
-        """Print the solutions and execution time for the target day's puzzles."""
+    def __init__(self, cache: ResultCache = None, refresh: bool = False,
+                 time_limit: float = None, memory_limit: int = None,
+                 budgets: dict[int, dict[str, float]] = None,
+                 parse_cache: ParseCache = None, history: "AdventHistory" = None,
+                 engine: str = DEFAULT_ENGINE):
+        self.cache = cache
+        self.refresh = refresh
+        self.engine = engine  # Engine used for the days offering it.
+        self.parse_cache = parse_cache  # Arrays parsed from earlier inputs, if used.
+        self.history = history  # Database recording the timings of every run, if used.
+        self.time_limit = time_limit  # Seconds allowed for each day, if limited.
+        self.memory_limit = memory_limit  # Bytes allowed for each day, if limited.
+        self.budgets = budgets or {}  # Limits of specific days, overriding the above.
+        self.failures = {}  # Days whose solving was stopped, and why.
+
+    @staticmethod
+    def read_budgets(file_path: Path = BUDGETS_FILE) -> dict:
+        """Read the time and memory limits of a budgets file, as solver arguments.
+
+        The JSON file may set default "time_limit" (in seconds) and "memory_limit" (in
+        MiB) values, and the limits of specific days under "days", like in:
+        {"time_limit": 60, "memory_limit": 2048, "days": {"12": {"time_limit": 5}}}
+        """
+        with open(file_path, mode="r", encoding="utf-8") as file:
+            data = json.load(file)
+        limits = {}
+        for name, value in data.items():
+            if name == "days":
+                limits["budgets"] = {int(day): AdventSolver._convert_limits(budget)
+                                     for day, budget in value.items()}
+            else:
+                limits.update(AdventSolver._convert_limits(limits={name: value}))
+        return limits
+
+    @staticmethod
+    def _convert_limits(limits: dict[str, float]) -> dict[str, float]:
+        """Check the names of budget limits, converting memory ones from MiB to bytes."""
+        if not set(limits) <= {"time_limit", "memory_limit"}:
+            raise ValueError("Unknown budget limit!")
+        return {name: int(value * 1024 ** 2) if name == "memory_limit" else value
+                for name, value in limits.items()}
+
+    def get_budget(self, day: int) -> tuple[float | None, int | None]:
+        """Provide the time (in seconds) and memory (in bytes) limits of a day."""
+        budget = self.budgets.get(day, {})
+        return budget.get("time_limit", self.time_limit), \
+            budget.get("memory_limit", self.memory_limit)
+
+    @property
+    def is_supervised(self) -> bool:
+        """Check if any day has a limited time or memory budget."""
+        return any(limit is not None for day in range(1, len(DAILY_NAMES) + 1)
+                   for limit in self.get_budget(day=day))
+
+    def print_day(self, day: int, output_format: str = "text"):
+        """Print the solutions, execution times and memory for the target day."""
+        if output_format == "text":
+            self._print_solutions(day, *self.solve_day(day=day))
+        else:
+            self.dump_days(days=[day], results=[self.solve_day(day=day)],
+                           output_format=output_format)
+
+    def print_all_days(self, workers: int | None = 1, output_format: str = "text"):
+        """Print the solutions, execution times and memory for each day's puzzles."""
+        days = range(1, len(DAILY_NAMES) + 1)
+        results = self.solve_all_days(workers=workers)
+        if output_format == "text":
+            for day, solutions in zip(days, results):
+                self._print_solutions(day, *solutions)
+        else:
+            self.dump_days(days=days, results=results, output_format=output_format)
+
+    def get_engine_name(self, day: int) -> str:
+        """Provide the engine used for the target day: the chosen one, if offered."""
+        return self.engine if self.engine in get_engines(day=day) else DEFAULT_ENGINE
+
+    @staticmethod
+    def benchmark_engines(day: int, runs: int = 10, warmup: int = 1) -> dict[str, dict]:
+        """Time every engine of the target day side by side, with their answers.
+
+        Each engine gets the statistics of AdventBenchmark.measure_day, its answers
+        under "answers" and its median speed-up against the reference engine.
+        """
+        engines = get_engines(day=day)
+        if not engines:  # The target day is not solved yet.
+            return {}
+        from aoc2021.benchmark import AdventBenchmark  # Built on top of this module.
+        results = {}
+        for name in engines:
+            with use_engine(day=day, name=name):
+                answers = tuple(import_solution(day=day).compute_solution())
+            benchmark = AdventBenchmark(runs=runs, warmup=warmup, engine=name)
+            results[name] = dict(**benchmark.measure_day(day=day), answers=answers)
+        reference_ns = results[DEFAULT_ENGINE]["median_ns"]
+        for stats in results.values():
+            stats["speed_up"] = reference_ns / max(stats["median_ns"], 1)
+        return results
+
+    def print_engines(self, day: int, runs: int = 10, warmup: int = 1):
+        """Print the median times and answers of every engine of the target day."""
+        results = self.benchmark_engines(day=day, runs=runs, warmup=warmup)
+        print(DAILY_NAMES[day - 1])
+        if not results:
+            print("    The puzzle remains unsolved!")
+            return
+        reference = results[DEFAULT_ENGINE]["answers"]
+        for name, stats in results.items():
+            timing = self.format_timing(value=stats["median_ns"] / 1e9)
+            answers = "same answers" if stats["answers"] == reference else \
+                f"DIFFERENT answers: {stats['answers']} vs {reference}"
+            print(f"    {name:<12} median {timing:>10} | {stats['speed_up']:>7.2f}x | "
+                  f"{answers}")
+
+    def dump_days(self, days: Iterable[int], results: Iterable[tuple],
+                  output_format: str = "json"):
+        """Print the results of solving each day as a JSON document or as JSON lines.
+
+        Each day becomes a record with its answers, durations in nanoseconds and peak
+        memory in bytes. The host and git revision are provided once for the whole
+        JSON document, or in every record of JSON lines (so each line stands alone).
+        """
+        run_info = dict(host=get_host_info(), git_revision=get_git_revision())
+        records = (self.build_record(day, *solutions)
+                   for day, solutions in zip(days, results))
+        if output_format == "jsonl":
+            for record in records:
+                print(json.dumps({**record, **run_info}), flush=True)
+        else:
+            print(json.dumps({**run_info, "days": list(records)}, indent=4))
+
+    def build_record(self, day: int, solution_1: int | None, solution_2: int | None,
+                     time_ns: int | None, memory_bytes: int | None,
+                     phases_ns: dict[str, int]) -> dict:
+        """Gather the results of solving the target day into a JSON-serialisable dict."""
+        solutions = [value.item() if hasattr(value, "item") else value
+                     for value in (solution_1, solution_2)]  # No numpy scalars.
+        solved = solution_1 is not None or solution_2 is not None
+        status = self.failures.get(day, "solved" if solved else "unsolved")
+        return dict(day=day, name=DAILY_NAMES[day - 1], status=status,
+                    solution_1=solutions[0], solution_2=solutions[1], time_ns=time_ns,
+                    phases_ns=phases_ns, peak_memory_bytes=memory_bytes)
+
+    def _print_solutions(self, day: int, solution_1: int | None,
+                         solution_2: int | None, time_ns: int | None,
+                         memory_bytes: int | None, phases_ns: dict[str, int]):
+        """Print the provided solutions, times and memory for the target day."""
         print(DAILY_NAMES[day - 1])
-        solution_1, solution_2, timing = self.solve_day(day=day)
+        if day in self.failures:
+            print(f"    Stopped: {self.describe_failure(day=day)}")
+            return
         if solution_1 is None:
             print("    The first puzzle remains unsolved!")
         else:
@@ -126,23 +494,207 @@ class AdventSolver:
         else:
             print(f"    The second solution is {solution_2}.")
         if solution_1 is not None or solution_2 is not None:
-            print(f"    This took {timing}.")
+            memory = ", with peak memory n/a" if memory_bytes is None else \
+                f", peaking at {self.format_memory(value=memory_bytes)} of memory"
+            print(f"    This took {self.format_timing(value=time_ns / 1e9)}{memory}.")
+        if phases_ns:
+            print("    Phases: " + " | ".join(
+                f"{name} {self.format_timing(value=value / 1e9)}"
+                for name, value in phases_ns.items()))
 
-    def print_all_days(self):
-        """Print the solutions and execution times for each day's puzzles."""
-        for day in range(1, len(DAILY_NAMES) + 1):
-            self.print_day(day=day)
+    def describe_failure(self, day: int) -> str:
+        """Explain why the solving of the target day was stopped."""
+        time_limit, memory_limit = self.get_budget(day=day)
+        status = self.failures[day]
+        if status == "timeout":
+            return f"timeout, over its {self.format_timing(value=time_limit)} budget."
+        elif status == "out of memory":
+            return f"out of memory, over its {self.format_memory(value=memory_limit)} " \
+                   f"budget."
+        return f"{status}, the solving process failed."
+
+    def solve_all_days(self, workers: int | None = 1) -> Iterator[DayResults]:
+        """Get the solutions, durations (in ns) and memory for each day, in day order."""
+        return self.solve_days(days=range(1, len(DAILY_NAMES) + 1), workers=workers)
+
+    def solve_days(self, days: Iterable[int], workers: int | None = 1) \
+            -> Iterator[DayResults]:
+        """Get the solutions, durations (in ns) and memory of the target days, in order.
+
+        Each day not served by the cache is solved in a fresh worker process.
+        """
+        days = list(days)
+        cached = {day: self._read_cache(day=day) for day in days}
+        pending = [day for day in days if cached[day] is None]
+        if not pending:
+            yield from cached.values()
+            return
+        if self.is_supervised:
+            solved = self._solve_supervised(days=pending, workers=workers)
+            for day in days:
+                yield cached[day] if cached[day] is not None else next(solved)
+            return
+        # A fresh process per day keeps memory peaks of other days out of its reading.
+        # Timings are measured inside each worker, so queueing time is left out:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+            solved = pool.imap(self._solve_and_cache, pending)
+            for day in days:
+                yield cached[day] if cached[day] is not None else next(solved)
+
+    def solve_day(self, day: int) -> DayResults:
+        """Get the solutions, durations (in ns, total and by phase) and peak memory.
+
+        Durations and memory (in bytes) are None if the target day is not solved yet,
+        and so is memory if the platform can't measure it.
+        """
+        cached = self._read_cache(day=day)
+        if cached is not None:
+            return cached
+        elif self.is_supervised:
+            return next(self._solve_supervised(days=[day], workers=1))
+        return self._solve_and_cache(day=day)
+
+    def _solve_supervised(self, days: list[int], workers: int | None = 1) \
+            -> Iterator[DayResults]:
+        """Solve each day in a watched process, stopping it if over its budgets.
+
+        Memory budgets limit the resident memory peak of each process, the memory shown
+        for solved days. Results are provided in the order of the target days. Days
+        stopped (or whose process failed) are registered in the failures map, and get
+        empty results.
+        """
+        context = multiprocessing.get_context("spawn")
+        workers = workers or os.cpu_count() or 1
+        pending, running, finished = list(days), {}, {}
+        for day in days:
+            while day not in finished:
+                while pending and len(running) < workers:
+                    day_started = pending.pop(0)
+                    receiver, process, deadline = self._start_supervised(
+                        day=day_started, context=context)
+                    running[receiver] = day_started, process, deadline
+                deadlines = [deadline for *_, deadline in running.values()
+                             if deadline is not None]
+                timeout = None if not deadlines else max(min(deadlines) - monotonic(), 0)
+                if any(self.get_budget(day=watched_day)[1] is not None
+                       for watched_day, *_ in running.values()):
+                    timeout = MEMORY_POLL_INTERVAL if timeout is None else \
+                        min(timeout, MEMORY_POLL_INTERVAL)
+                for receiver in wait(list(running), timeout=timeout):
+                    solved_day, process, _ = running.pop(receiver)
+                    try:
+                        status, results = receiver.recv()
+                    except EOFError:  # The process died without reporting back.
+                        status, results = "error", None
+                    process.join()
+                    if status == "solved" and self._is_over_memory_budget(
+                            day=solved_day, memory_bytes=results[3]):
+                        status = "out of memory"  # Its peak was between two checks.
+                    finished[solved_day] = self._register_status(solved_day, status,
+                                                                 results)
+                for receiver, (late_day, process, deadline) in list(running.items()):
+                    if deadline is not None and monotonic() >= deadline:
+                        status = "timeout"
+                    elif self._is_over_memory_budget(
+                            day=late_day,
+                            memory_bytes=self.get_peak_rss(pid=process.pid)):
+                        status = "out of memory"
+                    else:
+                        continue
+                    process.kill()
+                    process.join()
+                    del running[receiver]
+                    finished[late_day] = self._register_status(late_day, status)
+            yield finished.pop(day)
+
+    def _start_supervised(self, day: int, context: multiprocessing.context.BaseContext) \
+            -> tuple[Connection, multiprocessing.process.BaseProcess, float | None]:
+        """Start solving a day in a new process, with a pipe for its results.
+
+        The process, and the monotonic time at which it must be stopped, are provided.
+        """
+        time_limit, memory_limit = self.get_budget(day=day)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_solve_within_budget,
+                                  args=(self, day, memory_limit, sender), daemon=True)
+        process.start()
+        sender.close()  # Only the new process writes, so EOF is seen if it dies.
+        deadline = None if time_limit is None else monotonic() + time_limit
+        return receiver, process, deadline
 
-    def solve_day(self, day: int) -> tuple[int | None, int | None, str]:
-        """Get the solutions and execution time for the target day's puzzles."""
+    def _is_over_memory_budget(self, day: int, memory_bytes: int | None) -> bool:
+        """Check if a resident memory peak (if known) is over the target day's budget."""
+        memory_limit = self.get_budget(day=day)[1]
+        return None not in (memory_limit, memory_bytes) and memory_bytes > memory_limit
+
+    def _register_status(self, day: int, status: str, results: DayResults = None) \
+            -> DayResults:
+        """Track the days whose solving was stopped, giving them empty results."""
+        if status == "solved":
+            self.failures.pop(day, None)
+            return results
+        self.failures[day] = status
+        return None, None, None, None, {}
+
+    def _read_cache(self, day: int) -> DayResults | None:
+        """Get the last known solutions, time and memory for the target day, if any."""
+        if self.cache is None or self.refresh:
+            return None
+        cached = self.cache.get(key=fingerprint_day(day=day, engine=self.engine))
+        if cached is None or self._is_over_memory_budget(day=day, memory_bytes=cached[3]):
+            return None  # Days over their budget are solved (and stopped) again.
+        return tuple(cached)
+
+    def _solve_and_cache(self, day: int) -> DayResults:
+        """Solve the target day, storing the results in the cache and history (if any)."""
+        results = self._solve(day=day)
+        if self.cache is not None:
+            self.cache.put(key=fingerprint_day(day=day, engine=self.engine),
+                           value=results)
+        if self.history is not None and results[2] is not None:
+            self.history.record(day=day, kind="solve", time_ns=results[2],
+                                phases_ns=results[4], memory_bytes=results[3],
+                                engine=self.get_engine_name(day=day))
+        return results
+
+    def _solve(self, day: int) -> DayResults:
+        """Compute the solutions, durations (in ns) and peak memory for the target day."""
+        module = import_solution(day=day)
+        if module is None:
+            return None, None, None, None, {}
+        measured = self.reset_peak_rss()
+        pop_phase_timings()  # Discard phases left by earlier, unfinished runs.
+        start = perf_counter_ns()
+        with use_parse_cache(cache=self.parse_cache), \
+                use_engine(day=day, name=self.get_engine_name(day=day)):
+            solution_1, solution_2 = module.compute_solution()
+        time_ns = perf_counter_ns() - start
+        phases_ns = pop_phase_timings()
+        memory_bytes = self.get_peak_rss() if measured else None
+        return solution_1, solution_2, time_ns, memory_bytes, phases_ns
+
+    @staticmethod
+    def reset_peak_rss() -> bool:
+        """Reset the resident memory high-water mark of this process (on Linux).
+
+        The mark otherwise covers the whole life of the process, so that it would be
+        the peak of the biggest day solved so far. Return False if it can't be reset.
+        """
         try:
-            module = import_module(f"aoc{YEAR}.day_{day}.solution")
-        except ModuleNotFoundError:
-            return None, None, ""
-        start = time()
-        solution_1, solution_2 = module.compute_solution()
-        timing = self.format_timing(value=time() - start)
-        return solution_1, solution_2, timing
+            with open("/proc/self/clear_refs", mode="w") as file:
+                file.write("5")  # Only resets the high-water mark, see proc(5).
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def get_peak_rss(pid: int | str = "self") -> int | None:
+        """Provide the resident memory high-water mark of a process, in bytes."""
+        try:
+            return _read_process_status(field="VmHWM", pid=pid)
+        except OSError:  # Like for finished processes, or if there is no /proc folder.
+            return None
 
     @staticmethod
     def format_timing(value: float) -> str:
@@ -175,6 +727,59 @@ class AdventSolver:
         else:
             return float(value)
 
+    @staticmethod
+    def format_memory(value: int) -> str:
+        """Format a memory value in bytes into a memory string with sensitive units."""
+        for units, size in ("GiB", 1024 ** 3), ("MiB", 1024 ** 2), ("KiB", 1024):
+            if value >= size:
+                return f"{value / size:.2f} {units}"
+        return f"{value} B"
+
+    @staticmethod
+    def parse_memory(value: str) -> int:
+        """Convert a memory string with sensitive units into a memory value in bytes."""
+        if value in ("-", "n/a"):
+            return 0
+        value, units = value.split(" ")
+        sizes = {"GiB": 1024 ** 3, "MiB": 1024 ** 2, "KiB": 1024, "B": 1}
+        return round(float(value) * sizes[units])
+
+
+def _solve_within_budget(solver: AdventSolver, day: int, memory_limit: int | None,
+                         sender: Connection):
+    """Solve (and cache) the target day within a memory limit, sending the results.
+
+    The watching process enforces the limit on the resident memory peak. Where it
+    can't be read, the address space of this process is capped instead: its libraries
+    then count as well, and so failures to map them count as out of memory.
+    """
+    capped = memory_limit is not None and resource is not None and \
+        AdventSolver.get_peak_rss() is None
+    if capped:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    try:
+        sender.send(("solved", solver._solve_and_cache(day=day)))
+    except Exception as error:
+        cause = error
+        while cause is not None and not isinstance(cause, MemoryError) and not (
+                capped and isinstance(cause, (ImportError, OSError))):
+            cause = cause.__cause__ or cause.__context__  # Like ImportErrors by numpy.
+        if cause is None:
+            traceback.print_exc()
+        sender.send(("error" if cause is None else "out of memory", None))
+    finally:
+        sender.close()
+
+
+def _read_process_status(field: str, pid: int | str = "self") -> int:
+    """Read a memory field (in kB) of a process' Linux status file, in bytes."""
+    with open(f"/proc/{pid}/status", mode="r") as file:
+        for line in file:
+            name, _, value = line.partition(":")
+            if name == field:
+                return int(value.split()[0]) * 1024
+    raise OSError(f"No {field} field in the process status!")
+
 
 class AdventCalendar:
     """Manage the puzzle calendar table included in the README.md file."""
@@ -182,127 +787,239 @@ class AdventCalendar:
     _puzzle_path = Template("https://adventofcode.com/$year/day/$day")
     _solve_path = Template("https://github.com/JaviLunes/AdventCode$year/tree/master"
                            "/src/aoc$year/day_$day/solution.py")
+    _columns = ("Day", "Puzzle", "Stars", "Solution 1", "Solution 2", "Time", "Phases",
+                "Memory")
+    _alignments = ("^", "<") + ("^",) * 6
+    _rx_link = re.compile(r"^\[(?P<value>.+)]\(.+\)$")
+    _fingerprints_file = BASE_PATH.parents[1] / "calendar_fingerprints.json"
 
-    def __init__(self, data: pandas.DataFrame = None):
-        self.solver = AdventSolver()
+    def __init__(self, data: dict[int, dict[str, str]] = None,
+                 solver: AdventSolver = None, incremental: bool = True):
+        self.solver = solver if solver is not None else AdventSolver()
+        self.incremental = incremental  # Skip days registered with the same files.
         self._table_start = self._find_table_start()
+        self._widths = None  # Widths of the README table columns, if reusable.
+        self._changed_days = set()
         self.data = data if data is not None else self._load_from_readme()
+        self.fingerprints = self._load_fingerprints()  # Of the registered days' files.
 
     def _find_table_start(self) -> int:
         """Locate the first line numbers of the README file's puzzle calendar table."""
-        with open(self._readme_file, mode="r") as file:
+        with open(self._readme_file, mode="r", encoding="utf-8") as file:
             lines = file.readlines()
-        section_found = True
+        section_found = False
         for n, line in enumerate(lines):
             if line == "### Puzzle calendar:\n":
                 section_found = True
             if section_found and line.startswith("| "):
                 return n
 
-    def _load_from_readme(self) -> pandas.DataFrame:
+    def _load_from_readme(self) -> dict[int, dict[str, str]]:
         """Extract available data from the puzzle calendar printed in the README file."""
-        lines = self._extract_readme_rows()
-        return self._process_readme_rows(raw_rows=lines)
+        header, separator, *rows = self._extract_readme_rows()
+        headers = [cell.strip().replace("**", "") for cell in self._split_row(header)]
+        if tuple(headers) == self._columns:  # Older calendars are fully rewritten.
+            self._widths = [len(cell) - 2 for cell in self._split_row(separator)]
+        data = {}
+        for row in rows:
+            values = [self._remove_hyper_link(cell.strip()) or "-"
+                      for cell in self._split_row(row)]
+            record = dict(zip(headers, values))
+            day = int(record.pop("Day"))
+            data[day] = {column: record.get(column, "-") for column in self._columns[1:]}
+        return data
 
     def _extract_readme_rows(self) -> list[str]:
-        """Extract all the puzzle calendar lines printed in the README file."""
+        """Extract the header, separator and daily lines of the README file's calendar."""
         with open(self._readme_file, mode="r", encoding="utf-8") as file:
             lines = file.readlines()
-        headers = lines[self._table_start]
-        data_lines = lines[self._table_start + 2:self._table_start + 27]
-        return [headers] + data_lines
-
-    def _process_readme_rows(self, raw_rows: list[str]) -> pandas.DataFrame:
-        """Convert raw calendar lines from the README file into a pandas.DataFrame."""
-        rows = [row.removeprefix("|").removesuffix("|\n") for row in raw_rows]
-        headers = [r.replace("**", "").strip() for r in rows[0].split("|")]
-        data = [[value.strip() for value in row.split("|")] for row in rows[1:]]
-        data = [[value if value != "" else "-" for value in row] for row in data]
-        df = pandas.DataFrame(data=data, columns=headers)
-        df = self._remove_hyper_links(data_frame=df)
-        df["Day"] = df["Day"].astype(int)
-        return df.set_index(keys="Day")
+        return lines[self._table_start:self._table_start + 27]
+
+    @staticmethod
+    def _split_row(line: str) -> list[str]:
+        """Split a table line into its (padded) cells."""
+        return line.rstrip("\n").removeprefix("|").removesuffix("|").split("|")
+
+    @classmethod
+    def _remove_hyper_link(cls, cell: str) -> str:
+        """Remove the web hyperlink of a cell, if any."""
+        match = cls._rx_link.match(cell)
+        return cell if match is None else match["value"]
+
+    def _load_fingerprints(self) -> dict[int, str]:
+        """Read the fingerprints of the input and source files of the registered days."""
+        if not self._fingerprints_file.exists():
+            return {}
+        with open(self._fingerprints_file, mode="r", encoding="utf-8") as file:
+            return {int(day): value for day, value in json.load(file).items()}
+
+    def _save_fingerprints(self):
+        """Write the fingerprints of the registered days' files next to the README."""
+        data = {str(day): self.fingerprints[day] for day in sorted(self.fingerprints)}
+        with open(self._fingerprints_file, mode="w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.write("\n")
 
     @classmethod
     def from_scratch(cls) -> "AdventCalendar":
         """Create a new, empty AdventCalendar, overwriting the one in the README file."""
-        empty_df = pandas.DataFrame(
-            data="-", columns=["Puzzle", "Stars", "Solution 1", "Solution 2", "Time"],
-            index=pandas.RangeIndex(start=1, stop=26, name="Day"))
-        calendar = AdventCalendar(data=empty_df)
+        empty_data = {day: dict.fromkeys(cls._columns[1:], "-") for day in range(1, 26)}
+        calendar = AdventCalendar(data=empty_data)
         calendar._write_to_readme()
+        calendar.fingerprints.clear()
+        calendar._save_fingerprints()
         return calendar
 
-    def register_all_days(self):
-        """Add the data for each day's puzzles to the README file's calendar."""
-        for day in range(1, len(DAILY_NAMES) + 1):
-            self._solve_day(day=day)
-        self._write_to_readme()
+    def register_all_days(self, workers: int | None = 1):
+        """Add the data for each day's puzzles to the README file's calendar.
+
+        If incremental, only days never registered, or whose input or source files
+        changed since registered, are solved: other days keep their rows as they are.
+        """
+        self._register_days(days=range(1, len(DAILY_NAMES) + 1), workers=workers)
 
     def register_day(self, day: int):
         """Add the data for the target day's puzzles to the README file's calendar."""
-        self._solve_day(day=day)
-        self._write_to_readme()
-
-    def _solve_day(self, day: int):
-        """Fill rows with missing solutions or timing values."""
-        s1, s2, timing = self.solver.solve_day(day=day)
-        self.data.loc[day, "Solution 1"] = s1 or "-"
-        self.data.loc[day, "Solution 2"] = s2 or "-"
-        self.data.loc[day, "Time"] = timing or "-"
+        self._register_days(days=[day])
+
+    def _register_days(self, days: Iterable[int], workers: int | None = 1):
+        """Solve and fill the target days needing it, and save any changes made."""
+        fingerprints = {day: fingerprint_day(day=day) for day in days}
+        pending = [day for day, fingerprint in fingerprints.items()
+                   if not self.incremental or self.fingerprints.get(day) != fingerprint]
+        if len(pending) == 1:  # Solved here, without waiting for a worker process.
+            solved = [self.solver.solve_day(day=pending[0])]
+        else:
+            solved = self.solver.solve_days(days=pending, workers=workers)
+        for day, solutions in zip(pending, solved):
+            if self._fill_day_if_solved(day, solutions):
+                self.fingerprints[day] = fingerprints[day]
+        if self._changed_days:
+            self._write_to_readme()
+        if pending:
+            self._save_fingerprints()
+        kept = len(fingerprints) - len(pending)
+        if not pending:
+            print("Nothing to register: no files changed since last registered.")
+        else:
+            print(f"Registered days {pending}" +
+                  (f", keeping {kept} unchanged days." if kept else "."))
+
+    def _fill_day_if_solved(self, day: int, solutions: DayResults) -> bool:
+        """Fill the target day's row, unless its solving was stopped (kept as it was).
+
+        Return False if the target day was stopped.
+        """
+        if day in self.solver.failures:
+            print(f"{DAILY_NAMES[day - 1]} was not registered. Stopped: "
+                  f"{self.solver.describe_failure(day=day)}")
+            return False
+        self._fill_day(day, *solutions)
+        return True
+
+    def _fill_day(self, day: int, s1: int | None, s2: int | None, time_ns: int | None,
+                  memory_bytes: int | None, phases_ns: dict[str, int]):
+        """Fill the target day's row with the provided solutions, times and memory."""
         stars = ":star::star:" if s1 and s2 else ":star:" if s1 or s2 else "-"
-        self.data.loc[day, "Stars"] = stars
+        timing = "-" if time_ns is None else \
+            self.solver.format_timing(value=time_ns / 1e9)
+        memory = "-" if time_ns is None else "n/a" if memory_bytes is None else \
+            self.solver.format_memory(value=memory_bytes)
+        phases = self._format_phases(phases={
+            name: self.solver.format_timing(value=value / 1e9)
+            for name, value in phases_ns.items()})
+        record = {**self.data[day], "Stars": stars, "Solution 1": str(s1 or "-"),
+                  "Solution 2": str(s2 or "-"), "Time": timing, "Phases": phases,
+                  "Memory": memory}
+        if record != self.data[day]:
+            self.data[day] = record
+            self._changed_days.add(day)
 
     def _write_to_readme(self):
-        """Replace the calendar table in the README file with the stored one."""
+        """Update the changed rows of the README file's calendar (or the whole table).
+
+        The rest of the file is left untouched, unless a new cell is too wide for its
+        column, in which case the table is rewritten with wider columns.
+        """
         with open(self._readme_file, mode="r", encoding="utf-8") as file:
             lines = file.readlines()
-        lines[self._table_start:self._table_start + 29] = self._table_as_lines()
+        rows = {day: self._build_cells(day=day) for day in sorted(self.data)}
+        updates = {1 + day: rows[day] for day in self._changed_days}
+        updates[len(rows) + 2] = self._build_totals()
+        if self._widths is not None and all(
+                len(cell) <= width for cells in updates.values()
+                for cell, width in zip(cells, self._widths)):
+            for offset, cells in updates.items():
+                lines[self._table_start + offset] = self._join_cells(cells=cells)
+        else:
+            table = [*rows.values(), updates[len(rows) + 2]]
+            lines[self._table_start:self._table_start + 29] = self._table_as_lines(table)
         with open(self._readme_file, mode="w", encoding="utf-8") as file:
             file.writelines(lines)
+        self._changed_days.clear()
 
-    def _table_as_lines(self) -> list[str]:
-        """Convert the stored calendar table into text lines."""
-        data = self.data.copy(deep=True).reset_index(drop=False)
-        total_time = sum(self.solver.parse_timing(value=value) for value in data["Time"])
-        total_stars = sum(data["Stars"].str.count(":star:"))
-        totals = pandas.DataFrame(data="-", columns=data.columns, index=[0])
-        totals.loc[:, "Day"] = "**Totals**"
-        totals.loc[:, "Stars"] = f"**{total_stars}**:star:"
-        totals.loc[:, "Time"] = f"**{self.solver.format_timing(value=total_time)}**"
-        data = self._add_puzzle_names(data_frame=data)
-        data = self._add_hyper_links(data_frame=data)
-        data = pandas.concat(objs=[data, totals], ignore_index=True)
-        data.columns = [f"**{name}**" for name in data.columns]
-        text = data.to_markdown(
-            index=False, tablefmt="pipe",
-            colalign=("center", "left", "center", "center", "center", "center"))
-        return (text + "\n").splitlines(keepends=True)
+    def _table_as_lines(self, rows: list[list[str]]) -> list[str]:
+        """Convert rows of cells into text lines of a table, fitting columns to cells."""
+        headers = [f"**{name}**" for name in self._columns]
+        self._widths = [max(len(header) + 2, *map(len, cells))
+                        for header, *cells in zip(headers, *rows)]
+        separator = [":" + "-" * width + (":" if alignment == "^" else "-")
+                     for width, alignment in zip(self._widths, self._alignments)]
+        return [self._join_cells(cells=headers), "|" + "|".join(separator) + "|\n",
+                *[self._join_cells(cells=cells) for cells in rows]]
 
-    @staticmethod
-    def _add_puzzle_names(data_frame: pandas.DataFrame) -> pandas.DataFrame:
-        """Update the puzzle names from the global daily-names map."""
-        data_frame["Puzzle"] = [
-            name.split(": ")[1] if name != "-" else "-" for name in DAILY_NAMES]
-        return data_frame
-
-    def _add_hyper_links(self, data_frame: pandas.DataFrame) -> pandas.DataFrame:
-        """Add hyperlinks to puzzle pages and to solution scripts in GitHub."""
-        for idx, (day, puzzle, stars, s1, s2, timing) in data_frame.iterrows():
-            template_mapping = {"day": day, "year": YEAR}
-            link_puzzle = self._puzzle_path.substitute(template_mapping)
-            link_solution = self._solve_path.substitute(template_mapping)
-            data_frame.loc[idx, "Day"] = f"[{day}]({link_puzzle})"
-            data_frame.loc[idx, "Puzzle"] = f"[{puzzle}]({link_puzzle})"
-            if s1 != "-" or s2 != "-":
-                data_frame.loc[idx, "Stars"] = f"[{stars}]({link_solution})"
-                data_frame.loc[idx, "Solution 1"] = f"[{s1}]({link_solution})"
-                data_frame.loc[idx, "Solution 2"] = f"[{s2}]({link_solution})"
-                data_frame.loc[idx, "Time"] = f"[{timing}]({link_solution})"
-        return data_frame
+    def _join_cells(self, cells: list[str]) -> str:
+        """Join the cells of a row into a table line, padding them to column widths."""
+        widths = self._widths or [len(cell) for cell in cells]
+        padded = [f" {cell:{alignment}{width}} " for cell, alignment, width
+                  in zip(cells, self._alignments, widths)]
+        return "|" + "|".join(padded) + "|\n"
+
+    def _build_totals(self) -> list[str]:
+        """Build the cells of the calendar row with total stars, time and memory."""
+        records = self.data.values()
+        total_time = sum(self.solver.parse_timing(value=r["Time"]) for r in records)
+        total_stars = sum(r["Stars"].count(":star:") for r in records)
+        max_memory = max(self.solver.parse_memory(value=r["Memory"]) for r in records)
+        # The largest peak, as days are not solved at the same time:
+        memory = f"**{self.solver.format_memory(value=max_memory)}**" if max_memory \
+            else "-"
+        total_phases = {}
+        for record in records:
+            for name, value in self._parse_phases(cell=record["Phases"]).items():
+                total_phases[name] = total_phases.get(name, 0) + value
+        phases = self._format_phases(phases={
+            name: self.solver.format_timing(value=value)
+            for name, value in total_phases.items()})
+        return ["**Totals**", "-", f"**{total_stars}**:star:", "-", "-",
+                f"**{self.solver.format_timing(value=total_time)}**",
+                f"**{phases}**" if total_phases else "-", memory]
 
     @staticmethod
-    def _remove_hyper_links(data_frame: pandas.DataFrame) -> pandas.DataFrame:
-        """Remove web hyperlinks for all cells."""
-        rx_find, rx_sub = r"^\[(?P<value>.+)]\(.+\)$", r"\g<value>"
-        return data_frame.replace(to_replace=rx_find, value=rx_sub, regex=True)
+    def _format_phases(phases: dict[str, str]) -> str:
+        """Join the execution times of the phases of a day into a single cell value."""
+        return ", ".join(f"{name} {value}" for name, value in phases.items()) or "-"
+
+    def _parse_phases(self, cell: str) -> dict[str, float]:
+        """Split a cell value into the execution time of each phase, in seconds."""
+        if cell == "-":
+            return {}
+        items = [item.split(" ", maxsplit=1) for item in cell.split(", ")]
+        return {name: self.solver.parse_timing(value=value) for name, value in items}
+
+    def _build_cells(self, day: int) -> list[str]:
+        """Build the cells of a day's calendar row, adding hyperlinks to its values."""
+        record = self.data[day]
+        template_mapping = {"day": day, "year": YEAR}
+        link_puzzle = self._puzzle_path.substitute(template_mapping)
+        link_solution = self._solve_path.substitute(template_mapping)
+        name = DAILY_NAMES[day - 1]
+        puzzle = name.split(": ")[1] if name != "-" else "-"
+        cells = [f"[{day}]({link_puzzle})", f"[{puzzle}]({link_puzzle})"]
+        solved = record["Solution 1"] != "-" or record["Solution 2"] != "-"
+        for column in self._columns[2:]:
+            value = record[column]
+            linked = solved and (column not in ("Phases", "Memory") or
+                                 value not in ("-", "n/a"))
+            cells.append(f"[{value}]({link_solution})" if linked else value)
+        return cells
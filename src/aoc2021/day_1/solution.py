@@ -1,13 +1,47 @@
 # coding=utf-8
 """Compute the solution of the Day 1: Sonar Sweep puzzle."""
 
+# Standard library imports:
+from collections.abc import Iterable
+
 # Local application imports:
-from aoc2021.common import read_puzzle_input
-from aoc2021.day_1.tools import SonarReport
+from aoc2021.common import get_engine, iter_puzzle_input, timed_phase
+from aoc2021.day_1.tools import SonarReport, SonarStream, VectorSonarReport
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=1)
-    report = SonarReport(measurements=list(map(int, lines)))
-    return report.increments, report.sliding_increments
+    return get_engine(day=1)(lines=iter_puzzle_input(day=1))
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        report = SonarReport.from_lines(lines=lines)
+    with timed_phase("part1"):
+        increments = report.increments
+    with timed_phase("part2"):
+        sliding_increments = report.sliding_increments
+    return increments, sliding_increments
+
+
+def solve_lines_numpy(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day with NumPy-backed tools."""
+    with timed_phase("parse"):
+        report = VectorSonarReport.from_lines(lines=lines)
+    with timed_phase("part1"):
+        increments = report.count_increments(window=1)
+    with timed_phase("part2"):
+        sliding_increments = report.count_increments(window=3)
+    return increments, sliding_increments
+
+
+def solve_lines_streaming(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day in one constant-memory pass."""
+    with timed_phase("part1"):  # Both parts come from the same pass, timed as part1.
+        counts = SonarStream.count(source=map(int, lines), windows=(1, 3))
+    return counts[1], counts[3]
+
+
+ENGINES = {"reference": solve_lines, "numpy": solve_lines_numpy,
+           "streaming": solve_lines_streaming}
@@ -1,12 +1,34 @@
 # coding=utf-8
 """Tools used for solving the Day 1: Sonar Sweep puzzle."""
 
+# Standard library imports:
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import partial
+import multiprocessing
+from operator import gt
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Type-checking imports (numpy is slow to import, so only VectorSonarReport loads it):
+if TYPE_CHECKING:
+    import numpy
+
+# Set constants:
+CHUNK_SIZE = 32 * 1024 ** 2  # Bytes of a depth file counted by each parallel task.
+
 
 class SonarReport:
     """Define a sweep of depth measurements generated by the sub's sonar."""
-    def __init__(self, measurements: list[int]):
+    def __init__(self, measurements: Sequence[int]):
         self._measurements = measurements
 
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "SonarReport":
+        """Create a new SonarReport by lazily parsing lines with one depth each."""
+        return SonarReport(measurements=array("q", map(int, lines)))
+
     @property
     def increments(self) -> int:
         """Compute the number of times the measured depth decreases."""
@@ -32,3 +54,147 @@ class SonarReport:
             if (new - last) > 0:
                 increases += 1
         return increases
+
+    def count_increments(self, window: int = 1) -> int:
+        """Count the times the sum of a window of measurements grows over the last one."""
+        assert window > 0, "Windows must hold at least one measurement!"
+        values = self._measurements  # Window sums grow when values[i + k] > values[i].
+        return sum(map(gt, values[window:], values))
+
+    @classmethod
+    def count_file_increments(cls, file_path: Path, windows: Iterable[int] = (1, 3),
+                              workers: int | None = None, chunk_size: int = CHUNK_SIZE) \
+            -> dict[int, int]:
+        """Count the increments of each window size over a depth file, in parallel.
+
+        The file is split into byte ranges starting at line starts, and each chunk is
+        counted by a process of a pool. A chunk also reads the first depths of the
+        next one (as many as the largest window), so that the comparisons across
+        their boundary are counted, once, by the chunk where they start.
+        """
+        windows = sorted(set(windows))
+        assert windows and windows[0] > 0 and chunk_size > 0, "Invalid scan setup!"
+        spans = list(_split_file(file_path=file_path, chunk_size=chunk_size))
+        count_chunk = partial(_count_chunk_increments, file_path, windows)
+        workers = min(workers or os.cpu_count() or 1, len(spans))
+        if workers <= 1:
+            chunk_counts = map(count_chunk, spans)
+        else:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(processes=workers) as pool:
+                chunk_counts = list(pool.imap_unordered(count_chunk, spans))
+        totals = dict.fromkeys(windows, 0)
+        for counts in chunk_counts:
+            for window, count in counts.items():
+                totals[window] += count
+        return totals
+
+
+def _split_file(file_path: Path, chunk_size: int) -> Iterable[tuple[int, int]]:
+    """Split a file into byte ranges of about the target size, starting at lines."""
+    size = os.path.getsize(file_path)
+    starts = [0]
+    with open(file_path, mode="rb") as file:
+        for offset in range(chunk_size, size, chunk_size):
+            if offset > starts[-1]:
+                file.seek(offset - 1)
+                file.readline()  # Move to the start of the next line.
+                if file.tell() < size:
+                    starts.append(file.tell())
+    return zip(starts, starts[1:] + [size])
+
+
+def _count_chunk_increments(file_path: Path, windows: list[int],
+                            span: tuple[int, int]) -> dict[int, int]:
+    """Count the increments starting in a byte range of a depth file."""
+    start, end = span
+    with open(file_path, mode="rb") as file:
+        file.seek(start)
+        values = array("q", map(int, file.read(end - start).split()))
+        own = len(values)
+        while len(values) < own + windows[-1] and (line := file.readline()):
+            if not line.isspace():  # The overlap with the next chunk.
+                values.append(int(line))
+    view = memoryview(values)  # Slices of views do not copy the values.
+    return {window: SonarReport(measurements=view[:own + window]).count_increments(
+        window=window) for window in windows}
+
+
+class VectorSonarReport:
+    """Define a sweep of depth measurements, counting increments with NumPy.
+
+    The sums of two consecutive windows of k measurements share all but their first
+    and last values, so a window sum increases exactly when values[i + k] is greater
+    than values[i]: increments are counted without computing any window sum.
+    """
+    def __init__(self, measurements: "Sequence[int] | numpy.ndarray"):
+        import numpy  # Slow to import, and only needed by this engine.
+        self._measurements = numpy.asarray(measurements)  # Arrays are not copied.
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "VectorSonarReport":
+        """Create a new VectorSonarReport by lazily parsing lines with one depth each."""
+        import numpy
+        return VectorSonarReport(
+            measurements=numpy.fromiter(map(int, lines), dtype=numpy.int64))
+
+    def count_increments(self, window: int = 1) -> int:
+        """Count the times the sum of a window of measurements grows over the last one."""
+        assert window > 0, "Windows must hold at least one measurement!"
+        values = self._measurements
+        return int((values[window:] > values[:-window]).sum())
+
+    @property
+    def increments(self) -> int:
+        """Compute the number of times the measured depth increases."""
+        return self.count_increments(window=1)
+
+    @property
+    def sliding_increments(self) -> int:
+        """Compute the number of times the 3-measurement window sum increases."""
+        return self.count_increments(window=3)
+
+
+class SonarStream:
+    """Count depth increments of several window sizes in one pass over a depth stream.
+
+    Only the last k depths (for the largest window k) are kept, in a ring buffer, so
+    memory use is constant however long the stream is. As in VectorSonarReport, a
+    window sum increases exactly when the new depth exceeds the one k depths back.
+    """
+    def __init__(self, windows: Iterable[int] = (1, 3)):
+        self.windows = sorted(set(windows))
+        assert self.windows and self.windows[0] > 0, "Invalid window sizes!"
+        self.counts = dict.fromkeys(self.windows, 0)
+        self._ring = array("q", [0]) * self.windows[-1]
+        self._position = 0  # Index in the ring buffer where the next depth goes.
+        self._seen = 0  # Number of depths received so far.
+
+    def update(self, depths: Iterable[int]) -> dict[int, int]:
+        """Count the increments brought by more depths, and provide the counts so far."""
+        ring, size, windows, counts = self._ring, len(self._ring), self.windows, \
+            self.counts
+        position, seen = self._position, self._seen
+        for depth in depths:
+            for k in windows:
+                if seen >= k and depth > ring[position - k]:  # Negative indexes wrap.
+                    counts[k] += 1
+            ring[position] = depth
+            position = position + 1 if position + 1 < size else 0
+            seen += 1
+        self._position, self._seen = position, seen
+        return dict(counts)
+
+    def update_from_file(self, file_path: Path) -> dict[int, int]:
+        """Count the increments of the depths in a file (one per line), read lazily."""
+        with open(file_path, mode="r", encoding="utf-8") as file:
+            return self.update(depths=(int(line) for line in file if not line.isspace()))
+
+    @classmethod
+    def count(cls, source: Iterable[int] | Path | str, windows: Iterable[int] = (1, 3)) \
+            -> dict[int, int]:
+        """Count the increments of each window size over an iterable or a file path."""
+        stream = cls(windows=windows)
+        if isinstance(source, (Path, str)):
+            return stream.update_from_file(file_path=source)
+        return stream.update(depths=source)
@@ -1,13 +1,26 @@
 # coding=utf-8
 """Compute the solution of the Day 10: Syntax Scoring puzzle."""
 
+# Standard library imports:
+from collections.abc import Iterable
+
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, iter_puzzle_input, timed_phase
 from aoc2021.day_10.tools import SyntaxChecker
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=10)
-    checker = SyntaxChecker(lines=lines)
-    return checker.corruption_score, checker.completion_score
+    return get_engine(day=10)(lines=iter_puzzle_input(day=10))
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    # Lines are scored while streamed, so the parsing includes scoring them:
+    with timed_phase("parse"):
+        checker = SyntaxChecker(lines=lines)
+    with timed_phase("part1"):
+        corruption_score = checker.corruption_score
+    with timed_phase("part2"):
+        completion_score = checker.completion_score
+    return corruption_score, completion_score
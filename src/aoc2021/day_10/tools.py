@@ -2,6 +2,7 @@
 """Tools used for solving the Day 10: Syntax Scoring puzzle."""
 
 # Standard library imports:
+from collections.abc import Iterable
 from statistics import median
 
 
@@ -53,16 +54,20 @@ class NavigationLine:
 
 class SyntaxChecker:
     """Tool for identifying corrupt or incomplete lines in a navigation subsystem."""
-    def __init__(self, lines: list[str]):
-        self.lines = [NavigationLine(chars=line) for line in lines]
+    def __init__(self, lines: Iterable[str]):
+        self._corruption_score, self._completion_scores = 0, []
+        for chars in lines:
+            line = NavigationLine(chars=chars)
+            self._corruption_score += line.corruption_score
+            if (completion_score := line.completion_score) > 0:
+                self._completion_scores.append(completion_score)
 
     @property
     def corruption_score(self) -> int:
         """Provide the sum of scores for corrupt lines."""
-        return sum(line.corruption_score for line in self.lines)
+        return self._corruption_score
 
     @property
     def completion_score(self) -> int:
-        """Provide the sum of scores for uncompleted lines."""
-        scores = [line.completion_score for line in self.lines]
-        return median(filter(lambda c: c > 0, scores))
+        """Provide the median of scores for uncompleted lines."""
+        return median(self._completion_scores)
@@ -2,14 +2,24 @@
 """Compute the solution of the Day 11: Dumbo Octopus puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_11.tools import OctopusGroup
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=11)
-    group_1 = OctopusGroup.from_strings(row_strings=lines)
-    group_2 = OctopusGroup.from_strings(row_strings=lines)
-    group_1.live_for(steps=100)
-    return group_1.total_flashes, group_2.live_until_synchronicity()
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=11)
+    return get_engine(day=11)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        group_1 = OctopusGroup.from_strings(row_strings=lines)
+        group_2 = OctopusGroup.from_strings(row_strings=lines)
+    with timed_phase("part1"):
+        group_1.live_for(steps=100)
+    with timed_phase("part2"):
+        synchronicity_step = group_2.live_until_synchronicity()
+    return group_1.total_flashes, synchronicity_step
@@ -7,6 +7,9 @@ from collections.abc import Iterable
 # Third party imports:
 import numpy
 
+# Local application imports:
+from aoc2021.common import cached_parse
+
 
 class Octopus:
     """Bioluminescent dumbo octopus."""
@@ -54,8 +57,14 @@ class OctopusGroup:
     @classmethod
     def from_strings(cls, row_strings: list[str]) -> "OctopusGroup":
         """Create a new OctopusGroup from strings defining the levels of each row."""
+        return OctopusGroup(energy_levels=cls._parse_energy_levels(row_strings))
+
+    @staticmethod
+    @cached_parse
+    def _parse_energy_levels(row_strings: list[str]) -> numpy.ndarray:
+        """Create a 2D array of energy levels from strings defining each row."""
         energy_levels = numpy.array([list(map(int, row)) for row in row_strings])
-        return OctopusGroup(energy_levels=energy_levels.astype(float))
+        return energy_levels.astype(float)
 
     def live_for(self, steps: int):
         """Make the provided number of steps."""
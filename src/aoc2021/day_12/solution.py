@@ -2,14 +2,23 @@
 """Compute the solution of the Day 12: Passage Pathing puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_12.tools import CaveSystem
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=12)
-    cave_system = CaveSystem.from_paths(paths=lines)
-    paths_1 = cave_system.compute_valid_paths()
-    paths_2 = cave_system.compute_relaxed_paths()
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=12)
+    return get_engine(day=12)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        cave_system = CaveSystem.from_paths(paths=lines)
+    with timed_phase("part1"):
+        paths_1 = cave_system.compute_valid_paths()
+    with timed_phase("part2"):
+        paths_2 = cave_system.compute_relaxed_paths()
     return len(paths_1), len(paths_2)
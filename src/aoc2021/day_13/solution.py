@@ -2,15 +2,26 @@
 """Compute the solution of the Day 13: Transparent Origami puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_13.tools import OrigamiInstructions
 
 
 def compute_solution() -> tuple[int, str]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=13)
-    origami = OrigamiInstructions(recipe=lines)
-    origami.apply_folds(times=1)
-    dots_after_one_fold = origami.visible_dots
-    origami.apply_folds(times=None)
-    return dots_after_one_fold, origami.sheet_code
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=13)
+    return get_engine(day=13)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, str]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        origami = OrigamiInstructions(recipe=lines)
+    with timed_phase("part1"):
+        origami.apply_folds(times=1)
+        dots_after_one_fold = origami.visible_dots
+    # The second part resumes folding the sheet left by the first one:
+    with timed_phase("part2"):
+        origami.apply_folds(times=None)
+        sheet_code = origami.sheet_code
+    return dots_after_one_fold, sheet_code
@@ -4,6 +4,9 @@
 # Third party imports:
 import numpy
 
+# Local application imports:
+from aoc2021.common import cached_parse
+
 
 class OrigamiInstructions:
     """Instructions for folding the first page of the sub's manual."""
@@ -14,6 +17,7 @@ class OrigamiInstructions:
         self.applied_folds = []
 
     @staticmethod
+    @cached_parse
     def _build_sheet(dots: list[str]) -> numpy.ndarray:
         """Create a blank sheet of sufficient size and fill it with the provided dots."""
         xs = [int(dot.split(",")[0]) for dot in dots]
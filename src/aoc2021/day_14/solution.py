@@ -2,16 +2,26 @@
 """Compute the solution of the Day 14: Extended Polymerization puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_14.tools import Polymer
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=14)
-    polymer = Polymer(recipe=lines)
-    polymer.polymerize_for(times=10)
-    delta_after_10_steps = polymer.element_freq_delta
-    polymer.polymerize_for(times=40 - 10)
-    delta_after_40_steps = polymer.element_freq_delta
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=14)
+    return get_engine(day=14)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        polymer = Polymer(recipe=lines)
+    with timed_phase("part1"):
+        polymer.polymerize_for(times=10)
+        delta_after_10_steps = polymer.element_freq_delta
+    # The second part resumes evolving the polymer left by the first one:
+    with timed_phase("part2"):
+        polymer.polymerize_for(times=40 - 10)
+        delta_after_40_steps = polymer.element_freq_delta
     return delta_after_10_steps, delta_after_40_steps
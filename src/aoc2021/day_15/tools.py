@@ -9,6 +9,9 @@ from itertools import product
 # Third party imports:
 import numpy
 
+# Local application imports:
+from aoc2021.common import cached_parse
+
 
 class Node:
     """Individual cave cell storing location, and g and h costs for A* search."""
@@ -48,6 +51,7 @@ class ChironCave:
         self.start = start
         self.goal = goal if goal is not None else self._get_default_goal()
 
+    @cached_parse
     def _build_risk_map(self, risk_levels) -> numpy.ndarray:
         """Create a quadrangular 2D map of individual risk values."""
         shape = (len(risk_levels), len(risk_levels[0]))
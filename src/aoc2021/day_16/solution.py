@@ -2,12 +2,23 @@
 """Compute the solution of the Day 16: Packet Decoder puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_16.tools import Packet
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=16)
-    packet = Packet.from_hexadecimal(hex_string="".join(lines))
-    return packet.total_version, packet.value
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=16)
+    return get_engine(day=16)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        packet = Packet.from_hexadecimal(hex_string="".join(lines))
+    with timed_phase("part1"):
+        total_version = packet.total_version
+    with timed_phase("part2"):
+        value = packet.value
+    return total_version, value
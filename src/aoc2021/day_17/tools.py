@@ -1,9 +1,6 @@
 # coding=utf-8
 """Tools used for solving the Day 17: Trick Shot puzzle."""
 
-# Third party imports:
-import matplotlib.pyplot as plt
-
 
 class Probe:
     """Highly scientific ballistic device for oceanic investigations."""
@@ -108,6 +105,7 @@ class ProbeLauncher:
 
     def plot_launches(self, probes: list[Probe]):
         """Plot the TargetArea and the trajectories of the provided Probe objects."""
+        import matplotlib.pyplot as plt  # Slow to import, and only needed for plots.
         # Create plot:
         fig, ax = plt.subplots()
         # Plot TargetArea:
@@ -2,12 +2,23 @@
 """Compute the solution of the Day 18: Snailfish puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_18.tools import Homework
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=18)
-    homework = Homework(number_strings=lines)
-    return homework.find_total_magnitude(), homework.find_max_twofold_magnitude()
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=18)
+    return get_engine(day=18)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        homework = Homework(number_strings=lines)
+    with timed_phase("part1"):
+        total_magnitude = homework.find_total_magnitude()
+    with timed_phase("part2"):
+        max_twofold_magnitude = homework.find_max_twofold_magnitude()
+    return total_magnitude, max_twofold_magnitude
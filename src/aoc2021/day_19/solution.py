@@ -5,12 +5,23 @@
 import numpy
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_19.tools import Constellation
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=19)
-    constellation = Constellation.from_report(report=lines)
-    return len(constellation.beacons), numpy.max(constellation.scanner_distances)
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=19)
+    return get_engine(day=19)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    # Both parts come from the same alignment of all scanners:
+    with timed_phase("part1"):
+        constellation = Constellation.from_report(report=lines)
+        total_beacons = len(constellation.beacons)
+    with timed_phase("part2"):
+        max_distance = numpy.max(constellation.scanner_distances)
+    return total_beacons, max_distance
@@ -7,7 +7,6 @@ from typing import Iterable, Union
 
 # Third party imports:
 import numpy
-from scipy.spatial.transform import Rotation
 
 
 class Point:
@@ -37,9 +36,9 @@ class Point:
         """Provide the coordinates of this Point as a tuple."""
         return self.x, self.y, self.z
 
-    def rotate(self, rotation: Rotation) -> "Point":
-        """Build a new Point object by applying a scipy.Rotation to this Point."""
-        return Point(*map(round, rotation.apply([self.x, self.y, self.z])))
+    def rotate(self, rotation: numpy.ndarray) -> "Point":
+        """Build a new Point object by applying a 3x3 rotation matrix to this Point."""
+        return Point(*map(int, rotation @ (self.x, self.y, self.z)))
 
     def distance(self, other: "Point") -> int:
         """Compute the Manhattan distance between this and another Point."""
@@ -69,8 +68,8 @@ class Scanner:
         """Provide all beacons in this Scanner, referenced to a (0, 0, 0) origin."""
         return [beacon + self.origin for beacon in self._beacons]
 
-    def rotate(self, rotation: Rotation) -> "Scanner":
-        """Build a new Scanner by applying a Rotation to this Scanner's beacons."""
+    def rotate(self, rotation: numpy.ndarray) -> "Scanner":
+        """Build a new Scanner by applying a rotation matrix to this Scanner's beacons."""
         rotated_beacons = [b.rotate(rotation=rotation) for b in self.beacons_relative]
         return Scanner(i=self.i, beacons=rotated_beacons)
 
@@ -94,8 +93,8 @@ class ScannerAligner:
         self._rotations = list(self.get_cube_rotations())
 
     @staticmethod
-    def get_cube_rotations() -> Iterable[Rotation]:
-        """Generate all 24 non-mirroring Rotation transformations of a 3D cube."""
+    def get_cube_rotations() -> Iterable[numpy.ndarray]:
+        """Generate the matrices of all 24 non-mirroring rotations of a 3D cube."""
         for x_i, y_i, z_i in permutations((0, 1, 2), r=3):
             for x_sign in [1, -1]:
                 for y_sign in [1, -1]:
@@ -107,7 +106,7 @@ class ScannerAligner:
                     # Check determinant to avoid rotation + mirror transformations:
                     if numpy.linalg.det(matrix) == -1:
                         matrix[z_i, 2] = -1
-                    yield Rotation.from_matrix(matrix)
+                    yield matrix
 
     def align_to_reference(self, target: Scanner, ref: Scanner) -> None:
         """Try to align a target Scanner with another reference Scanner."""
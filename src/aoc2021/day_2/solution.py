@@ -1,19 +1,45 @@
 # coding=utf-8
 """Compute the solution of the Day 2: Dive! puzzle."""
 
+# Standard library imports:
+from collections.abc import Iterable
+
 # Local application imports:
-from aoc2021.common import read_puzzle_input
-from aoc2021.day_2.tools import Submarine, AimSubmarine
+from aoc2021.common import get_engine, iter_puzzle_input, timed_phase
+from aoc2021.day_2.tools import Submarine, AimSubmarine, ColumnarCourse, \
+    parse_course
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=2)
-    directions = [line.split()[0] for line in lines]
-    distances = [int(line.split()[1]) for line in lines]
-    course = list(zip(directions, distances))
-    submarine = Submarine()
-    submarine.implement_course(course=course)
-    aim_submarine = AimSubmarine()
-    aim_submarine.implement_course(course=course)
+    return get_engine(day=2)(lines=iter_puzzle_input(day=2))
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    # Lines may be read only once, so the course is kept for both submarines:
+    with timed_phase("parse"):
+        course = list(parse_course(lines=lines))
+    with timed_phase("part1"):
+        submarine = Submarine()
+        submarine.implement_course(course=course)
+    with timed_phase("part2"):
+        aim_submarine = AimSubmarine()
+        aim_submarine.implement_course(course=course)
+    return submarine.total_movement, aim_submarine.total_movement
+
+
+def solve_lines_numpy(lines: Iterable[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day with NumPy-backed tools."""
+    with timed_phase("parse"):
+        course = ColumnarCourse.from_lines(lines=lines)
+    with timed_phase("part1"):
+        submarine = Submarine()
+        submarine.implement_columnar_course(course=course)
+    with timed_phase("part2"):
+        aim_submarine = AimSubmarine()
+        aim_submarine.implement_columnar_course(course=course)
     return submarine.total_movement, aim_submarine.total_movement
+
+
+ENGINES = {"reference": solve_lines, "numpy": solve_lines_numpy}
@@ -1,6 +1,18 @@
 # coding=utf-8
 """Tools used for solving the Day 2: Dive! puzzle."""
 
+# Standard library imports:
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING
+
+# Type-checking imports (numpy is slow to import, so only ColumnarCourse loads it):
+if TYPE_CHECKING:
+    import numpy
+
+# Set constants:
+DIRECTIONS = ("forward", "down", "up")  # The code of each direction is its index.
+
 
 class Submarine:
     """Define a moving submarine."""
@@ -8,7 +20,7 @@ class Submarine:
         self.horizontal = 0
         self.depth = 0
 
-    def implement_course(self, course: list[tuple, int]):
+    def implement_course(self, course: Iterable[tuple[str, int]]):
         """Execute all movement instructions defined in the provided course."""
         for direction, distance in course:
             self._move(direction=direction, distance=distance)
@@ -24,6 +36,11 @@ class Submarine:
         else:
             raise ValueError(f"Unrecognized '{direction}' direction")
 
+    def implement_columnar_course(self, course: "ColumnarCourse"):
+        """Execute all movement instructions of a columnar course at once."""
+        self.horizontal += int(course.forward.sum())
+        self.depth += int(course.vertical.sum())
+
     @property
     def total_movement(self) -> int:
         """Compute the combination of horizontal and diving movement."""
@@ -47,3 +64,148 @@ class AimSubmarine(Submarine):
             self.aim -= distance
         else:
             raise ValueError(f"Unrecognized '{direction}' direction")
+
+    def implement_columnar_course(self, course: "ColumnarCourse"):
+        """Execute all movement instructions of a columnar course at once."""
+        aims = self.aim + course.vertical.cumsum()
+        self.horizontal += int(course.forward.sum())
+        self.depth += int(course.forward @ aims)
+        self.aim = int(aims[-1]) if len(course) else self.aim
+
+
+class ColumnarCourse:
+    """Define a course as columns of direction codes and distances, moved with NumPy.
+
+    Directions are coded by their index in DIRECTIONS, so that the forward and the
+    vertical (down or up) distances of all instructions come from array masks, and
+    the positions after each instruction from their cumulative sums.
+    """
+    def __init__(self, directions: "Iterable[int] | numpy.ndarray",
+                 distances: "Iterable[int] | numpy.ndarray"):
+        import numpy  # Slow to import, and only needed by this engine.
+        self.directions = numpy.asarray(directions, dtype=numpy.int8)
+        self.distances = numpy.asarray(distances, dtype=numpy.int64)
+        assert self.directions.shape == self.distances.shape, "Mismatched columns!"
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "ColumnarCourse":
+        """Create a new ColumnarCourse from 'direction distance' lines."""
+        words = " ".join(lines).split()
+        assert len(words) % 2 == 0, "Instructions need a direction and a distance!"
+        return cls.from_columns(directions=words[0::2], distances=words[1::2])
+
+    @classmethod
+    def from_course(cls, course: Iterable[tuple[str, int]]) -> "ColumnarCourse":
+        """Create a new ColumnarCourse from (direction, distance) instructions."""
+        directions, distances = list(zip(*course)) or [(), ()]
+        return cls.from_columns(directions=directions, distances=distances)
+
+    @classmethod
+    def from_columns(cls, directions: Sequence[str],
+                     distances: Sequence[int | str]) -> "ColumnarCourse":
+        """Create a new ColumnarCourse by coding a column of direction names."""
+        import numpy
+        unknown = set(directions).difference(DIRECTIONS)
+        if unknown:
+            raise ValueError(f"Unrecognized '{min(unknown)}' direction")
+        codes = map({name: code for code, name in enumerate(DIRECTIONS)}.__getitem__,
+                    directions)
+        return cls(directions=numpy.fromiter(codes, dtype=numpy.int8,
+                                             count=len(directions)),
+                   distances=numpy.array(distances, dtype=numpy.int64))
+
+    def __len__(self) -> int:
+        """Provide the number of instructions of the course."""
+        return len(self.directions)
+
+    @property
+    def forward(self) -> "numpy.ndarray":
+        """Provide the forward distance of each instruction (0 if not forward)."""
+        import numpy
+        return numpy.where(self.directions == DIRECTIONS.index("forward"),
+                           self.distances, 0)
+
+    @property
+    def vertical(self) -> "numpy.ndarray":
+        """Provide the downward distance of each instruction (negative if up)."""
+        import numpy
+        signs = numpy.array([0, 1, -1], dtype=numpy.int64)  # Indexed by direction code.
+        return signs[self.directions] * self.distances
+
+    def get_positions(self, aim: bool = False) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+        """Provide the horizontal positions and depths after each instruction.
+
+        Without aim, vertical distances change the depth. With aim, they change the
+        aim, and moving forward changes the depth by the distance times the aim.
+        """
+        forward, vertical = self.forward, self.vertical
+        depths = (forward * vertical.cumsum()).cumsum() if aim else vertical.cumsum()
+        return forward.cumsum(), depths
+
+
+class CourseIndex:
+    """Define prefix sums of a course, giving positions after any instruction in O(1).
+
+    Down and up instructions change the depth of a Submarine exactly as they change
+    the aim of an AimSubmarine. So the horizontal position, the aim and the depth
+    with aim, kept after each instruction, give the positions of both submarines.
+    Instructions can be appended at any time.
+    """
+    def __init__(self, course: "Iterable[tuple[str, int]] | ColumnarCourse" = ()):
+        self._horizontals = array("q", [0])  # Index t is the value after t instructions.
+        self._aims = array("q", [0])
+        self._depths = array("q", [0])
+        self.extend(course=course)
+
+    def __len__(self) -> int:
+        """Provide the number of instructions of the indexed course."""
+        return len(self._horizontals) - 1
+
+    def append(self, direction: str, distance: int):
+        """Add a movement instruction at the end of the indexed course."""
+        horizontal, aim, depth = self._horizontals[-1], self._aims[-1], self._depths[-1]
+        if direction == "forward":
+            horizontal += distance
+            depth += distance * aim
+        elif direction == "down":
+            aim += distance
+        elif direction == "up":
+            aim -= distance
+        else:
+            raise ValueError(f"Unrecognized '{direction}' direction")
+        self._horizontals.append(horizontal)
+        self._aims.append(aim)
+        self._depths.append(depth)
+
+    def extend(self, course: "Iterable[tuple[str, int]] | ColumnarCourse"):
+        """Add movement instructions at the end of the indexed course.
+
+        The prefix sums of a columnar course are computed with NumPy, all at once.
+        """
+        if not isinstance(course, ColumnarCourse):
+            for direction, distance in course:
+                self.append(direction=direction, distance=distance)
+            return
+        forward, aims = course.forward, self._aims[-1] + course.vertical.cumsum()
+        horizontals = self._horizontals[-1] + forward.cumsum()
+        depths = self._depths[-1] + (forward * aims).cumsum()
+        for column, values in ((self._horizontals, horizontals), (self._aims, aims),
+                               (self._depths, depths)):
+            column.frombytes(values.astype(column.typecode).tobytes())
+
+    def position_at(self, t: int, aim: bool = False) -> tuple[int, int]:
+        """Provide the horizontal position and depth after the first t instructions."""
+        assert 0 <= t <= len(self), f"The course has no instruction {t}!"
+        return self._horizontals[t], (self._depths if aim else self._aims)[t]
+
+    def total_movement_at(self, t: int, aim: bool = False) -> int:
+        """Compute the combination of horizontal and diving movement after t steps."""
+        horizontal, depth = self.position_at(t=t, aim=aim)
+        return horizontal * depth
+
+
+def parse_course(lines: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """Lazily convert 'direction distance' lines into movement instructions."""
+    for line in lines:
+        direction, distance = line.split()
+        yield direction, int(distance)
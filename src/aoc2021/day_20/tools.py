@@ -7,6 +7,9 @@ from collections.abc import Iterable
 # Third party imports:
 import numpy
 
+# Local application imports:
+from aoc2021.common import cached_parse
+
 
 class Image:
     """Infinite-size, pixelated image sent by the constellation of submarine scanners."""
@@ -19,11 +22,12 @@ class Image:
         return numpy.array_equal(self.pixels, other.pixels)
 
     def _trim_borders(self):
-        """Reduce the image size by cutting out borders without lit pixels."""
-        lit_rows = [i for i in range(self.shape[0]) if any(self.pixels[i, :])]
-        lit_cols = [j for j in range(self.shape[1]) if any(self.pixels[:, j])]
+        """Reduce the image size by cutting out borders matching the outside pixels."""
+        inside = self.pixels != (self.out_value == "#")
+        lit_rows = [i for i in range(self.shape[0]) if any(inside[i, :])]
+        lit_cols = [j for j in range(self.shape[1]) if any(inside[:, j])]
         a = slice(lit_rows[0], lit_rows[-1] + 1) if lit_rows else slice(self.shape[0])
-        b = slice(lit_rows[0], lit_cols[-1] + 1) if lit_cols else slice(self.shape[1])
+        b = slice(lit_cols[0], lit_cols[-1] + 1) if lit_cols else slice(self.shape[1])
         self.pixels = self.pixels[a, b]
 
     @property
@@ -38,7 +42,7 @@ class Image:
 
     def get_pixel(self, x: int, y: int) -> str:
         """Provide the value of the pixel located at the provided coordinates."""
-        if (0 <= x < self.shape[0]) and (0 <= y < self.shape[1]):
+        if (0 <= x < self.shape[1]) and (0 <= y < self.shape[0]):
             return "#" if self.pixels[(y, x)] else "."
         return self.out_value
 
@@ -58,9 +62,16 @@ class Image:
     @classmethod
     def from_rows(cls, pixel_rows: list[str], outside_value: str) -> "Image":
         """Create a new Image from a group of strings containing '.' and '#' chars."""
+        return cls(pixel_array=cls._parse_pixels(pixel_rows=pixel_rows),
+                   outside_value=outside_value)
+
+    @staticmethod
+    @cached_parse
+    def _parse_pixels(pixel_rows: list[str]) -> numpy.ndarray:
+        """Create a 2D boolean array of lit pixels from rows of '.' and '#' chars."""
         shape = len(pixel_rows), len(pixel_rows[0])
-        values = "".join(pixel_rows)
-        return cls.from_iterable(*values, shape=shape, outside_value=outside_value)
+        boolean_iter = (char == "#" for char in "".join(pixel_rows))
+        return numpy.fromiter(boolean_iter, dtype=bool).reshape(shape)
 
     @staticmethod
     def _parse_binary_string(string: str) -> Iterable[bool]:
@@ -93,8 +104,8 @@ class Algorithm:
     @staticmethod
     def _get_target_locations(image: Image) -> Iterable[tuple[int, int]]:
         """Get the locations of the pixels for a new, enhanced Image."""
-        i_range = range(-1, image.shape[0] + 1)
-        j_range = range(-1, image.shape[1] + 1)
+        i_range = range(-1, image.shape[1] + 1)
+        j_range = range(-1, image.shape[0] + 1)
         return ((i, j) for j in j_range for i in i_range)
 
     @staticmethod
@@ -2,12 +2,23 @@
 """Compute the solution of the Day 3: Binary Diagnostic puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_3.tools import Report
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    numbers = read_puzzle_input(day=3)
-    report = Report(*numbers)
-    return report.power_consumption, report.life_rating
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=3)
+    return get_engine(day=3)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        report = Report(*lines)
+    with timed_phase("part1"):
+        power_consumption = report.power_consumption
+    with timed_phase("part2"):
+        life_rating = report.life_rating
+    return power_consumption, life_rating
@@ -2,13 +2,23 @@
 """Compute the solution of the Day 5: Hydrothermal Venture puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_5.tools import VentMap
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=5)
-    vent_map_hv = VentMap(vent_segments=lines, diagonals=False)
-    vent_map_hvd = VentMap(vent_segments=lines, diagonals=True)
-    return len(vent_map_hv.dangerous_points), len(vent_map_hvd.dangerous_points)
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=5)
+    return get_engine(day=5)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("part1"):
+        vent_map_hv = VentMap(vent_segments=lines, diagonals=False)
+        dangerous_hv = len(vent_map_hv.dangerous_points)
+    with timed_phase("part2"):
+        vent_map_hvd = VentMap(vent_segments=lines, diagonals=True)
+        dangerous_hvd = len(vent_map_hvd.dangerous_points)
+    return dangerous_hv, dangerous_hvd
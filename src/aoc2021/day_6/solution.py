@@ -2,15 +2,25 @@
 """Compute the solution of the Day 6: Lanternfish puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_6.tools import School
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=6)
-    school_1 = School(fish_states=list(map(int, lines[0].split(","))))
-    school_2 = School(fish_states=list(map(int, lines[0].split(","))))
-    school_1.live_for(days=80)
-    school_2.live_for(days=256)
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=6)
+    return get_engine(day=6)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        fish_states = list(map(int, lines[0].split(",")))
+    with timed_phase("part1"):
+        school_1 = School(fish_states=fish_states)
+        school_1.live_for(days=80)
+    with timed_phase("part2"):
+        school_2 = School(fish_states=fish_states)
+        school_2.live_for(days=256)
     return school_1.active_fishes, school_2.active_fishes
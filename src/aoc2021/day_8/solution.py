@@ -2,15 +2,25 @@
 """Compute the solution of the Day 8: Seven Segment Search puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_8.tools import Entry
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=8)
+    return get_engine(day=8)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
     targets = ["1", "4", "7", "8"]
-    texts = read_puzzle_input(day=8)
-    entries = [Entry(entry_text=text) for text in texts]
-    total_1 = sum(len([d for d in e.output_digits if d in targets]) for e in entries)
-    total_2 = sum(int("".join(entry.output_digits)) for entry in entries)
+    # Entries find their wire map when built, so the parsing includes decoding them:
+    with timed_phase("parse"):
+        entries = [Entry(entry_text=text) for text in lines]
+    with timed_phase("part1"):
+        total_1 = sum(len([d for d in e.output_digits if d in targets]) for e in entries)
+    with timed_phase("part2"):
+        total_2 = sum(int("".join(entry.output_digits)) for entry in entries)
     return total_1, total_2
@@ -2,14 +2,24 @@
 """Compute the solution of the Day 9: Smoke Basin puzzle."""
 
 # Local application imports:
-from aoc2021.common import read_puzzle_input
+from aoc2021.common import get_engine, read_puzzle_input, timed_phase
 from aoc2021.day_9.tools import Cave
 
 
 def compute_solution() -> tuple[int, int]:
     """Compute the answers for the two parts of this day."""
-    lines = read_puzzle_input(day=9)
-    cave = Cave.from_row_strings(height_rows=lines)
-    basin_caves = cave.explore_basins(impassable_height=9)
-    sizes = sorted([c.size for c in basin_caves], reverse=True)
-    return cave.total_risk_level, sizes[0] * sizes[1] * sizes[2]
+    with timed_phase("parse"):
+        lines = read_puzzle_input(day=9)
+    return get_engine(day=9)(lines=lines)
+
+
+def solve_lines(lines: list[str]) -> tuple[int, int]:
+    """Compute the answers for the two parts of this day from its input lines."""
+    with timed_phase("parse"):
+        cave = Cave.from_row_strings(height_rows=lines)
+    with timed_phase("part1"):
+        total_risk_level = cave.total_risk_level
+    with timed_phase("part2"):
+        basin_caves = cave.explore_basins(impassable_height=9)
+        sizes = sorted([c.size for c in basin_caves], reverse=True)
+    return total_risk_level, sizes[0] * sizes[1] * sizes[2]
@@ -4,6 +4,9 @@
 # Third party imports:
 import numpy
 
+# Local application imports:
+from aoc2021.common import cached_parse
+
 
 class Cave:
     """Cell representation of a lava tube cave system, storing cell height data."""
@@ -14,11 +17,19 @@ class Cave:
     @classmethod
     def from_row_strings(cls, height_rows: list[str], wall_height: int = 20) -> "Cave":
         """Build a new Cave from a list of strings, each containing heights per row."""
+        height_map = cls._build_height_map(height_rows=height_rows,
+                                           wall_height=wall_height)
+        return Cave(heights_array=height_map, wall_height=wall_height)
+
+    @staticmethod
+    @cached_parse
+    def _build_height_map(height_rows: list[str], wall_height: int) -> numpy.ndarray:
+        """Create a 2D map of the heights of each cell, surrounded by walls."""
         shape = len(height_rows) + 2, len(height_rows[0]) + 2
         height_map = numpy.full(shape=shape, fill_value=wall_height)
         for r, row in enumerate(height_rows):
             height_map[r + 1, 1:-1] = list(map(int, [*row]))
-        return Cave(heights_array=height_map, wall_height=wall_height)
+        return height_map
 
     def explore(self, i_start: int, j_start, impassable_height: int = None) -> "Cave":
         """Build a Cave from all cells reachable without crossing impassable heights."""
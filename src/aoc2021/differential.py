@@ -0,0 +1,120 @@
+# coding=utf-8
+"""Tools for checking that two implementations of a day give identical answers."""
+
+# Standard library imports:
+from collections.abc import Callable, Iterable
+import math
+from time import perf_counter_ns
+import unittest
+
+# Local application imports:
+from aoc2021.common import DAILY_NAMES, AdventSolver
+from aoc2021.generators import generate_input, get_default_sizes
+
+# Set constants:
+Implementation = Callable[[list[str]], tuple]  # Answers of both parts from lines.
+
+
+class AdventDifferential:
+    """Manage the comparison of a reference and a candidate implementation of a day.
+
+    Both implementations solve the same inputs: the example inputs given (like those
+    of the day's example tests), then generated inputs of increasing size. Their
+    answers must be identical, and the candidate's speed-up is measured on each.
+    """
+    def __init__(self, runs: int = 1, seed: int = 0):
+        if runs <= 0:
+            raise ValueError("Invalid comparison setup!")
+        self.runs = runs  # Timed runs per input, keeping the fastest one.
+        self.seed = seed  # Seed of the generated inputs.
+
+    def compare_day(self, day: int, reference: Implementation,
+                    candidate: Implementation, sizes: Iterable[int] = None,
+                    examples: Iterable[list[str]] = ()) -> list[dict]:
+        """Solve example and generated inputs with both implementations.
+
+        Each case provides its label, number of lines, the answers and fastest time in
+        nanoseconds of each implementation, the speed-up of the candidate and whether
+        both answers are identical.
+        """
+        sizes = get_default_sizes(day=day) if sizes is None else sorted(sizes)
+        cases = [(f"example {n}", lines) for n, lines in enumerate(examples, start=1)]
+        cases += [(f"size {size}", generate_input(day=day, size=size, seed=self.seed))
+                  for size in sizes]
+        if cases:  # Untimed warm-up runs, so that lazy imports are not timed.
+            for function in reference, candidate:
+                function(list(cases[0][1]))
+        return [self.compare_lines(label=label, lines=lines, reference=reference,
+                                   candidate=candidate) for label, lines in cases]
+
+    def compare_lines(self, label: str, lines: list[str], reference: Implementation,
+                      candidate: Implementation) -> dict:
+        """Solve some input lines with both implementations, timing each of them."""
+        reference_answers, reference_ns = self._time(function=reference, lines=lines)
+        candidate_answers, candidate_ns = self._time(function=candidate, lines=lines)
+        return dict(case=label, lines=len(lines), reference=reference_answers,
+                    candidate=candidate_answers, reference_ns=reference_ns,
+                    candidate_ns=candidate_ns,
+                    speed_up=reference_ns / max(candidate_ns, 1),
+                    same=tuple(reference_answers) == tuple(candidate_answers))
+
+    def _time(self, function: Implementation, lines: list[str]) -> tuple[tuple, int]:
+        """Provide the answers of an implementation, and its fastest time in ns."""
+        samples = []
+        for _ in range(self.runs):
+            start = perf_counter_ns()
+            answers = function(list(lines))  # A copy, in case lines get consumed.
+            samples.append(perf_counter_ns() - start)
+        return answers, min(samples)
+
+    def assert_same_answers(self, day: int, reference: Implementation,
+                            candidate: Implementation, sizes: Iterable[int] = None,
+                            examples: Iterable[list[str]] = ()) -> list[dict]:
+        """Compare both implementations, raising AssertionError if any answer differs."""
+        cases = self.compare_day(day=day, reference=reference, candidate=candidate,
+                                 sizes=sizes, examples=examples)
+        for case in cases:
+            if not case["same"]:
+                raise AssertionError(
+                    f"Day {day}, {case['case']}: the reference answers "
+                    f"{case['reference']} but the candidate answers {case['candidate']}.")
+        return cases
+
+    def run(self, day: int, reference: Implementation, candidate: Implementation,
+            sizes: Iterable[int] = None, examples: Iterable[list[str]] = (),
+            names: tuple[str, str] = ("reference", "candidate")) -> bool:
+        """Compare and print both implementations, returning False if answers differ."""
+        cases = self.compare_day(day=day, reference=reference, candidate=candidate,
+                                 sizes=sizes, examples=examples)
+        self.print_day(day=day, cases=cases, names=names)
+        return all(case["same"] for case in cases)
+
+    @staticmethod
+    def print_day(day: int, cases: list[dict],
+                  names: tuple[str, str] = ("reference", "candidate")):
+        """Print the timings, speed-up and answer check of each compared input."""
+        print(DAILY_NAMES[day - 1])
+        print(f"    {'input':<12} | {'lines':>8} | {names[0]:>12} | {names[1]:>12} | "
+              f"{'speed-up':>8} | answers")
+        for case in cases:
+            times = [AdventSolver.format_timing(value=case[f"{key}_ns"] / 1e9)
+                     for key in ("reference", "candidate")]
+            verdict = "same" if case["same"] else \
+                f"DIFFERENT: {case['reference']} vs {case['candidate']}"
+            print(f"    {case['case']:<12} | {case['lines']:>8} | {times[0]:>12} | "
+                  f"{times[1]:>12} | {case['speed_up']:>7.2f}x | {verdict}")
+        different = sum(not case["same"] for case in cases)
+        speed_up = math.exp(sum(math.log(max(case["speed_up"], 1e-12))
+                                for case in cases) / len(cases)) if cases else 1.0
+        verdict = f"{different} of {len(cases)} inputs got different answers" \
+            if different else f"Same answers for all {len(cases)} inputs"
+        print(f"    {verdict}; {names[1]} speed-up of {speed_up:.2f}x (geometric mean).")
+
+
+def collect_examples(test_case: type[unittest.TestCase]) -> list[list[str]]:
+    """Gather the example inputs (lists of lines) defined by an example test's setUp."""
+    case = test_case(methodName="setUp")
+    case.setUp()
+    return [value for value in vars(case).values()
+            if isinstance(value, list) and value and
+            all(isinstance(line, str) for line in value)]
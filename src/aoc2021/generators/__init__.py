@@ -0,0 +1,44 @@
+# coding=utf-8
+"""Seeded generators of valid, synthetic puzzle inputs of any requested size."""
+
+# Standard library imports:
+from importlib import import_module
+from pathlib import Path
+import random
+from types import ModuleType
+
+# Set constants:
+GENERATED_DAYS = tuple(range(1, 21))
+
+
+def get_generator(day: int) -> ModuleType:
+    """Import the input generator module of the target day."""
+    if day not in GENERATED_DAYS:
+        raise ValueError(f"There is no input generator for day {day}.")
+    return import_module(f"{__name__}.day_{day}")
+
+
+def describe_size(day: int) -> str:
+    """Explain what the size of a generated input means for the target day."""
+    return get_generator(day=day).SIZE
+
+
+def get_default_sizes(day: int) -> tuple[int, ...]:
+    """Provide the input sizes swept by default when measuring a day's scaling."""
+    return get_generator(day=day).SCALES
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> list[str]:
+    """Generate the lines of a synthetic input of the provided size for a day."""
+    if size <= 0:
+        raise ValueError("Input sizes must be positive!")
+    return get_generator(day=day).generate(size=size, rng=random.Random(seed))
+
+
+def write_input(day: int, size: int, file_path: Path, seed: int = 0) -> Path:
+    """Generate a synthetic input of the provided size for a day, and write it."""
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, mode="w", encoding="utf-8") as file:
+        file.writelines(f"{line}\n" for line in generate_input(day, size, seed=seed))
+    return file_path
@@ -0,0 +1,18 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 1: Sonar Sweep puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of depth measurements"
+SCALES = (1000, 2000, 4000, 8000, 16000, 32000)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a random walk of sea floor depths, mostly getting deeper."""
+    depth, depths = rng.randint(100, 200), []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 15))
+        depths.append(str(depth))
+    return depths
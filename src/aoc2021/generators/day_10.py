@@ -0,0 +1,37 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 10: Syntax Scoring puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of navigation subsystem lines"
+SCALES = (100, 200, 400, 800, 1600)
+PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate corrupted and incomplete chunk lines (an odd number of the latter)."""
+    incomplete = max(1, size // 2) | 1
+    kinds = [False] * incomplete + [True] * (size - incomplete)
+    rng.shuffle(kinds)
+    return [_generate_line(corrupted=corrupted, rng=rng) for corrupted in kinds]
+
+
+def _generate_line(corrupted: bool, rng: random.Random) -> str:
+    """Generate a line of chunks which is left open, or closed with a wrong char."""
+    length = rng.randint(90, 110)
+    corrupted_at = rng.randrange(length // 2, length) if corrupted else -1
+    stack, chars = [], []
+    while len(chars) < length or not stack or corrupted_at >= 0:
+        if not stack or rng.random() < 0.55:
+            stack.append(rng.choice(list(PAIRS)))
+            chars.append(stack[-1])
+        elif len(chars) >= corrupted_at >= 0:
+            opener = stack.pop()
+            wrong = [c for o, c in PAIRS.items() if o != opener]
+            chars.append(rng.choice(wrong))
+            corrupted_at = -1
+        else:
+            chars.append(PAIRS[stack.pop()])
+    return "".join(chars)
@@ -0,0 +1,46 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 11: Dumbo Octopus puzzle."""
+
+# Standard library imports:
+import random
+
+# Third party imports:
+import numpy
+
+# Set constants:
+SIZE = "side of the square octopus grid"
+SCALES = (10, 15, 20, 30, 40)
+MAX_STEPS = 1000
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate an octopus grid that is known to synchronise its flashes.
+
+    Fully random grids often never synchronise (and part 2 would then never end), so a
+    random patch is drawn over a synchronised grid until the whole grid flashes
+    together within a bounded number of steps.
+    """
+    patch = min(size, 10)
+    while True:
+        grid = numpy.zeros((size, size), dtype=int)
+        grid[:patch, :patch] = [[rng.randint(0, 9) for _ in range(patch)]
+                                for _ in range(patch)]
+        if _synchronises(grid=grid.copy()):
+            return ["".join(map(str, row)) for row in grid.tolist()]
+
+
+def _synchronises(grid: numpy.ndarray) -> bool:
+    """Check if all octopuses in a grid flash on the same step before the limit."""
+    for _ in range(MAX_STEPS):
+        grid += 1
+        flashed = numpy.zeros(grid.shape, dtype=bool)
+        while (new := (grid > 9) & ~flashed).any():
+            flashed |= new
+            padded = numpy.pad(new, pad_width=1).astype(int)
+            rows, cols = grid.shape
+            grid += sum(padded[1 + i:1 + i + rows, 1 + j:1 + j + cols]
+                        for i in (-1, 0, 1) for j in (-1, 0, 1) if i or j)
+        grid[flashed] = 0
+        if flashed.all():
+            return True
+    return False
@@ -0,0 +1,30 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 12: Passage Pathing puzzle."""
+
+# Standard library imports:
+from itertools import combinations
+import random
+from string import ascii_lowercase
+
+# Set constants:
+SIZE = "number of cave connections"
+SCALES = (9, 12, 15, 18, 21)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate cave connections, never linking two big caves (or paths are endless)."""
+    names = rng.sample([a + b for a in ascii_lowercase for b in ascii_lowercase],
+                       k=size // 3 + 3)
+    small, big = names[:-(size // 8 + 1)], [n.upper() for n in names[-(size // 8 + 1):]]
+    caves = small + big
+    start = rng.choice(small)  # Linked to some end cave, so there is a path to the end.
+    end = rng.choice([cave for cave in caves if cave != start])
+    edges = [("start", start), (start, end), (end, "end")]
+    candidates = [(a, b) for a, b in combinations(caves, r=2)
+                  if not (a.isupper() and b.isupper())]
+    candidates += [("start", cave) for cave in caves] + [(cave, "end") for cave in caves]
+    candidates = [edge for edge in candidates
+                  if {*edge} not in [{*linked} for linked in edges]]
+    edges += rng.sample(candidates, k=min(size - 3, len(candidates)))
+    rng.shuffle(edges)
+    return [f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in edges]
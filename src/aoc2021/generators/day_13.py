@@ -0,0 +1,51 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 13: Transparent Origami puzzle."""
+
+# Standard library imports:
+import random
+
+# Local application imports:
+from aoc2021.day_13.tools import DOT_PRINTER_MAP
+
+# Set constants:
+SIZE = "number of fold instructions"
+SCALES = (4, 6, 8, 10, 12)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a sheet that folds into an 8-letter code, by unfolding that code.
+
+    Each unfolding doubles the sheet along one axis, keeping each dot where it is,
+    moving it to its mirror position, or both. Folding halves are always the same
+    size, and no dot lies on a fold line.
+    """
+    letters = [k for k, v in DOT_PRINTER_MAP.items() if v]
+    dots, height, width = set(), 6, 40
+    for n, letter in enumerate(rng.choices(letters, k=8)):
+        dots |= {(5 * n + x, y) for y, row in enumerate(DOT_PRINTER_MAP[letter])
+                 for x, value in enumerate(row) if value}
+    folds = []
+    for axis in rng.choices("xy", k=size):
+        line = width if axis == "x" else height
+        dots = _unfold(dots=dots, axis=0 if axis == "x" else 1, line=line, rng=rng)
+        if axis == "x":
+            width += width + 1
+        else:
+            height += height + 1
+        folds.insert(0, f"fold along {axis}={line}")
+    dot_lines = [f"{x},{y}" for x, y in sorted(dots)]
+    rng.shuffle(dot_lines)
+    return dot_lines + [""] + folds
+
+
+def _unfold(dots: set[tuple[int, int]], axis: int, line: int,
+            rng: random.Random) -> set[tuple[int, int]]:
+    """Reflect dots across a line, so folding the result along it restores them."""
+    unfolded = set()
+    for dot in sorted(dots):
+        mirrored = list(dot)
+        mirrored[axis] = 2 * line - dot[axis]
+        # Keep and reflect dots on the border, so the unfolded sheet has full size:
+        choice = 2 if dot[axis] == 0 else rng.randrange(3)
+        unfolded |= [{dot}, {tuple(mirrored)}, {dot, tuple(mirrored)}][choice]
+    return unfolded
@@ -0,0 +1,18 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 14: Extended Polymerization puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "length of the polymer template"
+SCALES = (100, 1000, 10000, 100000)
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a polymer template and an insertion rule for every pair of elements."""
+    template = "".join(rng.choices(ELEMENTS, k=max(size, 2)))
+    rules = [f"{a}{b} -> {rng.choice(ELEMENTS)}" for a in ELEMENTS for b in ELEMENTS]
+    rng.shuffle(rules)
+    return [template, ""] + rules
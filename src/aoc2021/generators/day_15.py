@@ -0,0 +1,16 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 15: Chiton puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "side of the square risk level map"
+SCALES = (10, 20, 40, 80)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a map of risk levels from 1 to 9, with low risks more frequent."""
+    weights = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    return ["".join(rng.choices("123456789", weights=weights, k=size))
+            for _ in range(size)]
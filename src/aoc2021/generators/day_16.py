@@ -0,0 +1,42 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 16: Packet Decoder puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of literal value packets in the transmission"
+SCALES = (100, 200, 400, 800, 1600, 3200)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a hexadecimal transmission holding a random tree of packets."""
+    bits = _encode_packet(literals=size, rng=rng)
+    bits += "0" * (-len(bits) % 8)
+    return [f"{int(bits, 2):0{len(bits) // 4}X}"]
+
+
+def _encode_packet(literals: int, rng: random.Random) -> str:
+    """Encode a packet containing (directly or not) a number of literal values."""
+    header = f"{rng.randrange(8):03b}"
+    if literals == 1 and rng.random() < 0.8:
+        return header + "100" + _encode_literal(value=rng.randrange(2 ** 12))
+    if literals == 1:
+        type_id, splits = rng.choice([0, 1, 2, 3]), [1]
+    else:  # Comparisons (type IDs 5 to 7) only between small, two-packet groups:
+        type_id = rng.choice([0, 1, 2, 3] + [5, 6, 7] * (literals <= 4))
+        parts = rng.randint(2, min(literals, 5)) if type_id < 5 else 2
+        cuts = sorted(rng.sample(range(1, literals), k=parts - 1))
+        splits = [b - a for a, b in zip([0] + cuts, cuts + [literals])]
+    sub_packets = "".join(_encode_packet(literals=n, rng=rng) for n in splits)
+    if len(sub_packets) < 2 ** 15:
+        return f"{header}{type_id:03b}0{len(sub_packets):015b}{sub_packets}"
+    return f"{header}{type_id:03b}1{len(splits):011b}{sub_packets}"
+
+
+def _encode_literal(value: int) -> str:
+    """Encode an integer value in 4-bit groups, all but the last one prefixed by 1."""
+    digits = f"{value:b}"
+    digits = "0" * (-len(digits) % 4) + digits
+    groups = [digits[i:i + 4] for i in range(0, len(digits), 4)]
+    return "".join(f"{int(i < len(groups) - 1)}{group}" for i, group in enumerate(groups))
@@ -0,0 +1,25 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 17: Trick Shot puzzle."""
+
+# Standard library imports:
+from math import isqrt
+import random
+
+# Set constants:
+SIZE = "depth of the bottom of the target area"
+SCALES = (25, 50, 75, 100, 150)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a target area below the launcher that a probe can drop vertically into.
+
+    The horizontal range always holds a triangular number, so some probes stop moving
+    forward right above the target area (as in the real puzzle inputs).
+    """
+    steps = rng.randint(2, 2 + isqrt(size))
+    stop_x = steps * (steps + 1) // 2
+    min_x = stop_x - rng.randint(0, steps - 1)
+    max_x = stop_x + rng.randint(0, 2 * steps)
+    min_y = -max(size, 2)
+    max_y = min_y + rng.randint(1, -min_y // 2)
+    return [f"target area: x={min_x}..{max_x}, y={min_y}..{max_y}"]
@@ -0,0 +1,22 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 18: Snailfish puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of snailfish numbers"
+SCALES = (25, 50, 100, 200)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate reduced snailfish numbers, with pairs nested at most four levels."""
+    return [_generate_pair(depth=1, rng=rng) for _ in range(size)]
+
+
+def _generate_pair(depth: int, rng: random.Random) -> str:
+    """Generate a pair whose elements are regular numbers or (not too deep) pairs."""
+    elements = [_generate_pair(depth=depth + 1, rng=rng)
+                if depth < 4 and rng.random() < 0.7 else str(rng.randint(0, 9))
+                for _ in range(2)]
+    return f"[{elements[0]},{elements[1]}]"
@@ -0,0 +1,75 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 19: Beacon Scanner puzzle."""
+
+# Standard library imports:
+import random
+
+# Third party imports:
+import numpy
+
+# Local application imports:
+from aoc2021.day_19.tools import ScannerAligner
+
+# Set constants:
+SIZE = "number of scanners"
+SCALES = (2, 4, 8, 16)
+RANGE = 1000
+SHARED_BEACONS = 12
+OWN_BEACONS = 14
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate scanner reports, each one sharing 12 beacons with an earlier scanner.
+
+    Scanners are placed by stepping from an already placed one along a random axis
+    (away from the others), and each report lists every beacon within range, in a
+    random scanner orientation. Beacons are spread so that (as in real inputs) most
+    of them are only seen by one or two scanners.
+    """
+    scanners, links = [(0, 0, 0)], []
+    while len(scanners) < size:
+        parent = rng.choice(scanners)
+        axis, sign = rng.randrange(3), rng.choice([1, -1])
+        scanner = tuple(p + (sign * rng.randint(1000, 1200) if i == axis
+                             else rng.randint(-100, 100)) for i, p in enumerate(parent))
+        if not any(_sees(scanner=other, beacon=scanner) for other in scanners):
+            links.append((parent, scanner))
+            scanners.append(scanner)
+    beacons = set()
+    for parent, scanner in links:
+        shared = [(max(p, s) - RANGE, min(p, s) + RANGE) for p, s in zip(parent, scanner)]
+        beacons.update(_scatter(bounds=shared, n=SHARED_BEACONS, seen_by=2,
+                                scanners=scanners, rng=rng))
+    for scanner in scanners:
+        bounds = [(c - RANGE, c + RANGE) for c in scanner]
+        beacons.update(_scatter(bounds=bounds, n=OWN_BEACONS, seen_by=1,
+                                scanners=scanners, rng=rng))
+    rotations = list(ScannerAligner.get_cube_rotations())
+    lines = []
+    for i, scanner in enumerate(scanners):
+        rotation = rng.choice(rotations)
+        seen = [b for b in sorted(beacons) if _sees(scanner=scanner, beacon=b)]
+        rng.shuffle(seen)
+        lines += [""] * bool(i) + [f"--- scanner {i} ---"]
+        lines += [",".join(map(str, (rotation @ numpy.subtract(b, scanner)).tolist()))
+                  for b in seen]
+    return lines
+
+
+def _sees(scanner: tuple[int, int, int], beacon: tuple[int, int, int]) -> bool:
+    """Check if a beacon lies within the detection range of a scanner."""
+    return all(abs(b - s) <= RANGE for b, s in zip(beacon, scanner))
+
+
+def _scatter(bounds: list[tuple[int, int]], n: int, seen_by: int,
+             scanners: list[tuple[int, int, int]], rng: random.Random) -> list[tuple]:
+    """Scatter beacons within bounds, preferring places seen by few scanners."""
+    beacons = []
+    for attempt in range(100 * n):
+        beacon = tuple(rng.randint(*axis_bounds) for axis_bounds in bounds)
+        crowded = sum(_sees(scanner=s, beacon=beacon) for s in scanners) > seen_by
+        if not crowded or attempt >= 99 * n:
+            beacons.append(beacon)
+        if len(beacons) == n:
+            break
+    return beacons
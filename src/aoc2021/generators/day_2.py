@@ -0,0 +1,22 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 2: Dive! puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of course instructions"
+SCALES = (1000, 2000, 4000, 8000, 16000, 32000)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate course instructions that never take the submarine above the surface."""
+    depth, course = 0, []
+    for _ in range(size):
+        direction = rng.choice(["forward", "forward", "down", "up"])
+        distance = rng.randint(1, 9)
+        if direction == "up" and distance > depth:
+            direction = "down"
+        depth += distance if direction == "down" else -distance * (direction == "up")
+        course.append(f"{direction} {distance}")
+    return course
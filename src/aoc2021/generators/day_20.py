@@ -0,0 +1,22 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 20: Trench Map puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "side of the square input image"
+SCALES = (10, 20, 40, 80)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate an enhancement algorithm and an image with a finite count of lit pixels.
+
+    If an all-dark area lights up, an all-lit area must go dark, or the infinite image
+    would end up with infinite lit pixels.
+    """
+    algorithm = [rng.choice("#.") for _ in range(512)]
+    if algorithm[0] == "#":
+        algorithm[-1] = "."
+    image = ["".join(rng.choices("#.", k=size)) for _ in range(size)]
+    return ["".join(algorithm), ""] + image
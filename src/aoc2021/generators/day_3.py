@@ -0,0 +1,34 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 3: Binary Diagnostic puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of diagnostic report numbers"
+SCALES = (250, 500, 1000, 2000, 4000)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate distinct binary numbers for which both life support ratings exist.
+
+    Numbers fill a quarter to a half of their range (as in real inputs), and are drawn
+    again whenever a bit criteria would discard all remaining numbers.
+    """
+    size = max(size, 2)  # A lone number is discarded by the CO2 scrubber criteria.
+    bits = size.bit_length() + 1
+    while True:
+        numbers = [f"{n:0{bits}b}" for n in rng.sample(range(2 ** bits), k=size)]
+        if all(_has_rating(numbers=numbers, oxygen=oxygen) for oxygen in (True, False)):
+            return numbers
+
+
+def _has_rating(numbers: list[str], oxygen: bool) -> bool:
+    """Check if filtering numbers by a bit criteria ends with a single number."""
+    for i in range(len(numbers[0])):
+        ones = sum(n[i] == "1" for n in numbers)
+        target = str(int((ones >= len(numbers) - ones) == oxygen))
+        numbers = [n for n in numbers if n[i] == target]
+        if len(numbers) <= 1:
+            return len(numbers) == 1
+    return False
@@ -0,0 +1,21 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 4: Giant Squid puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of bingo boards"
+SCALES = (25, 50, 100, 200, 400)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate drawn numbers 0 to 99 (so every board wins) and 5x5 bingo boards."""
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    lines = [",".join(map(str, numbers))]
+    for _ in range(size):
+        board = rng.sample(range(100), k=25)
+        lines.append("")
+        lines.extend(" ".join(f"{n:>2}" for n in board[i:i + 5]) for i in range(0, 25, 5))
+    return lines
@@ -0,0 +1,29 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 5: Hydrothermal Venture puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of vent segments"
+SCALES = (100, 200, 400, 800, 1600)
+SIDE = 1000
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate horizontal, vertical and 45-degree diagonal vent segments."""
+    segments = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(SIDE), rng.randrange(SIDE)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        dx, dy = rng.choice([(dx, dy), (-dx, -dy)])
+        length = rng.randint(1, SIDE // 2)
+        length = min(length, *[_room(v, d) for v, d in ((x1, dx), (y1, dy)) if d])
+        x2, y2 = x1 + dx * length, y1 + dy * length
+        segments.append(f"{x1},{y1} -> {x2},{y2}")
+    return segments
+
+
+def _room(value: int, step: int) -> int:
+    """Provide how many steps fit between a coordinate and the map border."""
+    return SIDE - 1 - value if step > 0 else value
@@ -0,0 +1,14 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 6: Lanternfish puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of initial lanternfish"
+SCALES = (100, 1000, 10000, 100000)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate the internal timers (from 1 to 5) of the initial lanternfish."""
+    return [",".join(str(rng.randint(1, 5)) for _ in range(size))]
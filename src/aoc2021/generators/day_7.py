@@ -0,0 +1,14 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 7: The Treachery of Whales puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of crab submarines"
+SCALES = (100, 200, 400, 800)
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate horizontal crab positions, crowded towards the low end of the range."""
+    return [",".join(str(int(2 * size * rng.random() ** 2)) for _ in range(size))]
@@ -0,0 +1,30 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 8: Seven Segment Search puzzle."""
+
+# Standard library imports:
+import random
+
+# Set constants:
+SIZE = "number of display entries"
+SCALES = (5, 10, 20, 40)
+SEGMENTS = "abcdefg"
+DIGITS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf",
+          "abcdefg", "abcdfg")
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate entries of scrambled signal patterns and four output digits."""
+    return [_generate_entry(rng=rng) for _ in range(size)]
+
+
+def _generate_entry(rng: random.Random) -> str:
+    """Generate the patterns and outputs of a display with randomly crossed wires."""
+    wire_map = dict(zip(SEGMENTS, rng.sample(SEGMENTS, k=len(SEGMENTS))))
+
+    def scramble(digit: str) -> str:
+        """Encode a digit's segments with the crossed wires, in a random order."""
+        return "".join(rng.sample([wire_map[s] for s in digit], k=len(digit)))
+
+    patterns = [scramble(digit=digit) for digit in rng.sample(DIGITS, k=len(DIGITS))]
+    outputs = [scramble(digit=rng.choice(DIGITS)) for _ in range(4)]
+    return f"{' '.join(patterns)} | {' '.join(outputs)}"
@@ -0,0 +1,54 @@
+# coding=utf-8
+"""Generator of synthetic inputs for the Day 9: Smoke Basin puzzle."""
+
+# Standard library imports:
+from collections import deque
+import random
+
+# Set constants:
+SIZE = "side of the square height map"
+SCALES = (25, 50, 100, 200)
+BASIN_AREA = 45
+
+
+def generate(size: int, rng: random.Random) -> list[str]:
+    """Generate a height map of basins, each one sloping down to a single low point.
+
+    Basins grow together from random low points, ridges of 9s are raised wherever two
+    basins meet, and heights are the distances to the low point within each basin.
+    """
+    side = max(size, 10)
+    cells = [(i, j) for i in range(side) for j in range(side)]
+    lows, basins = set(), max(3, side * side // BASIN_AREA)
+    for i, j in rng.sample(cells, k=len(cells)):
+        if len(lows) < basins and not lows & {(i - 1, j), (i + 1, j), (i, j - 1),
+                                              (i, j + 1)}:
+            lows.add((i, j))
+    lows = sorted(lows)
+    floors = [rng.randint(0, 3) for _ in lows]
+    owners, walls = _grow(sources=lows, side=side, walls=set()), set()
+    for i, j in cells:
+        for other in (i + 1, j), (i, j + 1):
+            if other in owners and owners[other][0] != owners[(i, j)][0]:
+                # The cell farthest from its low point is raised, so lows stay:
+                walls.add(max([(i, j), other], key=lambda cell: owners[cell][::-1]))
+    heights = _grow(sources=lows, side=side, walls=walls)
+    return ["".join(str(min(floors[heights[cell][0]] + heights[cell][1], 8))
+                    if cell in heights else "9" for cell in cells[i:i + side])
+            for i in range(0, len(cells), side)]
+
+
+def _grow(sources: list[tuple[int, int]], side: int, walls: set[tuple[int, int]]) \
+        -> dict[tuple[int, int], tuple[int, int]]:
+    """Grow basins from their low points, mapping cells to an owner and a distance."""
+    owners = {cell: (n, 0) for n, cell in enumerate(sources)}
+    queue = deque(sources)
+    while queue:
+        i, j = queue.popleft()
+        owner, distance = owners[(i, j)]
+        for cell in (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1):
+            if 0 <= min(cell) and max(cell) < side and cell not in owners \
+                    and cell not in walls:
+                owners[cell] = owner, distance + 1
+                queue.append(cell)
+    return owners
@@ -0,0 +1,195 @@
+# coding=utf-8
+"""Tools for keeping and reporting the timings of every solve and bench run."""
+
+# Standard library imports:
+from contextlib import closing
+from datetime import datetime, timezone
+from itertools import pairwise
+from pathlib import Path
+import sqlite3
+from statistics import median
+
+# Local application imports:
+from aoc2021.common import BASE_PATH, DAILY_NAMES, DEFAULT_ENGINE, AdventSolver, \
+    get_git_revision
+
+# Set constants:
+HISTORY_FILE = BASE_PATH.parents[1] / ".cache" / "history.sqlite3"
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, kind TEXT NOT NULL,
+        day INTEGER NOT NULL, git_revision TEXT, memory_bytes INTEGER,
+        engine TEXT NOT NULL DEFAULT 'reference');
+    CREATE TABLE IF NOT EXISTS timings (
+        run_id INTEGER NOT NULL REFERENCES runs (id), phase TEXT NOT NULL,
+        duration_ns INTEGER NOT NULL, PRIMARY KEY (run_id, phase));
+    CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, id);
+"""
+
+
+class AdventHistory:
+    """Manage a local SQLite database with the timings of every solve and bench run.
+
+    Each run stores its day, kind ("solve" or "bench"), engine, git revision,
+    timestamp and peak memory, with the duration of the whole run (as phase "total")
+    and of each of its phases. Bench runs store the median durations of their samples.
+    """
+    def __init__(self, file_path: Path = HISTORY_FILE, threshold: float = 0.25,
+                 window: int = 5, engine: str = DEFAULT_ENGINE):
+        if threshold < 0 or window <= 0:
+            raise ValueError("Invalid history setup!")
+        self.file_path = Path(file_path)
+        self.threshold = threshold  # Relative change between commits seen as a step.
+        self.window = window  # Number of latest runs compared with those before.
+        self.engine = engine  # Engine whose runs are reported.
+        self._git_revision = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if missing."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.file_path, timeout=30)
+        connection.executescript(SCHEMA)
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(runs)")]
+        if "engine" not in columns:  # Databases made before engines existed.
+            connection.execute("ALTER TABLE runs ADD COLUMN engine TEXT NOT NULL "
+                               "DEFAULT 'reference'")
+        return connection
+
+    @property
+    def git_revision(self) -> str | None:
+        """Provide the git revision of the sources, looked up once."""
+        if self._git_revision is None:
+            self._git_revision = get_git_revision() or ""
+        return self._git_revision or None
+
+    def record(self, day: int, kind: str, time_ns: int, phases_ns: dict[str, int],
+               memory_bytes: int = None, timestamp: datetime = None,
+               git_revision: str = None, engine: str = DEFAULT_ENGINE):
+        """Store a run of the target day, at the current time and git revision."""
+        timestamp = timestamp or datetime.now(tz=timezone.utc)
+        git_revision = git_revision or self.git_revision
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (timestamp, kind, day, git_revision, memory_bytes, "
+                "engine) VALUES (?, ?, ?, ?, ?, ?)",
+                (timestamp.isoformat(timespec="seconds"), kind, day, git_revision,
+                 memory_bytes, engine))
+            connection.executemany(
+                "INSERT INTO timings (run_id, phase, duration_ns) VALUES (?, ?, ?)",
+                [(cursor.lastrowid, phase, int(duration))
+                 for phase, duration in {"total": time_ns, **phases_ns}.items()])
+
+    def fetch_runs(self, day: int) -> list[dict]:
+        """Provide the recorded runs of the target day with this engine, oldest first."""
+        if not self.file_path.exists():
+            return []
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT runs.id, timestamp, kind, git_revision, memory_bytes, phase, "
+                "duration_ns FROM runs JOIN timings ON timings.run_id = runs.id "
+                "WHERE day = ? AND engine = ? ORDER BY runs.id, timings.rowid",
+                (day, self.engine)).fetchall()
+        runs = {}
+        for run_id, timestamp, kind, git_revision, memory, phase, duration in rows:
+            run = runs.setdefault(run_id, dict(
+                timestamp=timestamp, kind=kind, git_revision=git_revision,
+                memory_bytes=memory, phases_ns={}))
+            run["phases_ns"][phase] = duration
+        return list(runs.values())
+
+    def find_step_changes(self, runs: list[dict]) -> list[dict]:
+        """Find the commits after which the median total duration changed a lot.
+
+        Consecutive runs at the same git revision are grouped, and the median of each
+        group is compared with the one of the group before.
+        """
+        groups = []
+        for run in runs:
+            if not groups or groups[-1][0] != run["git_revision"]:
+                groups.append((run["git_revision"], []))
+            groups[-1][1].append(run["phases_ns"]["total"])
+        changes = []
+        for (previous, before), (revision, after) in pairwise(groups):
+            before_ns, after_ns = median(before), median(after)
+            change = after_ns / before_ns - 1
+            if abs(change) > self.threshold:
+                changes.append(dict(revision=revision, previous=previous,
+                                    before_ns=before_ns, after_ns=after_ns,
+                                    change=change))
+        return changes
+
+    def summarise(self, runs: list[dict]) -> dict:
+        """Compute the trend, best and worst runs and median phases of a day's runs.
+
+        The trend is the change of the median total duration of the latest runs,
+        against the median of as many runs before them (None if too few runs).
+        """
+        totals = [run["phases_ns"]["total"] for run in runs]
+        latest, earlier = totals[-self.window:], totals[-2 * self.window:-self.window]
+        if len(totals) < 2 * self.window:
+            half = len(totals) // 2
+            latest, earlier = totals[half:], totals[:half]
+        phases = {}
+        for run in runs:
+            for phase, duration in run["phases_ns"].items():
+                if phase != "total":
+                    phases.setdefault(phase, []).append(duration)
+        return dict(
+            runs=len(runs), latest_ns=totals[-1], median_ns=median(totals),
+            trend=median(latest) / median(earlier) - 1 if earlier else None,
+            best=min(runs, key=lambda run: run["phases_ns"]["total"]),
+            worst=max(runs, key=lambda run: run["phases_ns"]["total"]),
+            phases_ns={phase: median(values) for phase, values in phases.items()},
+            step_changes=self.find_step_changes(runs=runs))
+
+    def print_report(self, day: int = None):
+        """Print the timing history of the target day, or of every day with runs."""
+        days = range(1, len(DAILY_NAMES) + 1) if day is None else [day]
+        reported = False
+        for target_day in days:
+            runs = self.fetch_runs(day=target_day)
+            if runs or day is not None:
+                self.print_day(day=target_day, runs=runs)
+                reported = True
+        if not reported:
+            print(f"No runs recorded yet in {self.file_path}.")
+
+    def print_day(self, day: int, runs: list[dict]):
+        """Print the trend, best and worst runs and step changes of the target day."""
+        engine = "" if self.engine == DEFAULT_ENGINE else f" ({self.engine} engine)"
+        print(DAILY_NAMES[day - 1] + engine)
+        if not runs:
+            print("    No runs recorded yet.")
+            return
+        summary = self.summarise(runs=runs)
+        trend = "" if summary["trend"] is None else \
+            f", trend {summary['trend']:+.1%} over the latest runs"
+        print(f"    {summary['runs']} runs: latest {_format_ns(summary['latest_ns'])}, "
+              f"median {_format_ns(summary['median_ns'])}{trend}.")
+        for label in "best", "worst":
+            run = summary[label]
+            print(f"    {label.capitalize()}: {_format_ns(run['phases_ns']['total'])} "
+                  f"({run['kind']} at {_format_revision(run['git_revision'])}, "
+                  f"{run['timestamp']}).")
+        if summary["phases_ns"]:
+            print("    Median by phase: " + " | ".join(
+                f"{phase} {_format_ns(value)}"
+                for phase, value in summary["phases_ns"].items()))
+        for step in summary["step_changes"]:
+            print(f"    Step change at {_format_revision(step['revision'])}: "
+                  f"{_format_ns(step['before_ns'])} -> {_format_ns(step['after_ns'])} "
+                  f"({step['change']:+.1%} since "
+                  f"{_format_revision(step['previous'])}).")
+
+
+def _format_ns(value: float) -> str:
+    """Format a time value in nanoseconds into a time string with sensitive units."""
+    return AdventSolver.format_timing(value=value / 1e9)
+
+
+def _format_revision(revision: str | None) -> str:
+    """Shorten a git revision (keeping its dirty flag), or name it unknown."""
+    if revision is None:
+        return "unknown revision"
+    commit, dirty, _ = revision.partition("-dirty")
+    return commit[:10] + dirty
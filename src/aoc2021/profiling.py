@@ -0,0 +1,157 @@
+# coding=utf-8
+"""Tools for profiling the execution of the daily puzzle solutions."""
+
+# Standard library imports:
+from collections import Counter, defaultdict
+import cProfile
+import io
+import os
+from pathlib import Path
+import pstats
+import subprocess
+import sys
+
+# Local application imports:
+from aoc2021.common import BASE_PATH, DAILY_NAMES, AdventSolver, import_solution
+
+# Set constants:
+PROFILES_PATH = BASE_PATH.parents[1] / "profiles"
+
+
+class AdventProfiler:
+    """Manage cProfile-based profiling of puzzle solving tasks."""
+    def __init__(self, top: int = 20, output_path: Path = PROFILES_PATH,
+                 collapsed: bool = False):
+        self.top = top
+        self.output_path = Path(output_path)
+        self.collapsed = collapsed
+
+    def profile_day(self, day: int) -> pstats.Stats | None:
+        """Run the target day's solution under cProfile, and write the report files."""
+        module = import_solution(day=day)
+        if module is None:
+            return None
+        profiler = cProfile.Profile()
+        profiler.runcall(module.compute_solution)
+        stats = pstats.Stats(profiler)
+        self._write_files(day=day, stats=stats)
+        return stats
+
+    def print_day(self, day: int):
+        """Profile the target day's solution and print where its reports were written."""
+        print(DAILY_NAMES[day - 1])
+        if self.profile_day(day=day) is None:
+            print("    The puzzle remains unsolved!")
+            return
+        for suffix in (".pstats", ".txt") + ((".collapsed",) if self.collapsed else ()):
+            print(f"    Written {self.output_path / f'day_{day}{suffix}'}")
+
+    def _write_files(self, day: int, stats: pstats.Stats):
+        """Dump raw stats, a text summary and (optionally) collapsed stacks to files."""
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        file_path = self.output_path / f"day_{day}"
+        stats.dump_stats(file_path.with_suffix(".pstats"))
+        with open(file_path.with_suffix(".txt"), mode="w", encoding="utf-8") as file:
+            file.write(self._summarise(stats=stats))
+        if self.collapsed:
+            lines = [f"{stack} {value}\n" for stack, value in collapse_stacks(stats)]
+            with open(file_path.with_suffix(".collapsed"), mode="w",
+                      encoding="utf-8") as file:
+                file.writelines(lines)
+
+    def _summarise(self, stats: pstats.Stats) -> str:
+        """Build a text summary of the top functions by cumulative and by total time."""
+        stream = io.StringIO()
+        stats.stream = stream
+        for sort_key in ("cumulative", "tottime"):
+            stream.write(f"Top {self.top} functions sorted by '{sort_key}':\n")
+            stats.sort_stats(sort_key).print_stats(self.top)
+        return stream.getvalue()
+
+
+class AdventImportTimer:
+    """Manage the measurement of module import costs, using '-X importtime' data."""
+    def __init__(self, top: int = 20):
+        self.top = top
+
+    def measure(self, day: int = -1) -> list[tuple[str, int, int]]:
+        """Import the CLI (and a day's solution) in a fresh interpreter, timing modules.
+
+        Each item in the returned list contains the name, own import time and
+        cumulative import time (in microseconds) of an imported module.
+        """
+        modules = [f"{BASE_PATH.name}.__main__"]
+        if day != -1:
+            modules.append(f"{BASE_PATH.name}.day_{day}.solution")
+        python_path = [str(BASE_PATH.parent), os.environ.get("PYTHONPATH", "")]
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             "; ".join(f"import {module}" for module in modules)],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(python_path)})
+        return parse_import_times(lines=process.stderr.splitlines())
+
+    def print_report(self, day: int = -1):
+        """Print the total import time and the modules that are slowest to import."""
+        print("Import times for the command line interface" +
+              (f" and {DAILY_NAMES[day - 1]}" if day != -1 else ""))
+        times = self.measure(day=day)
+        total = sum(own for _, own, _ in times)
+        print(f"    Total: {self._format_us(value=total)} in {len(times)} modules.")
+        print(f"    Top {self.top} modules by cumulative import time:")
+        for name, own, cumulative in sorted(times, key=lambda t: -t[2])[:self.top]:
+            print(f"    {self._format_us(value=cumulative):>11} cumulative | "
+                  f"{self._format_us(value=own):>11} own | {name}")
+
+    @staticmethod
+    def _format_us(value: int) -> str:
+        """Format a time value in microseconds into a time string with sensitive units."""
+        return AdventSolver.format_timing(value=value / 1e6)
+
+
+def parse_import_times(lines: list[str]) -> list[tuple[str, int, int]]:
+    """Extract the module names and own/cumulative import times of '-X importtime'."""
+    times = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue  # Not an import time line, or the header line.
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times.append((name.strip(), int(own), int(cumulative)))
+    return times
+
+
+def collapse_stacks(stats: pstats.Stats, min_time: float = 1e-6) \
+        -> list[tuple[str, int]]:
+    """Approximate 'frame;frame;frame microseconds' flame graph lines from a profile.
+
+    cProfile only records caller-callee pairs, so the own time of each function is
+    split between its call stacks proportionally to the time spent through each one.
+    """
+    raw_stats = stats.stats  # noqa
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees[caller][func] = edge_time
+    collapsed = Counter()
+
+    def walk(func: tuple, stack: tuple[str, ...], share: float):
+        """Attribute a share of the own time of a function to the current stack."""
+        stack = stack + (_label(func=func),)
+        collapsed[";".join(stack)] += raw_stats[func][2] * share
+        for callee, edge_time in callees[func].items():
+            callee_total = raw_stats[callee][3]
+            callee_share = share * edge_time / callee_total if callee_total else 0
+            if _label(func=callee) in stack or callee_share * callee_total < min_time:
+                continue  # Skip recursive calls and negligible branches.
+            walk(func=callee, stack=stack, share=callee_share)
+
+    for root in [func for func, values in raw_stats.items() if not values[4]]:
+        walk(func=root, stack=(), share=1.0)
+    return [(stack, round(value * 1e6)) for stack, value in collapsed.items()
+            if round(value * 1e6) > 0]
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    """Build a flame-graph-friendly name for a profiled function."""
+    file_name, line, name = func
+    return f"{name} ({Path(file_name).name}:{line})".replace(";", ",")
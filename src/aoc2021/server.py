@@ -0,0 +1,190 @@
+# coding=utf-8
+"""Tools for serving puzzle solving requests from a warm, long-lived process."""
+
+# Standard library imports:
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import tempfile
+from time import perf_counter_ns
+
+# Local application imports:
+from aoc2021.benchmark import AdventBenchmark
+from aoc2021.common import DAILY_NAMES, DEFAULT_ENGINE, YEAR, AdventSolver, \
+    get_engine, import_solution, pop_phase_timings, use_engine, use_input_file
+
+# Set constants:
+SOCKET_PATH = Path(tempfile.gettempdir()) / f"aoc{YEAR}.sock"
+ACTIONS = ("solve", "bench", "ping", "stop")
+
+
+class AdventServer:
+    """Manage a warm process answering solve and bench requests over a Unix socket.
+
+    Requests and responses are JSON objects, one per line. Requests are handled one
+    at a time, so solutions never share the process (nor their phase timings).
+    """
+    def __init__(self, socket_path: Path = SOCKET_PATH, verbose: bool = True,
+                 engine: str = DEFAULT_ENGINE):
+        self.socket_path = Path(socket_path)
+        self.verbose = verbose
+        self.solver = AdventSolver(engine=engine)
+        self._stopping = False
+
+    def preload(self) -> list[int]:
+        """Import every built solution (and its dependencies), providing their days."""
+        return [day for day in range(1, len(DAILY_NAMES) + 1)
+                if import_solution(day=day) is not None]
+
+    def serve(self):
+        """Answer requests until a stop request is received."""
+        days = self.preload()
+        self._claim_socket_path()
+        with socketserver.UnixStreamServer(str(self.socket_path), _RequestHandler) \
+                as server:
+            server.advent_server = self
+            self._log(f"Serving days {days} at {self.socket_path}")
+            try:
+                while not self._stopping:
+                    server.handle_request()
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+        self._log("Stopped.")
+
+    def _claim_socket_path(self):
+        """Remove the socket file left by a dead server, failing if one is alive."""
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.socket_path.unlink(missing_ok=True)
+                return
+        raise RuntimeError(f"A server is already listening at {self.socket_path}.")
+
+    def answer(self, request: dict) -> dict:
+        """Handle a request, providing the response with its latency in nanoseconds."""
+        start = perf_counter_ns()
+        try:
+            result = self._dispatch(request=request)
+        except Exception as error:
+            response = dict(ok=False, error=repr(error))
+        else:
+            response = dict(ok=True, result=result)
+        response["latency_ns"] = perf_counter_ns() - start
+        latency = AdventSolver.format_timing(value=response["latency_ns"] / 1e9)
+        label = " ".join(str(request[key]) for key in ("action", "day") if key in request)
+        self._log(f"{label or '?'}: {latency}" +
+                  ("" if response["ok"] else f" ({response['error']})"))
+        return response
+
+    def _dispatch(self, request: dict) -> dict | None:
+        """Run the action of a request, providing its result."""
+        action = request.get("action", "solve")
+        if action not in ACTIONS:  # Client input: checked even when asserts are off.
+            raise ValueError(f"Unknown '{action}' action!")
+        if action == "ping":
+            return dict(pid=os.getpid())
+        elif action == "stop":
+            self._stopping = True
+            return None
+        if request.get("day", None) is None:
+            raise ValueError(f"The '{action}' action requires a day!")
+        day = int(request["day"])
+        if not 1 <= day <= len(DAILY_NAMES):
+            raise ValueError(f"Unknown day {day}!")
+        if action == "bench":
+            benchmark = AdventBenchmark(runs=request.get("runs", 10),
+                                        warmup=request.get("warmup", 1),
+                                        engine=self.solver.get_engine_name(day=day))
+            if (stats := benchmark.measure_day(day=day)) is None:
+                raise ValueError(f"Day {day} is not solved yet!")
+            return stats
+        return self._solve(day=day, lines=request.get("lines", None),
+                           input_path=request.get("input", None))
+
+    def _solve(self, day: int, lines: list[str] = None, input_path: str = None) -> dict:
+        """Solve the target day for its puzzle input, another input file or raw lines."""
+        if lines is None:
+            if input_path is None:
+                return self.solver.build_record(day, *self.solver.solve_day(day=day))
+            with use_input_file(day=day, file_path=Path(input_path)):
+                return self.solver.build_record(day, *self.solver.solve_day(day=day))
+        if import_solution(day=day) is None:
+            raise ValueError(f"Day {day} is not solved yet!")
+        pop_phase_timings()
+        start = perf_counter_ns()
+        with use_engine(day=day, name=self.solver.get_engine_name(day=day)):
+            solutions = get_engine(day=day)(lines=lines)
+        time_ns = perf_counter_ns() - start
+        return self.solver.build_record(day, *solutions, time_ns, None,
+                                        pop_phase_timings())
+
+    def _log(self, message: str):
+        """Print a message about the server activity, if verbose."""
+        if self.verbose:
+            print(message, flush=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer each JSON line received on a connection with a JSON line."""
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as error:
+                response = dict(ok=False, error=repr(error), latency_ns=0)
+            else:
+                response = self.server.advent_server.answer(request=request)
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class AdventClient:
+    """Manage requests sent to a warm AdventServer over its Unix socket."""
+    def __init__(self, socket_path: Path = SOCKET_PATH, timeout: float = None):
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    def request(self, action: str = "solve", **fields) -> dict:
+        """Send a request and wait for its response, adding the round-trip time."""
+        start = perf_counter_ns()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(self.timeout)
+            connection.connect(str(self.socket_path))
+            message = json.dumps(dict(action=action, **fields)) + "\n"
+            connection.sendall(message.encode("utf-8"))
+            with connection.makefile(mode="r", encoding="utf-8") as stream:
+                response = json.loads(stream.readline())
+        response["round_trip_ns"] = perf_counter_ns() - start
+        return response
+
+    def print_request(self, action: str = "solve", **fields) -> bool:
+        """Send a request and print its response, returning False if it failed."""
+        response = self.request(action=action, **fields)
+        day = fields.get("day", None)
+        if day is not None and 1 <= day <= len(DAILY_NAMES):
+            title = DAILY_NAMES[day - 1]
+        else:
+            title = f"Request: {action}" + ("" if day is None else f" for day {day}")
+        if action == "bench" and response["ok"]:
+            AdventBenchmark().print_day(day=day, stats=response["result"])
+        else:
+            print(title)
+        if not response["ok"]:
+            print(f"    Error: {response['error']}")
+        elif action == "solve":
+            for ordinal, key in ("first", "solution_1"), ("second", "solution_2"):
+                if (solution := response["result"][key]) is None:
+                    print(f"    The {ordinal} puzzle remains unsolved!")
+                else:
+                    print(f"    The {ordinal} solution is {solution}.")
+        elif action == "ping":
+            print(f"    Server process {response['result']['pid']} is alive.")
+        latencies = [AdventSolver.format_timing(value=response[key] / 1e9)
+                     for key in ("latency_ns", "round_trip_ns")]
+        print(f"    Served in {latencies[0]} ({latencies[1]} round trip).")
+        return response["ok"]
@@ -0,0 +1,65 @@
+# coding=utf-8
+"""Tests for the batch solving of many puzzle inputs."""
+
+# Standard library imports:
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+# Local application imports:
+from aoc2021.batch import AdventBatch
+from aoc2021.day_1.solution import solve_lines
+from aoc2021.generators import generate_input, write_input
+
+
+class BatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_paths = [
+            write_input(day=1, size=100, seed=seed,
+                        file_path=Path(temp_dir.name) / f"input_{seed}.txt")
+            for seed in range(3)]
+        self.bad_path = Path(temp_dir.name) / "bad.txt"
+        self.bad_path.write_text("deep\n")
+        self.batch = AdventBatch(workers=1)
+
+    def test_each_input_gets_its_answers(self):
+        """Each input file is solved in order, as if its lines were solved directly."""
+        results = list(self.batch.solve_inputs(day=1, file_paths=self.file_paths))
+        expected = [solve_lines(lines=generate_input(day=1, size=100, seed=seed))
+                    for seed in range(3)]
+        self.assertEqual([str(path) for path in self.file_paths],
+                         [result["input"] for result in results])
+        self.assertEqual(expected, [(result["solution_1"], result["solution_2"])
+                                    for result in results])
+        self.assertEqual(["parse", "part1", "part2"], list(results[0]["phases_ns"]))
+
+    def test_failed_inputs_are_reported(self):
+        """An invalid input gets an error result, and counts as failed."""
+        results = list(self.batch.solve_inputs(
+            day=1, file_paths=[self.bad_path, self.file_paths[0]]))
+        self.assertEqual(["error", "solved"], [result["status"] for result in results])
+        summary = self.batch.summarise(results=results, wall_ns=10 ** 9)
+        self.assertEqual((2, 1, 2.0), (summary["inputs"], summary["errors"],
+                                       summary["throughput"]))
+
+    def test_inputs_are_solved_by_the_chosen_engine(self):
+        """Inputs are solved by the chosen engine where offered, else the reference."""
+        batch = AdventBatch(workers=1, engine="numpy")
+        results = [*batch.solve_inputs(day=1, file_paths=self.file_paths[:1]),
+                   *batch.solve_inputs(day=3, file_paths=self.file_paths[:1])]
+        self.assertEqual(["numpy", "reference"], [result["engine"] for result in results])
+        self.assertEqual(solve_lines(lines=generate_input(day=1, size=100, seed=0)),
+                         (results[0]["solution_1"], results[0]["solution_2"]))
+
+    def test_inputs_path_must_be_a_folder(self):
+        """A file or a missing path given as the folder of inputs is refused."""
+        for path in self.file_paths[0], self.bad_path.with_name("missing"):
+            with self.assertRaises(ValueError):
+                self.batch.run(day=1, input_path=path)
+
+
+if __name__ == "__main__":
+    unittest.main()
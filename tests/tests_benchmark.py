@@ -0,0 +1,113 @@
+# coding=utf-8
+"""Tests for the puzzle benchmarking tools."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+import math
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+# Local application imports:
+from aoc2021.benchmark import AdventBenchmark, AdventScaling, fit_complexity
+from aoc2021.common import pop_phase_timings, timed_phase
+
+
+class StatisticsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.benchmark = AdventBenchmark(runs=5, threshold=0.1)
+        self.stats = self.benchmark.summarise(samples=[50, 10, 40, 20, 30])
+
+    def test_summary_statistics(self):
+        """Samples 10 to 50 have min 10, median 30, p95 48 and stddev 14."""
+        expected = dict(runs=5, min_ns=10, median_ns=30, p95_ns=48, stddev_ns=14)
+        self.assertEqual(expected, self.stats)
+
+    def test_single_sample_summary(self):
+        """A single sample is its own min, median and p95, with no deviation."""
+        stats = self.benchmark.summarise(samples=[7])
+        self.assertEqual(dict(runs=1, min_ns=7, median_ns=7, p95_ns=7, stddev_ns=0),
+                         stats)
+
+    def test_regression_beyond_threshold(self):
+        """A median 10 % slower is tolerated, but a slower one is a regression."""
+        self.assertFalse(self.benchmark.is_regression(self.stats, dict(median_ns=28)))
+        self.assertTrue(self.benchmark.is_regression(self.stats, dict(median_ns=27)))
+
+    def test_invalid_setups_are_refused(self):
+        """Benchmarks and scaling curves without timed runs raise a ValueError."""
+        for setup in (lambda: AdventBenchmark(runs=0), lambda: AdventScaling(runs=0),
+                      lambda: AdventBenchmark(warmup=-1)):
+            with self.assertRaises(ValueError):
+                setup()
+
+
+class PhaseTimingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        pop_phase_timings()
+
+    def test_phases_are_accumulated_and_reset(self):
+        """Repeated phases add up, are given in phase order and are reset once popped."""
+        for name in "part2", "parse", "part2":
+            with timed_phase(name):
+                pass
+        self.assertEqual(["parse", "part2"], list(pop_phase_timings()))
+        self.assertEqual({}, pop_phase_timings())
+
+    def test_benchmark_reports_median_phases(self):
+        """Benchmarking a day provides the median time of each of its phases."""
+        stats = AdventBenchmark(runs=2, warmup=0).measure_day(day=1)
+        self.assertEqual(["parse", "part1", "part2"], list(stats["phases"]))
+        self.assertLessEqual(sum(stats["phases"].values()), stats["p95_ns"])
+
+    def test_unsolved_days_are_reported(self):
+        """Benchmarking an unsolved day says so, without writing a baseline."""
+        with TemporaryDirectory() as temp_dir:
+            baseline_file = Path(temp_dir) / "baseline.json"
+            benchmark = AdventBenchmark(runs=1, warmup=0, baseline_file=baseline_file)
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual([], benchmark.run(days=[21]))
+            self.assertFalse(baseline_file.exists())
+        self.assertEqual("Day 21: Dirac Dice\n    The puzzle remains unsolved!\n",
+                         output.getvalue())
+
+
+class ComplexityFitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.sizes = [1_000, 2_000, 4_000, 8_000, 16_000, 32_000]
+
+    def _fit(self, function) -> dict:
+        """Fit the complexity of times following a function of the input size."""
+        points = [dict(size=n, time_ns=round(function(n))) for n in self.sizes]
+        return fit_complexity(points=points)
+
+    def test_linear_times(self):
+        """Times proportional to the input size fit O(n), with exponent 1."""
+        fit = self._fit(function=lambda n: 50 * n)
+        self.assertEqual("O(n)", fit["model"])
+        self.assertAlmostEqual(1, fit["exponent"], places=3)
+
+    def test_linearithmic_times(self):
+        """Times proportional to n log n fit O(n log n), despite noise."""
+        noise = [1.05, 0.97, 1.02, 0.96, 1.04, 0.99]
+        fit = self._fit(function=lambda n: n * math.log(n) * noise.pop(0))
+        self.assertEqual("O(n log n)", fit["model"])
+
+    def test_quadratic_times(self):
+        """Times proportional to the squared input size fit O(n²), with exponent 2."""
+        fit = self._fit(function=lambda n: 3 * n ** 2)
+        self.assertEqual("O(n²)", fit["model"])
+        self.assertAlmostEqual(2, fit["exponent"], places=3)
+
+    def test_degenerate_sizes_and_times(self):
+        """Sizes of 1 and times of 0 ns are fitted, but a single size is refused."""
+        points = [dict(size=1, time_ns=0), dict(size=1, time_ns=5),
+                  dict(size=2, time_ns=0)]
+        fit = fit_complexity(points=points)
+        self.assertIn(fit["model"], fit["errors"])
+        with self.assertRaises(ValueError):
+            fit_complexity(points=[dict(size=1, time_ns=10), dict(size=1, time_ns=12)])
@@ -0,0 +1,93 @@
+# coding=utf-8
+"""Tests for the on-disk caches of results and parsed arrays."""
+
+# Standard library imports:
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+# Third party imports:
+import numpy
+
+# Local application imports:
+from aoc2021.cache import ParseCache, ResultCache
+from aoc2021.common import cached_parse, use_parse_cache
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.temp_dir = TemporaryDirectory()
+        self.cache = ResultCache(path=Path(self.temp_dir.name), max_size=200)
+
+    def tearDown(self) -> None:
+        """Remove all files created during the tests."""
+        self.temp_dir.cleanup()
+
+    def test_stored_values_are_served(self):
+        """Stored values (numpy scalars included) come back as built-in values."""
+        self.cache.put(key="a", value=[numpy.int64(5), "ABC", "1.2 ms", ""])
+        self.assertEqual([5, "ABC", "1.2 ms", ""], self.cache.get(key="a"))
+
+    def test_missing_values_are_none(self):
+        """Keys never stored provide no value."""
+        self.assertIsNone(self.cache.get(key="missing"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """When the size limit is exceeded, the entry used longest ago is removed."""
+        for n, key in enumerate(["old", "used", "new"]):
+            self.cache.put(key=key, value="x" * 80)
+            os.utime(Path(self.temp_dir.name) / f"{key}.json", times=(n, n))
+        self.cache.get(key="used")
+        self.cache.put(key="newest", value="x" * 80)
+        self.assertIsNone(self.cache.get(key="old"))
+        self.assertIsNone(self.cache.get(key="new"))
+        self.assertIsNotNone(self.cache.get(key="used"))
+        self.assertIsNotNone(self.cache.get(key="newest"))
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.temp_dir = TemporaryDirectory()
+        self.cache = ParseCache(path=Path(self.temp_dir.name))
+        self.calls = []
+
+        @cached_parse
+        def parse_digits(rows: list[str], offset: int = 0) -> numpy.ndarray:
+            self.calls.append(rows)
+            return numpy.array([list(map(int, row)) for row in rows]) + offset
+        self.parse_digits = parse_digits
+
+    def tearDown(self) -> None:
+        """Remove all files created during the tests."""
+        self.temp_dir.cleanup()
+
+    def test_stored_arrays_are_memory_mapped_copies(self):
+        """Stored arrays come back memory-mapped, and can be changed in memory only."""
+        self.cache.put(key="a", value=numpy.arange(6).reshape(2, 3))
+        array = self.cache.get(key="a")
+        self.assertIsInstance(array, numpy.memmap)
+        array[0, 0] = 9
+        numpy.testing.assert_array_equal(numpy.arange(6).reshape(2, 3),
+                                         self.cache.get(key="a"))
+
+    def test_parsers_reuse_arrays_of_same_lines(self):
+        """With a cache in use, the same lines and arguments are parsed only once."""
+        with use_parse_cache(cache=self.cache):
+            first = self.parse_digits(rows=["12", "34"])
+            second = self.parse_digits(["12", "34"])
+            shifted = self.parse_digits(rows=["12", "34"], offset=1)
+            other = self.parse_digits(rows=["12", "35"])
+        numpy.testing.assert_array_equal(first, second)
+        numpy.testing.assert_array_equal([[2, 3], [4, 5]], shifted)
+        self.assertEqual(5, other[1, 1])
+        self.assertEqual(3, len(self.calls))
+
+    def test_parsers_without_cache_always_parse(self):
+        """Without a cache in use, decorated parsers parse every time."""
+        for _ in range(2):
+            self.parse_digits(rows=["12", "34"])
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual([], list(Path(self.temp_dir.name).iterdir()))
@@ -0,0 +1,147 @@
+# coding=utf-8
+"""Tests for the README puzzle calendar writer."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import shutil
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+# Local application imports:
+from aoc2021.cache import ResultCache
+from aoc2021.common import DAILY_NAMES, AdventCalendar, AdventSolver, fingerprint_day
+
+
+class CalendarTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.readme = Path(temp_dir.name) / "README.md"
+        shutil.copyfile(AdventCalendar._readme_file, self.readme)
+        self.fingerprints = Path(temp_dir.name) / "calendar_fingerprints.json"
+        for name, path in ("_readme_file", self.readme), \
+                ("_fingerprints_file", self.fingerprints):
+            patcher = mock.patch.object(AdventCalendar, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.original = self.readme.read_text(encoding="utf-8").splitlines()
+        self.calendar = AdventCalendar()
+
+    def _changed_lines(self) -> list[int]:
+        """Get the numbers of the README lines that differ from the original ones."""
+        lines = self.readme.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(self.original), len(lines))
+        return [n for n, (old, new) in enumerate(zip(self.original, lines)) if old != new]
+
+    def _register(self, *days: int) -> int:
+        """Register the target days, providing how many times a day was solved."""
+        solve_day = self.calendar.solver.solve_day
+        with mock.patch.object(self.calendar.solver, "solve_day", wraps=solve_day) \
+                as solve_day, redirect_stdout(io.StringIO()):
+            for day in days:
+                self.calendar.register_day(day=day)
+        return solve_day.call_count
+
+    def test_rendering_matches_readme(self):
+        """Rendering the loaded calendar from scratch reproduces the README table."""
+        rows = [self.calendar._build_cells(day=day) for day in range(1, 26)]
+        lines = self.calendar._table_as_lines(rows=[*rows, self.calendar._build_totals()])
+        start = self.calendar._table_start
+        self.assertEqual(self.original[start:start + 28],
+                         [line.removesuffix("\n") for line in lines])
+
+    def test_unchanged_calendar_is_not_rewritten(self):
+        """Writing a calendar without changes leaves the README file as it was."""
+        self.calendar._write_to_readme()
+        self.assertEqual([], self._changed_lines())
+
+    def test_only_changed_day_is_rewritten(self):
+        """Updating a day's timing only rewrites its row and the totals row."""
+        record = self.calendar.data[1]
+        self.calendar._fill_day(1, int(record["Solution 1"]), int(record["Solution 2"]),
+                                59_000_000_000, None, {})
+        self.calendar._write_to_readme()
+        start = self.calendar._table_start
+        self.assertEqual([start + 2, start + 27], self._changed_lines())
+        self.assertEqual("59.00 s", AdventCalendar().data[1]["Time"])
+
+    def test_wide_cell_widens_its_column(self):
+        """A cell wider than its column rewrites the table with a wider column."""
+        record, widths = self.calendar.data[2], self.calendar._widths
+        self.calendar._fill_day(2, int(record["Solution 1"]), int(record["Solution 2"]),
+                                2_000_000, 10 ** 120, {})
+        self.calendar._write_to_readme()
+        calendar = AdventCalendar()
+        self.assertEqual(self.calendar.data[2]["Memory"], calendar.data[2]["Memory"])
+        self.assertGreater(calendar._widths[-1], widths[-1])
+        self.assertEqual(self.calendar.data[3], calendar.data[3])
+
+    def test_phases_are_added_up_in_totals(self):
+        """The times of each phase are stored per day and added up in the totals."""
+        for record in self.calendar.data.values():
+            record["Phases"] = "-"
+        for day, phases in (1, dict(parse=1_000_000, part1=2_000_000)), \
+                (2, dict(parse=3_000_000, part2=4_000_000)):
+            record = self.calendar.data[day]
+            self.calendar._fill_day(day, int(record["Solution 1"]),
+                                    int(record["Solution 2"]), 10_000_000, None, phases)
+        self.calendar._write_to_readme()
+        calendar = AdventCalendar()
+        self.assertEqual("parse 1.00 ms, part1 2.00 ms", calendar.data[1]["Phases"])
+        self.assertEqual("**parse 4.00 ms, part1 2.00 ms, part2 4.00 ms**",
+                         self.calendar._build_totals()[6])
+
+    def test_parallel_registering_matches_serial(self):
+        """Registering with several workers writes the README once, like serially."""
+        text, rows = self.readme.read_text(encoding="utf-8"), {}
+        for workers in 1, 2:
+            self.readme.write_text(text, encoding="utf-8")
+            self.fingerprints.unlink(missing_ok=True)
+            with TemporaryDirectory() as temp_dir:
+                solver = AdventSolver(cache=ResultCache(path=Path(temp_dir)))
+                for day in range(3, 21):  # Workers solve days 1, 2 and unsolved days.
+                    solver.cache.put(key=fingerprint_day(day=day),
+                                     value=[day, -day, day, None, {}])
+                calendar = AdventCalendar(solver=solver)
+                write = calendar._write_to_readme
+                with mock.patch.object(calendar, "_write_to_readme", wraps=write) \
+                        as write, redirect_stdout(io.StringIO()):
+                    calendar.register_all_days(workers=workers)
+            self.assertEqual(1, write.call_count)
+            rows[workers] = {
+                day: {name: value for name, value in record.items()
+                      if name not in ("Time", "Memory", "Phases")}
+                for day, record in AdventCalendar().data.items()}
+        self.assertEqual(rows[1], rows[2])
+        self.assertEqual(len(DAILY_NAMES), len(rows[2]))
+        self.assertEqual(("1466", "1491", "-"),
+                         (rows[2][1]["Solution 1"], rows[2][1]["Solution 2"],
+                          rows[2][21]["Solution 1"]))
+
+    def test_unchanged_days_are_not_solved_again(self):
+        """Once registered, a day is skipped until its files change."""
+        self.assertEqual(1, self._register(1, 1))
+        self.assertEqual([1], list(AdventCalendar().fingerprints))
+        self.calendar.fingerprints[1] = "files changed since"
+        self.assertEqual(1, self._register(1))
+
+    def test_skipped_days_leave_files_untouched(self):
+        """Registering only unchanged days writes neither the README nor fingerprints."""
+        self._register(1)
+        stamps = [path.stat().st_mtime_ns for path in (self.readme, self.fingerprints)]
+        self._register(1)
+        self.assertEqual(stamps, [path.stat().st_mtime_ns
+                                  for path in (self.readme, self.fingerprints)])
+
+    def test_full_registers_solve_every_day(self):
+        """Registering without increments always solves the target days."""
+        self.calendar.incremental = False
+        self.assertEqual(2, self._register(1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,16 @@
 """Tests for the Day 1: Sonar Sweep puzzle."""
 
 # Standard library imports:
+from array import array
+from pathlib import Path
+from tempfile import TemporaryDirectory
 import unittest
 
+# Third party imports:
+import numpy
+
 # Local application imports:
-from aoc2021.day_1.tools import SonarReport
+from aoc2021.day_1.tools import SonarReport, SonarStream, VectorSonarReport
 
 
 class ExampleTests(unittest.TestCase):
@@ -13,6 +19,7 @@ class ExampleTests(unittest.TestCase):
         """Prepare objects to be tested."""
         measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
         self.report = SonarReport(measurements=measurements)
+        self.lazy_report = SonarReport.from_lines(lines=map(str, measurements))
 
     def test_direct_increments(self):
         """There are 7 increments in depth."""
@@ -21,3 +28,97 @@ class ExampleTests(unittest.TestCase):
     def test_sliding_increments(self):
         """There are 5 3-measurement-sliding-window increments in depth."""
         self.assertEqual(5, self.report.sliding_increments)
+
+    def test_increments_from_lazy_lines(self):
+        """Reports built lazily from text lines find the same increments."""
+        self.assertEqual(7, self.lazy_report.increments)
+        self.assertEqual(5, self.lazy_report.sliding_increments)
+
+
+class VectorExampleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Prepare objects to be tested."""
+        self.measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+        self.report = VectorSonarReport(measurements=self.measurements)
+
+    def test_direct_and_sliding_increments(self):
+        """There are 7 increments in depth, and 5 of 3-measurement windows."""
+        self.assertEqual(7, self.report.increments)
+        self.assertEqual(5, self.report.sliding_increments)
+
+    def test_any_window_matches_window_sums(self):
+        """Counting increments of any window gives the same as adding up windows."""
+        values = self.measurements
+        for k in range(1, len(values) + 2):
+            sums = [sum(values[i:i + k]) for i in range(len(values) - k + 1)]
+            expected = sum(new > last for last, new in zip(sums, sums[1:]))
+            self.assertEqual(expected, self.report.count_increments(window=k))
+
+    def test_arrays_are_accepted_directly(self):
+        """Reports take arrays and ndarrays of measurements, and parsed lines."""
+        for measurements in array("q", self.measurements), \
+                numpy.array(self.measurements, dtype=numpy.int32):
+            self.assertEqual(5, VectorSonarReport(measurements).sliding_increments)
+        lazy_report = VectorSonarReport.from_lines(lines=map(str, self.measurements))
+        self.assertEqual(7, lazy_report.increments)
+
+
+class StreamingExampleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Prepare objects to be tested."""
+        self.measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+        self.windows = range(1, len(self.measurements) + 2)
+        self.report = VectorSonarReport(measurements=self.measurements)
+
+    def test_all_windows_in_one_pass(self):
+        """A single pass over the depths counts the increments of every window."""
+        counts = SonarStream.count(source=iter(self.measurements), windows=self.windows)
+        self.assertEqual({k: self.report.count_increments(window=k)
+                          for k in self.windows}, counts)
+        self.assertEqual({1: 7, 3: 5}, SonarStream.count(source=self.measurements))
+
+    def test_depths_can_come_in_pieces(self):
+        """Depths fed over several updates count as one stream, in constant memory."""
+        stream = SonarStream(windows=(3, 1))
+        for start in range(0, len(self.measurements), 3):
+            counts = stream.update(depths=self.measurements[start:start + 3])
+        self.assertEqual({1: 7, 3: 5}, counts)
+        self.assertEqual(3, len(stream._ring))
+
+    def test_depths_can_come_from_a_file(self):
+        """Depths are read lazily from a file path, one per line."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "depths.txt"
+            file_path.write_text("\n".join(map(str, self.measurements)) + "\n\n")
+            self.assertEqual({1: 7, 3: 5}, SonarStream.count(source=file_path))
+            self.assertEqual({2: 5}, SonarStream.count(source=str(file_path),
+                                                       windows=[2]))
+
+
+class ParallelScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Prepare objects to be tested."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_path = Path(temp_dir.name) / "depths.txt"
+        generator = numpy.random.default_rng(seed=1)
+        self.measurements = generator.integers(100, 200, size=500).tolist()
+        self.file_path.write_text("\n".join(map(str, self.measurements)) + "\n")
+        self.windows = (1, 2, 3, 7)
+        self.expected = SonarStream.count(source=self.measurements, windows=self.windows)
+
+    def test_chunk_boundaries_lose_no_comparison(self):
+        """Any chunk size, even smaller than a line, gives the serial answers."""
+        for chunk_size in 1, 5, 64, 1000, 10 ** 6:
+            counts = SonarReport.count_file_increments(
+                file_path=self.file_path, windows=self.windows, workers=1,
+                chunk_size=chunk_size)
+            self.assertEqual(self.expected, counts)
+
+    def test_chunks_are_counted_by_a_process_pool(self):
+        """Chunks counted by several processes add up to the serial answers."""
+        counts = SonarReport.count_file_increments(
+            file_path=self.file_path, windows=self.windows, workers=2, chunk_size=256)
+        self.assertEqual(self.expected, counts)
+        self.assertEqual(self.expected[7],
+                         SonarReport(self.measurements).count_increments(window=7))
@@ -22,6 +22,7 @@ class ExampleTests(unittest.TestCase):
             "[<(<(<(<{}))><([]([]()",
             "<{([([[(<>()){}]>(<<{{",
             "<{([{{}}[<[[[<>{}]]]>[]]"]
+        self.lines = lines
         self.checker = SyntaxChecker(lines=lines)
 
     def test_corruption_score(self):
@@ -31,3 +32,9 @@ class ExampleTests(unittest.TestCase):
     def test_completion_score(self):
         """The total score for uncompleted lines is 288957."""
         self.assertEqual(288957, self.checker.completion_score)
+
+    def test_scores_from_lazy_lines(self):
+        """Lines can be consumed lazily, as a one-pass iterator."""
+        checker = SyntaxChecker(lines=iter(self.lines))
+        self.assertEqual(26397, checker.corruption_score)
+        self.assertEqual(288957, checker.completion_score)
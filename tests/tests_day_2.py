@@ -5,7 +5,8 @@
 import unittest
 
 # Local application imports:
-from aoc2021.day_2.tools import Submarine, AimSubmarine
+from aoc2021.day_2.tools import Submarine, AimSubmarine, ColumnarCourse, \
+    CourseIndex, parse_course
 
 
 class ExampleTests(unittest.TestCase):
@@ -29,3 +30,89 @@ class ExampleTests(unittest.TestCase):
         self.assertEqual(15, self.aim_submarine.horizontal)
         self.assertEqual(60, self.aim_submarine.depth)
         self.assertEqual(900, self.aim_submarine.total_movement)
+
+    def test_course_from_lazy_lines(self):
+        """Courses can be parsed lazily from 'direction distance' text lines."""
+        lines = iter(["forward 5", "down 5", "forward 8", "up 3", "down 8", "forward 2"])
+        submarine = AimSubmarine()
+        submarine.implement_course(course=parse_course(lines=lines))
+        self.assertEqual(900, submarine.total_movement)
+
+
+class ColumnarExampleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Prepare objects to be tested."""
+        self.course = [("forward", 5), ("down", 5), ("forward", 8), ("up", 3),
+                       ("down", 8), ("forward", 2)]
+        self.columns = ColumnarCourse.from_course(course=self.course)
+
+    def test_columns_are_coded(self):
+        """Directions are coded as int8 values, and distances as int64 values."""
+        self.assertEqual([0, 1, 0, 2, 1, 0], self.columns.directions.tolist())
+        self.assertEqual(("int8", "int64"), (self.columns.directions.dtype.name,
+                                             self.columns.distances.dtype.name))
+        lines = iter(["forward 5", "down 5", "forward 8", "up 3", "down 8", "forward 2"])
+        self.assertEqual(self.columns.distances.tolist(),
+                         ColumnarCourse.from_lines(lines=lines).distances.tolist())
+
+    def test_final_locations_match_moves(self):
+        """Columnar courses take both submarines where step by step moves do."""
+        for submarine_class, expected in (Submarine, 150), (AimSubmarine, 900):
+            submarine = submarine_class()
+            submarine.implement_columnar_course(course=self.columns)
+            self.assertEqual(expected, submarine.total_movement)
+
+    def test_intermediate_positions(self):
+        """Positions after each instruction come from cumulative sums."""
+        for aim, submarine_class in (False, Submarine), (True, AimSubmarine):
+            horizontals, depths = self.columns.get_positions(aim=aim)
+            submarine, expected = submarine_class(), []
+            for instruction in self.course:
+                submarine.implement_course(course=[instruction])
+                expected.append((submarine.horizontal, submarine.depth))
+            self.assertEqual(expected, list(zip(horizontals.tolist(), depths.tolist())))
+
+    def test_courses_can_continue(self):
+        """Columnar courses start from the current position and aim of a submarine."""
+        submarine = AimSubmarine()
+        submarine.implement_course(course=self.course[:3])
+        submarine.implement_columnar_course(
+            course=ColumnarCourse.from_course(course=self.course[3:]))
+        self.assertEqual((15, 60, 10), (submarine.horizontal, submarine.depth,
+                                        submarine.aim))
+        with self.assertRaises(ValueError):
+            ColumnarCourse.from_lines(lines=["backward 3"])
+
+
+class IndexExampleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Prepare objects to be tested."""
+        self.course = [("forward", 5), ("down", 5), ("forward", 8), ("up", 3),
+                       ("down", 8), ("forward", 2)]
+        self.index = CourseIndex(course=self.course)
+
+    def test_positions_match_course_prefixes(self):
+        """Positions after any step are those reached by implementing the prefix."""
+        self.assertEqual(6, len(self.index))
+        for t in range(len(self.course) + 1):
+            for aim, submarine_class in (False, Submarine), (True, AimSubmarine):
+                submarine = submarine_class()
+                submarine.implement_course(course=self.course[:t])
+                self.assertEqual((submarine.horizontal, submarine.depth),
+                                 self.index.position_at(t=t, aim=aim))
+                self.assertEqual(submarine.total_movement,
+                                 self.index.total_movement_at(t=t, aim=aim))
+
+    def test_instructions_can_be_appended(self):
+        """Instructions appended one by one or as columns extend the same index."""
+        index = CourseIndex(course=self.course[:2])
+        index.append(*self.course[2])
+        index.extend(course=ColumnarCourse.from_course(course=self.course[3:]))
+        for t in range(len(self.course) + 1):
+            for aim in False, True:
+                self.assertEqual(self.index.position_at(t=t, aim=aim),
+                                 index.position_at(t=t, aim=aim))
+        self.assertEqual((150, 900), (index.total_movement_at(t=6),
+                                      index.total_movement_at(t=6, aim=True)))
+        with self.assertRaises(ValueError):
+            index.append(direction="backward", distance=3)
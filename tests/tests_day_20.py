@@ -54,3 +54,24 @@ class ExampleTests(unittest.TestCase):
         """The number of lit pixels after enhancing 50 times the input image is 3351."""
         enhanced_image = self.algorithm.enhance_times(image=self.image_input, times=50)
         self.assertEqual(3351, enhanced_image.lit_pixels)
+
+
+class NonSquareImageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        keep = "".join("#" if code & 16 else "." for code in range(512))
+        flip = "".join("." if code & 16 else "#" for code in range(512))
+        self.keep_algorithm = Algorithm(string=keep)
+        self.flip_algorithm = Algorithm(string=flip)
+        self.image = Image.from_rows(pixel_rows=["#...#.", ".##..."], outside_value=".")
+
+    def test_keep_centre_pixel(self):
+        """Copying the centre pixel of each grid leaves wide Images unchanged."""
+        enhanced_image = self.keep_algorithm.enhance_times(image=self.image, times=3)
+        self.assertEqual(self.image, enhanced_image)
+
+    def test_flip_centre_pixel_twice(self):
+        """Flipping all pixels (the infinite outside too) twice restores the Image."""
+        enhanced_image = self.flip_algorithm.enhance_times(image=self.image, times=2)
+        self.assertEqual(self.image, enhanced_image)
+        self.assertEqual(4, enhanced_image.lit_pixels)
@@ -0,0 +1,60 @@
+# coding=utf-8
+"""Tests for the differential comparison of two implementations of a day."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+import unittest
+
+# Local application imports:
+from aoc2021.day_15.solution import solve_lines
+from aoc2021.day_15.tools import ChironCave
+from aoc2021.differential import AdventDifferential, collect_examples
+import tests.tests_day_15 as day_15_tests
+
+
+def solve_by_expanding_text(lines: list[str]) -> tuple[int, int]:
+    """Solve Day 15 by expanding the text of the map, instead of its array."""
+    tiles = [["".join(str((int(risk) + shift - 1) % 9 + 1) for risk in line)
+              for line in lines] for shift in range(9)]
+    expanded = ["".join(tiles[i + j][n] for j in range(5))
+                for i in range(5) for n in range(len(lines))]
+    caves = ChironCave(risk_levels=lines), ChironCave(risk_levels=expanded)
+    return tuple(cave.get_minimum_total_risk(include_start=False) for cave in caves)
+
+
+class DifferentialTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.differential = AdventDifferential(runs=1)
+        self.examples = collect_examples(test_case=day_15_tests.ExampleTests)
+
+    def test_examples_come_from_example_tests(self):
+        """The example inputs of a day's example tests are collected as seeds."""
+        self.assertEqual(["13524", "24315", "32133", "51241", "45452"],
+                         self.examples[0])
+
+    def test_equivalent_implementations_agree(self):
+        """Two ways of solving a day give the same answers on every input."""
+        cases = self.differential.assert_same_answers(
+            day=15, reference=solve_lines, candidate=solve_by_expanding_text,
+            sizes=[10, 20], examples=self.examples)
+        self.assertEqual(len(self.examples) + 2, len(cases))
+        self.assertEqual(["size 10", "size 20"], [case["case"] for case in cases[-2:]])
+        self.assertTrue(all(case["speed_up"] > 0 for case in cases))
+
+    def test_different_answers_are_caught(self):
+        """A candidate giving another answer on any input fails the comparison."""
+        with self.assertRaises(AssertionError):
+            self.differential.assert_same_answers(
+                day=15, reference=solve_lines, candidate=lambda lines: (0, 0),
+                sizes=[10], examples=self.examples[:1])
+        with redirect_stdout(io.StringIO()) as output:
+            same = self.differential.run(day=15, reference=solve_lines,
+                                         candidate=lambda lines: (0, 0), sizes=[10])
+        self.assertFalse(same)
+        self.assertIn("DIFFERENT", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# coding=utf-8
+"""Tests for the synthetic puzzle input generators."""
+
+# Standard library imports:
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+# Local application imports:
+from aoc2021.common import get_input_path, iter_puzzle_input, read_puzzle_input, \
+    use_input_file
+from aoc2021.day_10.tools import SyntaxChecker
+from aoc2021.day_13.tools import OrigamiInstructions
+from aoc2021.day_16.tools import Packet
+from aoc2021.generators import GENERATED_DAYS, generate_input, write_input
+
+
+class GenerationTests(unittest.TestCase):
+    def test_same_seed_same_input(self):
+        """Inputs generated with the same day, size and seed are identical."""
+        for day in GENERATED_DAYS:
+            with self.subTest(day=day):
+                self.assertEqual(generate_input(day=day, size=3, seed=7),
+                                 generate_input(day=day, size=3, seed=7))
+
+    def test_different_seeds_different_inputs(self):
+        """Inputs generated with different seeds are different."""
+        for day in GENERATED_DAYS:
+            with self.subTest(day=day):
+                self.assertNotEqual(generate_input(day=day, size=12, seed=1),
+                                    generate_input(day=day, size=12, seed=2))
+
+    def test_unknown_day(self):
+        """Days without an input generator raise a ValueError."""
+        with self.assertRaises(ValueError):
+            generate_input(day=25, size=10)
+
+    def test_empty_size(self):
+        """Inputs of no size raise a ValueError, even when asserts are off."""
+        with self.assertRaises(ValueError):
+            generate_input(day=1, size=0)
+
+    def test_written_file_is_read_back(self):
+        """Written inputs are read back like real puzzle inputs, which are restored."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = write_input(day=4, size=5, file_path=Path(temp_dir) / "in.txt")
+            with use_input_file(day=4, file_path=file_path):
+                lines = list(iter_puzzle_input(day=4))
+        self.assertEqual(generate_input(day=4, size=5), lines)
+        self.assertEqual("puzzle_input.txt", get_input_path(day=4).name)
+
+    def test_input_files_are_read_as_lines(self):
+        """Input files, even empty ones, are read as lines without their line breaks."""
+        cases = ("", []), ("199\n200\n\n208\n", ["199", "200", "", "208"])
+        with TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "in.txt"
+            for text, expected in cases:
+                file_path.write_text(text, encoding="utf-8")
+                with self.subTest(text=text), use_input_file(day=1, file_path=file_path):
+                    self.assertEqual(expected, list(iter_puzzle_input(day=1)))
+                    self.assertEqual(expected, read_puzzle_input(day=1))
+
+
+class ValidityTests(unittest.TestCase):
+    def test_sized_lines(self):
+        """Line-based inputs have as many lines as the requested size."""
+        for day in (1, 2, 3, 7, 8, 10, 12, 18):
+            with self.subTest(day=day):
+                lines = generate_input(day=day, size=40)
+                self.assertEqual(40, len(lines) if day != 7 else len(lines[0].split(",")))
+
+    def test_origami_folds_into_code(self):
+        """Folding the generated sheet shows an 8-letter code."""
+        origami = OrigamiInstructions(recipe=generate_input(day=13, size=6, seed=3))
+        origami.apply_folds()
+        self.assertRegex(origami.sheet_code, r"^[A-Z]{8}$")
+
+    def test_transmission_literals(self):
+        """The generated transmission holds as many literal packets as its size."""
+        def count_literals(packet: Packet) -> int:
+            """Count the literal value packets within a packet tree."""
+            if packet.type_id == 4:
+                return 1
+            return sum(count_literals(packet=sub) for sub in packet.data)
+
+        hex_string = generate_input(day=16, size=30, seed=5)[0]
+        self.assertEqual(30, count_literals(Packet.from_hexadecimal(hex_string)))
+
+    def test_navigation_lines_have_a_median(self):
+        """Some lines are corrupted, and an odd number of lines are incomplete."""
+        checker = SyntaxChecker(lines=generate_input(day=10, size=20))
+        self.assertGreater(checker.corruption_score, 0)
+        self.assertIsInstance(checker.completion_score, int)  # Not a two-value mean.
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""Tests for the database of timings of every solve and bench run."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import sqlite3
+from tempfile import TemporaryDirectory
+import unittest
+
+# Local application imports:
+from aoc2021.common import AdventSolver
+from aoc2021.history import AdventHistory
+
+
+class HistoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        self.history = AdventHistory(file_path=Path(temp_dir.name) / "history.sqlite3",
+                                     threshold=0.25, window=2)
+        timings = [("aaa", 100), ("aaa", 110), ("bbb", 105), ("ccc", 300), ("ccc", 290)]
+        for revision, time_ns in timings:
+            self.history.record(day=7, kind="solve", time_ns=time_ns,
+                                phases_ns=dict(parse=10, part1=time_ns - 10),
+                                memory_bytes=1024, git_revision=revision)
+
+    def test_runs_keep_their_phases(self):
+        """Runs come back oldest first, with their total and phase durations."""
+        runs = self.history.fetch_runs(day=7)
+        self.assertEqual(5, len(runs))
+        self.assertEqual(dict(total=100, parse=10, part1=90), runs[0]["phases_ns"])
+        self.assertEqual(("solve", "aaa", 1024),
+                         (runs[0]["kind"], runs[0]["git_revision"],
+                          runs[0]["memory_bytes"]))
+        self.assertEqual([], self.history.fetch_runs(day=8))
+
+    def test_step_changes_are_found_between_commits(self):
+        """Only a change of the median time beyond the threshold is a step change."""
+        changes = self.history.find_step_changes(runs=self.history.fetch_runs(day=7))
+        self.assertEqual(1, len(changes))
+        self.assertEqual(("ccc", "bbb", 105, 295),
+                         tuple(changes[0][key] for key in
+                               ("revision", "previous", "before_ns", "after_ns")))
+
+    def test_summary_has_trend_and_extremes(self):
+        """The latest runs are compared with those before, next to the extremes."""
+        summary = self.history.summarise(runs=self.history.fetch_runs(day=7))
+        self.assertAlmostEqual(295 / 107.5 - 1, summary["trend"])
+        self.assertEqual(("aaa", "ccc"), (summary["best"]["git_revision"],
+                                          summary["worst"]["git_revision"]))
+        self.assertEqual(dict(parse=10, part1=100), summary["phases_ns"])
+
+    def test_report_names_the_step_commit(self):
+        """The printed report points at the commit where the time jumped."""
+        with redirect_stdout(io.StringIO()) as output:
+            self.history.print_report(day=7)
+        self.assertIn("Step change at ccc", output.getvalue())
+
+    def test_solved_days_are_recorded(self):
+        """Each day solved (not read from a cache) is recorded as a solve run."""
+        solver = AdventSolver(history=self.history)
+        solver.solve_day(day=1)
+        runs = self.history.fetch_runs(day=1)
+        self.assertEqual(["solve"], [run["kind"] for run in runs])
+        self.assertEqual(["total", "parse", "part1", "part2"],
+                         list(runs[0]["phases_ns"]))
+
+    def test_engines_have_separate_histories(self):
+        """Runs of other engines are only reported when asking for their engine."""
+        self.history.record(day=7, kind="bench", time_ns=50, phases_ns={},
+                            engine="numpy")
+        self.assertEqual(5, len(self.history.fetch_runs(day=7)))
+        numpy_history = AdventHistory(file_path=self.history.file_path, engine="numpy")
+        self.assertEqual([50], [run["phases_ns"]["total"]
+                                for run in numpy_history.fetch_runs(day=7)])
+
+    def test_databases_without_engines_are_upgraded(self):
+        """Runs recorded before engines existed count as reference engine runs."""
+        file_path = self.temp_path / "old.sqlite3"
+        with sqlite3.connect(file_path) as connection:
+            connection.execute(
+                "CREATE TABLE runs (id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, "
+                "kind TEXT NOT NULL, day INTEGER NOT NULL, git_revision TEXT, "
+                "memory_bytes INTEGER)")
+            connection.execute("INSERT INTO runs VALUES (1, 'then', 'solve', 3, "
+                               "'aaa', NULL)")
+        connection.close()
+        AdventHistory(file_path=file_path).record(day=3, kind="solve", time_ns=10,
+                                                  phases_ns={})
+        with sqlite3.connect(file_path) as connection:
+            engines = connection.execute("SELECT engine FROM runs ORDER BY id").fetchall()
+        connection.close()
+        self.assertEqual([("reference",), ("reference",)], engines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# coding=utf-8
+"""Tests for the puzzle profiling tools."""
+
+# Standard library imports:
+import cProfile
+import pstats
+import unittest
+
+# Local application imports:
+from aoc2021.profiling import collapse_stacks, parse_import_times
+
+
+def _inner() -> int:
+    return sum(i * i for i in range(100_000))
+
+
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+class CollapsedStacksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        profiler = cProfile.Profile()
+        profiler.runcall(_outer)
+        self.lines = dict(collapse_stacks(stats=pstats.Stats(profiler)))
+
+    def test_nested_stack_is_collapsed(self):
+        """The inner function is reported below the outer one, in a single stack."""
+        stacks = [stack.split(";") for stack in self.lines]
+        nested = [s for s in stacks if len(s) >= 2 and s[0].startswith("_outer")
+                  and s[1].startswith("_inner")]
+        self.assertTrue(nested)
+
+    def test_times_are_positive_microseconds(self):
+        """Every collapsed stack carries a positive integer amount of microseconds."""
+        self.assertTrue(all(isinstance(v, int) and v > 0 for v in self.lines.values()))
+
+
+class ImportTimesTests(unittest.TestCase):
+    def test_parse_import_time_lines(self):
+        """Header and unrelated lines are skipped, and module names are unindented."""
+        lines = ["import time: self [us] | cumulative | imported package",
+                 "import time:       120 |        120 |   encodings.aliases",
+                 "import time:       300 |        420 | encodings",
+                 "Traceback (most recent call last):"]
+        expected = [("encodings.aliases", 120, 120), ("encodings", 300, 420)]
+        self.assertEqual(expected, parse_import_times(lines=lines))
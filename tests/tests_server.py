@@ -0,0 +1,99 @@
+# coding=utf-8
+"""Tests for the warm solving server and its client."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+import unittest
+from unittest import mock
+
+# Local application imports:
+from aoc2021.common import import_solution
+from aoc2021.server import AdventClient, AdventServer
+
+
+class ServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start a server in the background, shared by all tests."""
+        cls.temp_dir = TemporaryDirectory()
+        cls.socket_path = Path(cls.temp_dir.name) / "test.sock"
+        cls.server = AdventServer(socket_path=cls.socket_path, verbose=False)
+        cls.thread = Thread(target=cls.server.serve, daemon=True)
+        cls.thread.start()
+        cls.client = AdventClient(socket_path=cls.socket_path, timeout=60)
+        for _ in range(600):  # Wait until the solutions are imported.
+            if cls.socket_path.exists():
+                break
+            cls.thread.join(timeout=0.1)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Stop the server, and remove its socket folder."""
+        cls.client.request(action="stop")
+        cls.thread.join(timeout=10)
+        cls.temp_dir.cleanup()
+
+    def test_solve_request(self):
+        """A solve request provides the day's answers and the latencies."""
+        response = self.client.request(action="solve", day=1)
+        self.assertTrue(response["ok"])
+        self.assertEqual((1466, 1491), (response["result"]["solution_1"],
+                                        response["result"]["solution_2"]))
+        self.assertLessEqual(response["latency_ns"], response["round_trip_ns"])
+
+    def test_solve_request_with_lines(self):
+        """A solve request may bring its own input lines."""
+        lines = ["199", "200", "208", "210", "200", "207", "240", "269", "260", "263"]
+        response = self.client.request(action="solve", day=1, lines=lines)
+        self.assertEqual((7, 5), (response["result"]["solution_1"],
+                                  response["result"]["solution_2"]))
+
+    def test_invalid_requests_fail(self):
+        """Unknown actions and days are reported as failed requests."""
+        self.assertFalse(self.client.request(action="jump", day=1)["ok"])
+        self.assertFalse(self.client.request(action="solve", day=99)["ok"])
+        self.assertTrue(self.client.request(action="ping")["ok"])
+        unsolved = self.client.request(action="solve", day=21, lines=["1"])
+        self.assertEqual("ValueError('Day 21 is not solved yet!')", unsolved["error"])
+        self.assertIn("ValueError", self.client.request(action="bench")["error"])
+        unsolved = self.client.request(action="bench", day=21, runs=1, warmup=0)
+        self.assertEqual("ValueError('Day 21 is not solved yet!')", unsolved["error"])
+
+    def test_failed_requests_are_printed(self):
+        """The client prints the server's error of unsolved and unknown days."""
+        for action, day in ("bench", 21), ("solve", 30):
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertFalse(self.client.print_request(action=action, day=day))
+            self.assertIn("    Error: ValueError(", output.getvalue())
+        self.assertIn("Request: solve for day 30", output.getvalue())
+
+    def test_lines_are_solved_by_the_chosen_engine(self):
+        """Requests bringing their own lines are solved by the server's engine."""
+        module = import_solution(day=1)
+        engines = dict(reference=module.solve_lines,
+                       counting=lambda lines: (len(lines), 0))
+        server = AdventServer(socket_path=self.socket_path, verbose=False,
+                              engine="counting")
+        with mock.patch.object(module, "ENGINES", engines):
+            record = server._solve(day=1, lines=["199", "200", "208"])
+        self.assertEqual((3, 0), (record["solution_1"], record["solution_2"]))
+
+    def test_benchmarks_time_the_chosen_engine(self):
+        """Bench requests time the server's engine, like its solve requests."""
+        module, calls = import_solution(day=1), []
+        engines = dict(reference=module.solve_lines,
+                       counting=lambda lines: calls.append(lines) or (0, 0))
+        server = AdventServer(socket_path=self.socket_path, verbose=False,
+                              engine="counting")
+        with mock.patch.object(module, "ENGINES", engines):
+            stats = server._dispatch(request=dict(action="bench", day=1, runs=2,
+                                                  warmup=1))
+        self.assertEqual((2, 3), (stats["runs"], len(calls)))
+
+
+if __name__ == "__main__":
+    unittest.main()
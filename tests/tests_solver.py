@@ -0,0 +1,228 @@
+# coding=utf-8
+"""Tests for the puzzle solving manager and its machine-readable output."""
+
+# Standard library imports:
+from contextlib import redirect_stdout
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+# Third party imports:
+import numpy
+
+# Local application imports:
+from aoc2021.cache import ResultCache
+from aoc2021.common import DAILY_NAMES, PHASES, AdventSolver, fingerprint_day, \
+    get_engine, get_engines, import_solution, pop_phase_timings, use_engine
+from aoc2021.generators import generate_input
+
+
+class OutputTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.solver = AdventSolver()
+        self.results = [(7, numpy.int64(5), 1_500, 4_096, dict(parse=500, part1=1_000)),
+                        (None, None, None, None, {})]
+
+    def _dump(self, output_format: str) -> str:
+        """Capture the printed output of dumping the results of days 1 and 2."""
+        with redirect_stdout(io.StringIO()) as output:
+            self.solver.dump_days(days=[1, 2], results=self.results,
+                                  output_format=output_format)
+        return output.getvalue()
+
+    def test_record_has_raw_values(self):
+        """Records keep answers, nanoseconds and bytes as plain numbers."""
+        record = self.solver.build_record(1, *self.results[0])
+        self.assertEqual(
+            dict(day=1, name="Day 1: Sonar Sweep", status="solved", solution_1=7,
+                 solution_2=5, time_ns=1_500, phases_ns=dict(parse=500, part1=1_000),
+                 peak_memory_bytes=4_096), record)
+        self.assertIs(int, type(record["solution_2"]))
+
+    def test_json_document_shares_run_info(self):
+        """A JSON document gives the host and git revision once, next to all days."""
+        document = json.loads(self._dump(output_format="json"))
+        self.assertEqual({"host", "git_revision", "days"}, set(document))
+        self.assertEqual([1, 2], [record["day"] for record in document["days"]])
+        self.assertIsNone(document["days"][1]["time_ns"])
+
+    def test_json_lines_stand_alone(self):
+        """Each JSON line is a full record, with the host and git revision."""
+        lines = self._dump(output_format="jsonl").splitlines()
+        self.assertEqual(2, len(lines))
+        for day, line in enumerate(lines, start=1):
+            record = json.loads(line)
+            self.assertEqual(day, record["day"])
+            self.assertIn("host", record)
+            self.assertIn("git_revision", record)
+
+
+class BudgetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.solver = AdventSolver(time_limit=30, budgets={1: dict(time_limit=1e-3)})
+
+    def test_budgets_file_is_read(self):
+        """Budget files set default and daily limits, with memory given in MiB."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "budgets.json"
+            file_path.write_text(json.dumps(
+                {"memory_limit": 512, "days": {"12": {"time_limit": 5}}}))
+            limits = AdventSolver.read_budgets(file_path=file_path)
+        self.assertEqual(dict(memory_limit=512 * 1024 ** 2,
+                              budgets={12: dict(time_limit=5)}), limits)
+        solver = AdventSolver(**limits)
+        self.assertEqual((5, 512 * 1024 ** 2), solver.get_budget(day=12))
+        self.assertEqual((None, 512 * 1024 ** 2), solver.get_budget(day=11))
+
+    def test_unknown_budget_limits_fail(self):
+        """Budget files with unknown limits are rejected, even when asserts are off."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "budgets.json"
+            file_path.write_text(json.dumps({"days": {"12": {"cpu_limit": 5}}}))
+            with self.assertRaisesRegex(ValueError, "Unknown budget limit!"):
+                AdventSolver.read_budgets(file_path=file_path)
+
+    def test_days_over_budget_are_stopped(self):
+        """A day over its time budget is a timeout, while the next days are solved."""
+        results = self.solver._solve_supervised(days=[1, 2])
+        self.assertEqual((None, None, None, None, {}), next(results))
+        self.assertEqual((1746616, 1741971043), next(results)[:2])
+        self.assertEqual({1: "timeout"}, self.solver.failures)
+        with redirect_stdout(io.StringIO()) as output:
+            self.solver.print_day(day=1)
+        self.assertIn("timeout", output.getvalue())
+
+    def test_days_over_memory_budget_are_stopped(self):
+        """A day whose resident memory peak is over its budget is out of memory."""
+        if AdventSolver.get_peak_rss() is None:
+            self.skipTest("The resident memory peak can't be read here.")
+        solver = AdventSolver(memory_limit=1024 ** 2,
+                              budgets={2: dict(memory_limit=1024 ** 3)})
+        results = solver._solve_supervised(days=[1, 2])
+        self.assertEqual((None, None, None, None, {}), next(results))
+        solution_1, solution_2, _, memory_bytes, _ = next(results)
+        self.assertEqual((1746616, 1741971043), (solution_1, solution_2))
+        self.assertLessEqual(memory_bytes, 1024 ** 3)
+        self.assertEqual({1: "out of memory"}, solver.failures)
+
+
+class ParallelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.solver = AdventSolver(cache=ResultCache(path=Path(temp_dir.name)))
+        for day in range(3, 21):  # Workers only solve days 1, 2 and the unsolved days.
+            self.solver.cache.put(key=fingerprint_day(day=day),
+                                  value=[day, -day, day, None, {}])
+
+    def test_days_are_provided_in_order(self):
+        """Days solved by several workers are provided in day order, unsolved ones too."""
+        results = list(self.solver.solve_all_days(workers=2))
+        expected = [(1466, 1491), (1746616, 1741971043),
+                    *[(day, -day) for day in range(3, 21)], *[(None, None)] * 5]
+        self.assertEqual(expected, [result[:2] for result in results])
+
+
+class MemoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.solver = AdventSolver()
+        if not AdventSolver.reset_peak_rss():
+            self.skipTest("The memory high-water mark can't be reset here.")
+
+    def test_peaks_are_measured_per_day(self):
+        """A day's peak leaves out the memory peaks reached before it was solved."""
+        block = bytearray(64 * 1024 ** 2)
+        block[::4096] = b"1" * len(block[::4096])  # Touch every page of the block.
+        del block
+        peak = AdventSolver.get_peak_rss()
+        memory_bytes = self.solver._solve(day=2)[3]
+        self.assertGreater(memory_bytes, 0)
+        self.assertLess(memory_bytes, peak - 32 * 1024 ** 2)
+
+    def test_unmeasured_peaks_are_not_zero(self):
+        """Peaks that can't be measured are reported as n/a, and not as 0 bytes."""
+        with mock.patch.object(AdventSolver, "reset_peak_rss", return_value=False):
+            results = self.solver._solve(day=2)
+        self.assertIsNone(results[3])
+        with redirect_stdout(io.StringIO()) as output:
+            self.solver._print_solutions(2, *results)
+        self.assertIn("peak memory n/a", output.getvalue())
+
+
+class EngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        module = import_solution(day=1)
+        self.engines = dict(reference=module.solve_lines,
+                            counting=lambda lines: (len(list(lines)), 0))
+        patcher = mock.patch.object(module, "ENGINES", self.engines, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_solutions_without_engines_have_a_reference(self):
+        """A solution not listing engines offers its solve_lines as reference."""
+        module = import_solution(day=3)
+        self.assertEqual(dict(reference=module.solve_lines), get_engines(day=3))
+        self.assertIs(module.solve_lines, get_engine(day=3))
+
+    def test_chosen_engine_is_used(self):
+        """Engines are chosen by name, and only while chosen."""
+        with use_engine(day=1, name="counting"):
+            self.assertIs(self.engines["counting"], get_engine(day=1))
+        self.assertIs(self.engines["reference"], get_engine(day=1))
+        with self.assertRaises(ValueError):
+            with use_engine(day=1, name="missing"):
+                pass
+
+    def test_solver_uses_engine_where_offered(self):
+        """Days not offering the solver's engine are solved with their reference."""
+        solver = AdventSolver(engine="counting")
+        self.assertEqual((2000, 0), solver.solve_day(day=1)[:2])
+        self.assertEqual((1746616, 1741971043), solver.solve_day(day=2)[:2])
+        self.assertNotEqual(fingerprint_day(day=1),
+                            fingerprint_day(day=1, engine="counting"))
+
+    def test_engines_are_benchmarked_side_by_side(self):
+        """Every engine of a day is timed, with its answers and speed-up."""
+        results = AdventSolver.benchmark_engines(day=1, runs=2, warmup=0)
+        self.assertEqual(["reference", "counting"], list(results))
+        self.assertEqual((2000, 0), results["counting"]["answers"])
+        self.assertEqual(1.0, results["reference"]["speed_up"])
+        self.assertEqual(2, results["counting"]["runs"])
+
+    def test_unsolved_days_have_no_engines_to_benchmark(self):
+        """Days not solved yet have no engine to time, and are printed as unsolved."""
+        self.assertEqual({}, AdventSolver.benchmark_engines(day=21, runs=1, warmup=0))
+        with redirect_stdout(io.StringIO()) as output:
+            AdventSolver().print_engines(day=21, runs=1, warmup=0)
+        self.assertIn("remains unsolved", output.getvalue())
+
+
+class PhaseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Define objects to be tested."""
+        self.engines = {day: get_engines(day=day)
+                        for day in range(1, len(DAILY_NAMES) + 1)}
+
+    def test_engines_time_known_phases(self):
+        """Every engine times its work as parse, part1 and part2 phases only."""
+        for day, engines in self.engines.items():
+            if len(engines) < 2:
+                continue
+            lines = generate_input(day=day, size=100)
+            for name, engine in engines.items():
+                pop_phase_timings()
+                engine(lines=list(lines))
+                self.assertLessEqual(set(pop_phase_timings()), set(PHASES),
+                                     msg=f"Day {day}, {name} engine")
+
+
+if __name__ == "__main__":
+    unittest.main()